@@ -11,15 +11,18 @@ Enhanced version with improved structure, type hints, and error handling
 # ======================
 import os
 import sys
-import logging
-from datetime import datetime
-from typing import Dict, List, Optional, TypedDict, Tuple
+from functools import lru_cache
+from time import localtime, strftime
+from types import MappingProxyType
+from typing import Collection, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+from reactions_data import ANIONS, CATIONS
 
 # ======================
 # TYPE DEFINITIONS
 # ======================
-class ReactionData(TypedDict):
-    """Type definition for reaction data structure"""
+class ReactionData(NamedTuple):
+    """Immutable reaction record; fields are read by attribute (data.test)"""
     test: str
     reaction: str
     reason: str
@@ -32,252 +35,174 @@ REACTION_DB_FILENAME = "reactions.db"
 MAX_LOG_FILES = 10
 MENU_WIDTH = 50
 
+# Answer sets for the prompts, shared instead of rebuilt per call
+_YN = ('y', 'n')
+_COLORS_II = ('black', 'brown', 'yellow', 'white')
+_COLORS_III = ('red-brown', 'white', 'green')
+_COLORS_IV = ('white', 'flesh-pink', 'black')
+_FLAME_V = ('green', 'red', 'orange', 'none')
+_FLAME_NA = ('yellow', 'none')
+_FLAME_K = ('violet', 'none')
+# Menu choices
+_CHOICES_1_3 = ('1', '2', '3')
+_CHOICES_1_4 = ('1', '2', '3', '4')
+_CHOICES_1_5 = ('1', '2', '3', '4', '5')
+_CHOICES_1_6 = ('1', '2', '3', '4', '5', '6')
+_CHOICES_0_3 = ('0', '1', '2', '3')
+_CHOICES_0_6 = ('0', '1', '2', '3', '4', '5', '6')
+
 # ======================
 # CHEMICAL REACTION DATA
 # ======================
-CATION_REACTIONS = {
-    # Group I (HCl Group)
-    "Pb²⁺": {
-        "test": "Hot water + K₂CrO₄",
-        "reaction": "Pb²⁺ + CrO₄²⁻ → PbCrO₄↓ (yellow)",
-        "reason": "Forms insoluble lead chromate (Ksp = 2.8×10⁻¹³)",
-        "group": "I"
-    },
-    "Ag⁺": {
-        "test": "NH₄OH dissolution + HNO₃",
-        "reaction": "AgCl + 2NH₃ → [Ag(NH₃)₂]⁺ (soluble complex)",
-        "reason": "Forms diamminesilver(I) complex (Kf = 1.1×10⁷)",
-        "group": "I"
-    },
-    "Hg₂²⁺": {
-        "test": "Black residue with NH₄OH",
-        "reaction": "Hg₂Cl₂ + 2NH₃ → Hg↓ + HgNH₂Cl↓ + NH₄⁺",
-        "reason": "Disproportionation reaction",
-        "group": "I"
-    },
+# Raw rows live in reactions_data.py; they are split into columns here.
+def _build_soa(rows: Tuple[Tuple[str, str, str, str, str], ...]) -> tuple:
+    """Split reaction rows into parallel column tuples plus row indexes
 
-    # Group II (H₂S Acidic Group)
-    "Cu²⁺": {
-        "test": "NH₄OH deep blue solution",
-        "reaction": "Cu²⁺ + 4NH₃ → [Cu(NH₃)₄]²⁺",
-        "reason": "Forms tetraamminecopper(II) complex (λmax ≈ 600 nm)",
-        "group": "II"
-    },
-    "Pb²⁺": {
-        "test": "K₂CrO₄ yellow precipitate",
-        "reaction": "Pb²⁺ + CrO₄²⁻ → PbCrO₄↓",
-        "reason": "Confirmatory test after Group I separation",
-        "group": "II"
-    },
-    "Bi³⁺": {
-        "test": "SnCl₂ reduction",
-        "reaction": "2Bi³⁺ + 3Sn²⁺ → 2Bi↓ + 3Sn⁴⁺",
-        "reason": "Redox reaction (E° = 0.32V for Bi³⁺/Bi)",
-        "group": "II"
-    },
-    "As³⁺/⁵⁺": {
-        "test": "(NH₄)₂Sx dissolution",
-        "reaction": "As₂S₃ + 3S²⁻ → 2AsS₃³⁻",
-        "reason": "Forms soluble thioarsenite complex",
-        "group": "II"
-    },
+    An ion may legitimately appear in more than one group (Pb²⁺ is tested in
+    both Group I and Group II), so rows are also indexed by (ion, group). The
+    plain ion index points at the ion's first (primary) row; the rows index
+    lists every row for the ion.
+    """
+    ions, tests, reactions, reasons, groups = zip(*rows)
+    # Ion symbols are non-ASCII and never auto-interned; interning them (and
+    # the group tags) lets equality checks short-circuit on identity.
+    ions = tuple(sys.intern(ion) for ion in ions)
+    groups = tuple(sys.intern(group) for group in groups)
+    index: Dict[str, int] = {}
+    group_index: Dict[Tuple[str, str], int] = {}
+    rows_by_ion: Dict[str, List[int]] = {}
+    for i, key in enumerate(zip(ions, groups)):
+        index.setdefault(key[0], i)
+        group_index[key] = i
+        rows_by_ion.setdefault(key[0], []).append(i)
+    rows_index = {ion: tuple(rows) for ion, rows in rows_by_ion.items()}
+    return ions, tests, reactions, reasons, groups, index, group_index, rows_index
 
-    # Group III (NH₄OH/NH₄Cl Group)
-    "Fe³⁺": {
-        "test": "K₄[Fe(CN)₆]",
-        "reaction": "4Fe³⁺ + 3[Fe(CN)₆]⁴⁻ → Fe₄[Fe(CN)₆]₃↓ (Prussian blue)",
-        "reason": "Mixed-valence iron cyanide complex",
-        "group": "III"
-    },
-    "Al³⁺": {
-        "test": "Aluminon reagent",
-        "reaction": "Al³⁺ + aluminon → red lake complex",
-        "reason": "Chelation with aurintricarboxylic acid",
-        "group": "III"
-    },
-    "Cr³⁺": {
-        "test": "NaOH/H₂O₂ + Pb(OAc)₂",
-        "reaction": "Cr³⁺ → CrO₄²⁻ → PbCrO₄↓ (yellow)",
-        "reason": "Oxidation to chromate followed by precipitation",
-        "group": "III"
-    },
+def _view(columns: tuple, i: int) -> ReactionData:
+    """Assemble a single record from row ``i`` of a column set"""
+    _, tests, reactions, reasons, groups, *_ = columns
+    return ReactionData(test=tests[i], reaction=reactions[i], reason=reasons[i], group=groups[i])
 
-    # Group IV (H₂S Basic Group)
-    "Zn²⁺": {
-        "test": "NaOH solubility",
-        "reaction": "Zn²⁺ + 2OH⁻ → Zn(OH)₂↓ → [Zn(OH)₄]²⁻",
-        "reason": "Amphoteric behavior",
-        "group": "IV"
-    },
-    "Mn²⁺": {
-        "test": "NaBiO₃ oxidation",
-        "reaction": "2Mn²⁺ + 5NaBiO₃ + 14H⁺ → 2MnO₄⁻ + 5Bi³⁺ + 5Na⁺ + 7H₂O",
-        "reason": "Oxidation to purple permanganate",
-        "group": "IV"
-    },
-    "Ni²⁺": {
-        "test": "Dimethylglyoxime",
-        "reaction": "Ni²⁺ + 2dmgH → [Ni(dmg)₂]↓ (red)",
-        "reason": "Square planar chelate complex",
-        "group": "IV"
-    },
-    "Co²⁺": {
-        "test": "NH₄SCN complex",
-        "reaction": "Co²⁺ + 4SCN⁻ → [Co(SCN)₄]²⁻ (blue)",
-        "reason": "Tetrahedral thiocyanate complex",
-        "group": "IV"
-    },
+_CATION_COLUMNS = _build_soa(CATIONS)
+_ANION_COLUMNS = _build_soa(ANIONS)
 
-    # Group V ((NH₄)₂CO₃ Group)
-    "Ba²⁺": {
-        "test": "Flame test (green)",
-        "reaction": "Ba²⁺ → Ba* (excited state)",
-        "reason": "Emission at 524 nm (green)",
-        "group": "V"
-    },
-    "Sr²⁺": {
-        "test": "Flame test (crimson)",
-        "reaction": "Sr²⁺ → Sr* (excited state)",
-        "reason": "Emission at 650-680 nm (red)",
-        "group": "V"
-    },
-    "Ca²⁺": {
-        "test": "Flame test (brick-red)",
-        "reaction": "Ca²⁺ → Ca* (excited state)",
-        "reason": "Emission at 622 nm (orange-red)",
-        "group": "V"
-    },
+(CATION_IONS, CATION_TESTS, CATION_EQUATIONS, CATION_REASONS,
+ CATION_GROUPS, CATION_IDX, CATION_GROUP_IDX, CATION_ROWS_BY_ION) = _CATION_COLUMNS
+(ANION_IONS, ANION_TESTS, ANION_EQUATIONS, ANION_REASONS,
+ ANION_GROUPS, ANION_IDX, ANION_GROUP_IDX, ANION_ROWS_BY_ION) = _ANION_COLUMNS
 
-    # Group VI (Soluble Group)
-    "NH₄⁺": {
-        "test": "NaOH + heat",
-        "reaction": "NH₄⁺ + OH⁻ → NH₃↑ + H₂O",
-        "reason": "Ammonia gas detection",
-        "group": "VI"
-    },
-    "Mg²⁺": {
-        "test": "Magneson reagent",
-        "reaction": "Mg²⁺ + magneson → blue lake complex",
-        "reason": "Adsorption indicator reaction",
-        "group": "VI"
-    },
-    "Na⁺": {
-        "test": "Flame test (yellow)",
-        "reaction": "Na⁺ → Na* (excited state)",
-        "reason": "Emission at 589 nm (D-line)",
-        "group": "VI"
-    },
-    "K⁺": {
-        "test": "Flame test (violet)",
-        "reaction": "K⁺ → K* (excited state)",
-        "reason": "Emission at 766/770 nm",
-        "group": "VI"
-    }
-}
+def _rows_by_group(groups: Tuple[str, ...]) -> Dict[str, Tuple[int, ...]]:
+    """Build a group -> row indices lookup from the group column alone
 
-ANION_REACTIONS = {
-    # Group I (Dilute H₂SO₄ Group)
-    "CO₃²⁻": {
-        "test": "Effervescence + lime water",
-        "reaction": "CO₃²⁻ + 2H⁺ → CO₂↑ + H₂O\nCO₂ + Ca(OH)₂ → CaCO₃↓ (milky)",
-        "reason": "Carbonates release CO₂ gas that forms insoluble calcium carbonate (Ksp = 4.5×10⁻⁹)",
-        "group": "I"
-    },
-    "S²⁻": {
-        "test": "Lead acetate paper",
-        "reaction": "S²⁻ + Pb²⁺ → PbS↓ (black, Ksp = 9.0×10⁻²⁹)",
-        "reason": "Extremely low solubility allows detection at ppm levels",
-        "group": "I"
-    },
-    "NO₂⁻": {
-        "test": "Brown fumes with acid",
-        "reaction": "2NO₂⁻ + 2H⁺ → NO₂↑ (brown) + NO↑ + H₂O",
-        "reason": "Nitrous acid decomposition produces characteristic brown gas",
-        "group": "I"
-    },
-    "CH₃COO⁻": {
-        "test": "Vinegar smell",
-        "reaction": "CH₃COO⁻ + H⁺ → CH₃COOH↑ (pKa = 4.76)",
-        "reason": "Volatile acetic acid detected by odor",
-        "group": "I"
-    },
+    Only the small group column is scanned; the text columns (test, reaction,
+    reason) are read later by index, and only for the rows being displayed.
+    """
+    by_group: Dict[str, List[int]] = {}
+    for i, group in enumerate(groups):
+        by_group.setdefault(group, []).append(i)
+    return {group: tuple(rows) for group, rows in by_group.items()}
 
-    # Group II (Conc. H₂SO₄ Group)
-    "Cl⁻": {
-        "test": "AgNO₃ precipitation",
-        "reaction": "Ag⁺ + Cl⁻ → AgCl↓ (white, Ksp = 1.8×10⁻¹⁰)\nAgCl + 2NH₃ → [Ag(NH₃)₂]⁺ (soluble)",
-        "reason": "Distinctive solubility behavior in ammonia",
-        "group": "II"
-    },
-    "Br⁻": {
-        "test": "AgNO₃ precipitation",
-        "reaction": "Ag⁺ + Br⁻ → AgBr↓ (pale yellow, Ksp = 5.0×10⁻¹³)",
-        "reason": "Intermediate solubility product distinguishes from other halides",
-        "group": "II"
-    },
-    "I⁻": {
-        "test": "AgNO₃ precipitation",
-        "reaction": "Ag⁺ + I⁻ → AgI↓ (yellow, Ksp = 8.5×10⁻¹⁷)",
-        "reason": "Most insoluble silver halide",
-        "group": "II"
-    },
-    "NO₃⁻": {
-        "test": "Brown ring test",
-        "reaction": "NO₃⁻ + 3Fe²⁺ + 4H⁺ → NO↑ + 3Fe³⁺ + 2H₂O\nFe²⁺ + NO → [Fe(NO)]²⁺ (brown ring)",
-        "reason": "Nitric oxide complexation with Fe²⁺ (E° = +0.96V)",
-        "group": "II"
-    },
+CATION_ROWS_BY_GROUP = _rows_by_group(CATION_GROUPS)
+ANION_ROWS_BY_GROUP = _rows_by_group(ANION_GROUPS)
 
-    # Group III (Special Tests)
-    "SO₄²⁻": {
-        "test": "BaCl₂ in acid",
-        "reaction": "Ba²⁺ + SO₄²⁻ → BaSO₄↓ (white, Ksp = 1.1×10⁻¹⁰)",
-        "reason": "Kinetically inert precipitate resistant to acid dissolution",
-        "group": "III"
-    },
-    "PO₄³⁻": {
-        "test": "Ammonium molybdate",
-        "reaction": "PO₄³⁻ + 12MoO₄²⁻ + 3NH₄⁺ + 24H⁺ → (NH₄)₃PO₄·12MoO₃↓ (yellow)",
-        "reason": "Heteropoly acid formation under acidic conditions",
-        "group": "III"
-    },
-    "BO₃³⁻": {
-        "test": "Flame test",
-        "reaction": "BO₃³⁻ + H₂SO₄ + CH₃CH₂OH → B(OCH₂CH₃)₃ (green flame)",
-        "reason": "Volatile boron ester produces characteristic green color",
-        "group": "III"
-    }
-}
+# Record-at-a-time views for callers that need every field of one ion.
+# Read-only proxies so the shared tables cannot be mutated by callers.
+CATION_REACTIONS: Mapping[str, ReactionData] = MappingProxyType({
+    ion: _view(_CATION_COLUMNS, i) for ion, i in CATION_IDX.items()
+})
+ANION_REACTIONS: Mapping[str, ReactionData] = MappingProxyType({
+    ion: _view(_ANION_COLUMNS, i) for ion, i in ANION_IDX.items()
+})
+CATION_REACTIONS_BY_GROUP: Mapping[Tuple[str, str], ReactionData] = MappingProxyType({
+    key: _view(_CATION_COLUMNS, i) for key, i in CATION_GROUP_IDX.items()
+})
+ANION_REACTIONS_BY_GROUP: Mapping[Tuple[str, str], ReactionData] = MappingProxyType({
+    key: _view(_ANION_COLUMNS, i) for key, i in ANION_GROUP_IDX.items()
+})
+
+@lru_cache(maxsize=256)
+def find_reaction(ion: str, ion_type: str = 'cation') -> Optional[ReactionData]:
+    """Look up the primary reaction record for an ion, or None if unknown"""
+    columns = _CATION_COLUMNS if ion_type == 'cation' else _ANION_COLUMNS
+    *_, index, _ = columns
+    i = index.get(ion)
+    return None if i is None else _view(columns, i)
 
 # ======================
 # UTILITY FUNCTIONS
 # ======================
+_LOG_CONFIGURED = False
+
 def setup_logging() -> None:
-    """Configure logging system"""
-    logging.basicConfig(
-        filename='qualitative_analysis.log',
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s'
-    )
+    """Configure logging system (the log file is opened on first record)"""
+    global _LOG_CONFIGURED
+    if _LOG_CONFIGURED:
+        return
+    import logging
+    handler = logging.FileHandler('qualitative_analysis.log', encoding='utf-8', delay=True)
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    root = logging.getLogger()
+    root.addHandler(handler)
+    root.setLevel(logging.INFO)
+    _LOG_CONFIGURED = True
+
+_CLEAR_SEQ = "\x1b[2J\x1b[H"
+
+def _ansi_clear() -> None:
+    """Clear the screen with an ANSI escape sequence"""
+    sys.stdout.write(_CLEAR_SEQ)
+    sys.stdout.flush()
+
+def _win_clear() -> None:
+    """Clear the screen on consoles without ANSI support"""
+    os.system('cls')
+
+def _enable_windows_vt() -> bool:
+    """Enable ANSI escape handling on Windows 10+ consoles"""
+    if sys.getwindowsversion().major < 10:
+        return False
+    os.system('')  # Switches the console into VT processing mode
+    return True
+
+# Chosen once at import so clear_screen never spawns a shell on ANSI terminals
+_clear = _ansi_clear if os.name != 'nt' or _enable_windows_vt() else _win_clear
 
 def clear_screen() -> None:
     """Clear the terminal screen"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    _clear()
+
+@lru_cache(maxsize=64)
+def _banner(title: str) -> str:
+    """Build the three-line header banner for a title, newline-terminated"""
+    bar = "=" * MENU_WIDTH
+    return f"\n{bar}\n{title.center(MENU_WIDTH)}\n{bar}\n"
 
 def display_header(title: str) -> None:
     """Display consistent menu headers"""
-    print("\n" + "=" * MENU_WIDTH)
-    print(title.center(MENU_WIDTH))
-    print("=" * MENU_WIDTH)
+    sys.stdout.write(_banner(title))
 
-def get_user_input(prompt: str, valid_options: Optional[List[str]] = None) -> str:
+def _prompt_until_valid(prompt: str, options: Collection[str], error_message: str) -> str:
+    """Prompt repeatedly until the answer is one of ``options`` (any answer if empty)"""
+    while True:
+        response = input(prompt).strip().lower()
+        if not options or response in options:
+            return response
+        print(error_message)
+
+def get_user_input(prompt: str, valid_options: Optional[Collection[str]] = None) -> str:
     """Get validated user input with case-insensitive matching"""
+    if isinstance(valid_options, (set, frozenset)):
+        options = valid_options
+        options_display = tuple(sorted(valid_options))
+    else:
+        options = frozenset(valid_options or ())
+        options_display = tuple(valid_options or ())
+    error_message = f"Please enter one of: {', '.join(options_display)}" if options else ""
+    # Ctrl-C / Ctrl-D are handled here rather than in a signal handler:
+    # confirm_exit prompts, and input() cannot be re-entered from a handler.
     while True:
         try:
-            response = input(prompt).lower().strip()
-            if not valid_options or response in valid_options:
-                return response
-            print(f"Please enter one of: {', '.join(valid_options)}")
+            return _prompt_until_valid(prompt, options, error_message)
         except (EOFError, KeyboardInterrupt):
             if confirm_exit():
                 sys.exit(0)
@@ -288,45 +213,80 @@ def get_user_input(prompt: str, valid_options: Optional[List[str]] = None) -> st
 class ChemicalAnalyzer:
     """Base class for chemical analysis functionality"""
     
-    def __init__(self, reactions: Dict[str, ReactionData], ion_type: str):
+    def __init__(self, reactions: Mapping[str, ReactionData],
+                 reactions_by_group: Mapping[Tuple[str, str], ReactionData], ion_type: str):
         self.reactions = reactions
+        self.reactions_by_group = reactions_by_group
         self.ion_type = ion_type
-        self.detected_ions: List[str] = []
+        self._ion_label_upper = ion_type.upper()
+        # Insertion-ordered set of detected ions plus a memoized sorted view
+        self._detected: Dict[str, None] = {}
+        self._sorted_cache: Optional[Tuple[str, ...]] = None
+    
+    @property
+    def detected_ions(self) -> List[str]:
+        """Detected ions in detection order, without duplicates"""
+        return list(self._detected)
+    
+    @property
+    def unique_ions(self) -> Tuple[str, ...]:
+        """Detected ions sorted for display; recomputed only after new detections"""
+        if self._sorted_cache is None:
+            self._sorted_cache = tuple(sorted(self._detected))
+        return self._sorted_cache
+    
+    def _record_detected(self, detected: List[str]) -> None:
+        """Add newly confirmed ions, invalidating the sorted view if anything changed"""
+        for ion in detected:
+            if ion not in self._detected:
+                self._detected[ion] = None
+                self._sorted_cache = None
     
-    def print_reaction_details(self, ion: str) -> None:
-        """Print detailed information about a specific ion"""
-        if ion in self.reactions:
-            data = self.reactions[ion]
+    def print_reaction_details(self, ion: str, group: Optional[str] = None) -> None:
+        """Print detailed information about a specific ion (optionally for one group)"""
+        data = self.reactions_by_group.get((ion, group)) if group else self.reactions.get(ion)
+        if data is not None:
             print(f"\nReaction Details for {ion}:")
-            print(f"Test Method: {data['test']}")
-            print(f"Chemical Equation:\n{data['reaction']}")
-            print(f"Scientific Principle: {data['reason']}")
-            print(f"Group: {data['group']}")
+            print(f"Test Method: {data.test}")
+            print(f"Chemical Equation:\n{data.reaction}")
+            print(f"Scientific Principle: {data.reason}")
+            print(f"Group: {data.group}")
         else:
             print(f"\nNo data available for {ion}")
 
     def save_results(self) -> bool:
         """Save analysis results to file"""
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        return self._write_results_file(self.unique_ions)
+
+    def _write_results_file(self, unique_ions: Tuple[str, ...]) -> bool:
+        """Write the report for an already sorted, deduplicated ion tuple"""
+        timestamp = strftime("%Y-%m-%d_%H-%M-%S", localtime())
         filename = f"{self.ion_type}_analysis_{timestamp}.txt"
         
+        # Build the whole report first so it is encoded and written in one call
+        parts = [
+            f"Qualitative Analysis Results - {self._ion_label_upper}\n",
+            "=" * MENU_WIDTH + "\n",
+        ]
+        if not unique_ions:
+            parts.append("No ions detected.\n")
+        else:
+            parts.append(f"Detected {self.ion_type}s: {', '.join(unique_ions)}\n\n")
+            reactions = self.reactions
+            for ion in unique_ions:
+                data = reactions.get(ion)
+                if data is None:
+                    continue
+                parts.append(
+                    f"{ion}:\n"
+                    f"Test Method: {data.test}\n"
+                    f"Reaction: {data.reaction}\n"
+                    f"Principle: {data.reason}\n\n"
+                )
+        
         try:
             with open(filename, 'w', encoding='utf-8') as f:
-                f.write(f"Qualitative Analysis Results - {self.ion_type.upper()}\n")
-                f.write("=" * MENU_WIDTH + "\n")
-                
-                if not self.detected_ions:
-                    f.write("No ions detected.\n")
-                else:
-                    unique_ions = sorted(set(self.detected_ions))
-                    f.write(f"Detected {self.ion_type}s: {', '.join(unique_ions)}\n\n")
-                    
-                    for ion in unique_ions:
-                        if ion in self.reactions:
-                            f.write(f"{ion}:\n")
-                            f.write(f"Test Method: {self.reactions[ion]['test']}\n")
-                            f.write(f"Reaction: {self.reactions[ion]['reaction']}\n")
-                            f.write(f"Principle: {self.reactions[ion]['reason']}\n\n")
+                f.write("".join(parts))
             
             print(f"\nResults saved to {filename}")
             return True
@@ -337,15 +297,25 @@ class ChemicalAnalyzer:
 
     def show_detailed_results(self) -> None:
         """Display detailed results of analysis"""
-        if not self.detected_ions:
+        self._render_results(self.unique_ions)
+
+    def _render_results(self, unique_ions: Tuple[str, ...]) -> None:
+        """Show the results menu for an already sorted, deduplicated ion tuple"""
+        if not unique_ions:
             print(f"\nNo {self.ion_type}s detected.")
             return
         
-        unique_ions = sorted(set(self.detected_ions))
         print(f"\n📋 Detected {self.ion_type}s:")
         for ion in unique_ions:
             print(f"- {ion}")
         
+        actions = {
+            '1': self._show_all,
+            '2': self._show_one,
+            '3': self._show_summary,
+            '4': self._save_with_status,
+            '5': None,
+        }
         while True:
             print("\nResults Options:")
             print("1. 📝 View all reaction details")
@@ -354,40 +324,61 @@ class ChemicalAnalyzer:
             print("4. 💾 Save results to file")
             print("5. 🏠 Return to previous menu")
             
-            choice = get_user_input("Select option (1-5): ", ['1', '2', '3', '4', '5'])
-            
-            if choice == '1':
-                print(f"\n=== DETAILED {self.ion_type.upper()} RESULTS ===")
-                for ion in unique_ions:
-                    self.print_reaction_details(ion)
-            
-            elif choice == '2':
-                ion = get_user_input(
-                    f"Enter {self.ion_type} to view (e.g., {unique_ions[0]}): ",
-                    unique_ions + ['back']
-                )
-                if ion != 'back':
-                    self.print_reaction_details(ion)
-            
-            elif choice == '3':
-                display_header(f"ANALYSIS SUMMARY: {len(unique_ions)} {self.ion_type.upper()}S DETECTED")
-                for ion in unique_ions:
-                    print(f"\n🔬 {ion}: {self.reactions[ion]['test']}")
-            
-            elif choice == '4':
-                if self.save_results():
-                    print("✅ Results saved successfully")
-                else:
-                    print("❌ Failed to save results")
-            
-            elif choice == '5':
+            action = actions[get_user_input("Select option (1-5): ", _CHOICES_1_5)]
+            if action is None:
                 break
+            action(unique_ions)
+    
+    def _show_all(self, unique_ions: Tuple[str, ...]) -> None:
+        """Print reaction details for every detected ion"""
+        print(f"\n=== DETAILED {self._ion_label_upper} RESULTS ===")
+        for ion in unique_ions:
+            self.print_reaction_details(ion)
+    
+    def _show_one(self, unique_ions: Tuple[str, ...]) -> None:
+        """Prompt for one detected ion and print its reaction details"""
+        ion = get_user_input(
+            f"Enter {self.ion_type} to view (e.g., {unique_ions[0]}): ",
+            (*unique_ions, 'back')
+        )
+        if ion != 'back':
+            self.print_reaction_details(ion)
+    
+    def _show_summary(self, unique_ions: Tuple[str, ...]) -> None:
+        """Print a one-line test summary per detected ion"""
+        display_header(f"ANALYSIS SUMMARY: {len(unique_ions)} {self._ion_label_upper}S DETECTED")
+        reactions = self.reactions
+        for ion in unique_ions:
+            data = reactions.get(ion)
+            if data is not None:
+                print(f"\n🔬 {ion}: {data.test}")
+    
+    def _save_with_status(self, unique_ions: Tuple[str, ...]) -> None:
+        """Save results and report whether it succeeded"""
+        if self._write_results_file(unique_ions):
+            print("✅ Results saved successfully")
+        else:
+            print("❌ Failed to save results")
 
 class CationAnalyzer(ChemicalAnalyzer):
     """Handles cation analysis procedures"""
     
     def __init__(self):
-        super().__init__(CATION_REACTIONS, 'cation')
+        super().__init__(CATION_REACTIONS, CATION_REACTIONS_BY_GROUP, 'cation')
+    
+    def _confirm_ag_hg(self, detected: List[str]) -> None:
+        """Confirm Ag⁺ or Hg₂²⁺ in an NH₄OH-treated Group I precipitate"""
+        if get_user_input("Does the precipitate dissolve completely? (y/n): ", _YN) == 'y':
+            print("a. Acidify the solution with HNO₃")
+            if get_user_input("Does a white precipitate reform? (y/n): ", _YN) == 'y':
+                detected.append("Ag⁺")
+                print("-> Ag⁺ confirmed: Soluble in NH₄OH, reprecipitates with HNO₃")
+                self.print_reaction_details("Ag⁺")
+        else:
+            if get_user_input("Does the precipitate turn black/gray? (y/n): ", _YN) == 'y':
+                detected.append("Hg₂²⁺")
+                print("-> Hg₂²⁺ confirmed: Black/gray residue with NH₄OH")
+                self.print_reaction_details("Hg₂²⁺")
     
     def test_group_i(self) -> List[str]:
         """Test for Group I cations (Pb²⁺, Ag⁺, Hg₂²⁺)"""
@@ -395,7 +386,7 @@ class CationAnalyzer(ChemicalAnalyzer):
         display_header("GROUP I: Dilute HCl Test")
         print("Add dilute HCl to the solution and observe.")
         
-        if get_user_input("Did a white precipitate form? (y/n): ", ['y', 'n']) == 'y':
+        if get_user_input("Did a white precipitate form? (y/n): ", _YN) == 'y':
             print("\nPerforming confirmatory tests on the precipitate...")
             
             # Test for Lead
@@ -403,47 +394,27 @@ class CationAnalyzer(ChemicalAnalyzer):
             print("a. Decant the solution and wash the precipitate with hot water")
             print("b. Add a few drops of K₂CrO₄ solution to the hot water extract")
             
-            if get_user_input("Does a yellow precipitate form? (y/n): ", ['y', 'n']) == 'y':
+            if get_user_input("Does a yellow precipitate form? (y/n): ", _YN) == 'y':
                 detected.append("Pb²⁺")
                 print("-> Pb²⁺ confirmed: Yellow PbCrO₄ precipitate")
-                self.print_reaction_details("Pb²⁺")
+                self.print_reaction_details("Pb²⁺", "I")
                 
                 # Test remaining precipitate for Ag⁺ and Hg₂²⁺
                 print("\n2. Testing remaining precipitate for Ag⁺ and Hg₂²⁺:")
                 print("Add NH₄OH to the remaining precipitate")
                 
-                if get_user_input("Does the precipitate dissolve completely? (y/n): ", ['y', 'n']) == 'y':
-                    print("a. Acidify the solution with HNO₃")
-                    if get_user_input("Does a white precipitate reform? (y/n): ", ['y', 'n']) == 'y':
-                        detected.append("Ag⁺")
-                        print("-> Ag⁺ confirmed: Soluble in NH₄OH, reprecipitates with HNO₃")
-                        self.print_reaction_details("Ag⁺")
-                else:
-                    if get_user_input("Does the precipitate turn black/gray? (y/n): ", ['y', 'n']) == 'y':
-                        detected.append("Hg₂²⁺")
-                        print("-> Hg₂²⁺ confirmed: Black/gray residue with NH₄OH")
-                        self.print_reaction_details("Hg₂²⁺")
+                self._confirm_ag_hg(detected)
             
             else:  # No lead present
                 print("\nTesting precipitate directly for Ag⁺ and Hg₂²⁺:")
                 print("Add NH₄OH to the precipitate")
                 
-                if get_user_input("Does the precipitate dissolve completely? (y/n): ", ['y', 'n']) == 'y':
-                    print("a. Acidify the solution with HNO₃")
-                    if get_user_input("Does a white precipitate reform? (y/n): ", ['y', 'n']) == 'y':
-                        detected.append("Ag⁺")
-                        print("-> Ag⁺ confirmed: Soluble in NH₄OH, reprecipitates with HNO₃")
-                        self.print_reaction_details("Ag⁺")
-                else:
-                    if get_user_input("Does the precipitate turn black/gray? (y/n): ", ['y', 'n']) == 'y':
-                        detected.append("Hg₂²⁺")
-                        print("-> Hg₂²⁺ confirmed: Black/gray residue with NH₄OH")
-                        self.print_reaction_details("Hg₂²⁺")
+                self._confirm_ag_hg(detected)
         
         else:
             print("No Group I cations detected.")
         
-        self.detected_ions.extend(detected)
+        self._record_detected(detected)
         return detected
 
     def test_group_ii(self) -> List[str]:
@@ -452,9 +423,9 @@ class CationAnalyzer(ChemicalAnalyzer):
         display_header("GROUP II: H₂S in Acidic Medium (0.3M HCl)")
         print("Pass H₂S gas through the acidic solution and observe.")
         
-        if get_user_input("Did a precipitate form? (y/n): ", ['y', 'n']) == 'y':
+        if get_user_input("Did a precipitate form? (y/n): ", _YN) == 'y':
             print("\nObserve precipitate color:")
-            color = get_user_input("Color? (black/brown/yellow/white): ", ['black', 'brown', 'yellow', 'white'])
+            color = get_user_input("Color? (black/brown/yellow/white): ", _COLORS_II)
             
             print("\nPerforming confirmatory tests...")
             
@@ -462,9 +433,9 @@ class CationAnalyzer(ChemicalAnalyzer):
             if color == 'yellow':
                 print("\n1. Testing for As³⁺/⁵⁺:")
                 print("a. Treat precipitate with (NH₄)₂Sx solution")
-                if get_user_input("Does the precipitate dissolve? (y/n): ", ['y', 'n']) == 'y':
+                if get_user_input("Does the precipitate dissolve? (y/n): ", _YN) == 'y':
                     print("b. Acidify with dilute HCl")
-                    if get_user_input("Does a yellow precipitate reform? (y/n): ", ['y', 'n']) == 'y':
+                    if get_user_input("Does a yellow precipitate reform? (y/n): ", _YN) == 'y':
                         detected.append("As³⁺/⁵⁺")
                         print("-> As³⁺/⁵⁺ confirmed: Yellow As₂S₃")
                         self.print_reaction_details("As³⁺/⁵⁺")
@@ -474,7 +445,7 @@ class CationAnalyzer(ChemicalAnalyzer):
                 print("\n2. Testing for Cu²⁺:")
                 print("a. Dissolve some precipitate in HNO₃")
                 print("b. Add excess NH₄OH to the solution")
-                if get_user_input("Does the solution turn deep blue? (y/n): ", ['y', 'n']) == 'y':
+                if get_user_input("Does the solution turn deep blue? (y/n): ", _YN) == 'y':
                     detected.append("Cu²⁺")
                     print("-> Cu²⁺ confirmed: [Cu(NH₃)₄]²⁺ complex")
                     self.print_reaction_details("Cu²⁺")
@@ -484,25 +455,25 @@ class CationAnalyzer(ChemicalAnalyzer):
                 print("\n3. Testing for Bi³⁺:")
                 print("a. Dissolve some precipitate in HNO₃")
                 print("b. Add SnCl₂ solution dropwise")
-                if get_user_input("Does a black precipitate form? (y/n): ", ['y', 'n']) == 'y':
+                if get_user_input("Does a black precipitate form? (y/n): ", _YN) == 'y':
                     detected.append("Bi³⁺")
                     print("-> Bi³⁺ confirmed: Black Bi metal")
                     self.print_reaction_details("Bi³⁺")
             
             # Test for Lead (if white precipitate and not already detected in Group I)
-            if color == 'white' and "Pb²⁺" not in self.detected_ions:
+            if color == 'white' and "Pb²⁺" not in self._detected:
                 print("\n4. Testing for Pb²⁺:")
                 print("a. Dissolve precipitate in hot dilute HNO₃")
                 print("b. Add K₂CrO₄ solution")
-                if get_user_input("Does a yellow precipitate form? (y/n): ", ['y', 'n']) == 'y':
+                if get_user_input("Does a yellow precipitate form? (y/n): ", _YN) == 'y':
                     detected.append("Pb²⁺")
                     print("-> Pb²⁺ confirmed: Yellow PbCrO₄")
-                    self.print_reaction_details("Pb²⁺")
+                    self.print_reaction_details("Pb²⁺", "II")
         
         else:
             print("No Group II cations detected.")
         
-        self.detected_ions.extend(detected)
+        self._record_detected(detected)
         return detected
 
     def test_group_iii(self) -> List[str]:
@@ -511,9 +482,9 @@ class CationAnalyzer(ChemicalAnalyzer):
         display_header("GROUP III: NH₄OH/NH₄Cl")
         print("Add NH₄Cl and then NH₄OH to the solution and observe.")
         
-        if get_user_input("Did a precipitate form? (y/n): ", ['y', 'n']) == 'y':
+        if get_user_input("Did a precipitate form? (y/n): ", _YN) == 'y':
             print("\nObserve precipitate color:")
-            color = get_user_input("Color? (red-brown/white/green): ", ['red-brown', 'white', 'green'])
+            color = get_user_input("Color? (red-brown/white/green): ", _COLORS_III)
             
             print("\nPerforming confirmatory tests...")
             
@@ -522,7 +493,7 @@ class CationAnalyzer(ChemicalAnalyzer):
                 print("\n1. Testing for Fe³⁺:")
                 print("a. Dissolve some precipitate in dilute HCl")
                 print("b. Add K₄[Fe(CN)₆] solution")
-                if get_user_input("Does a dark blue precipitate form? (y/n): ", ['y', 'n']) == 'y':
+                if get_user_input("Does a dark blue precipitate form? (y/n): ", _YN) == 'y':
                     detected.append("Fe³⁺")
                     print("-> Fe³⁺ confirmed: Prussian blue")
                     self.print_reaction_details("Fe³⁺")
@@ -532,7 +503,7 @@ class CationAnalyzer(ChemicalAnalyzer):
                 print("\n2. Testing for Al³⁺:")
                 print("a. Dissolve some precipitate in dilute HCl")
                 print("b. Add aluminon reagent and make slightly basic with NH₄OH")
-                if get_user_input("Does a red lake form? (y/n): ", ['y', 'n']) == 'y':
+                if get_user_input("Does a red lake form? (y/n): ", _YN) == 'y':
                     detected.append("Al³⁺")
                     print("-> Al³⁺ confirmed: Red lake complex")
                     self.print_reaction_details("Al³⁺")
@@ -543,7 +514,7 @@ class CationAnalyzer(ChemicalAnalyzer):
                 print("a. Boil with NaOH and H₂O₂")
                 print("b. Acidify with CH₃COOH")
                 print("c. Add Pb(OAc)₂ solution")
-                if get_user_input("Does a yellow precipitate form? (y/n): ", ['y', 'n']) == 'y':
+                if get_user_input("Does a yellow precipitate form? (y/n): ", _YN) == 'y':
                     detected.append("Cr³⁺")
                     print("-> Cr³⁺ confirmed: Yellow PbCrO₄")
                     self.print_reaction_details("Cr³⁺")
@@ -551,7 +522,7 @@ class CationAnalyzer(ChemicalAnalyzer):
         else:
             print("No Group III cations detected.")
         
-        self.detected_ions.extend(detected)
+        self._record_detected(detected)
         return detected
 
     def test_group_iv(self) -> List[str]:
@@ -561,9 +532,9 @@ class CationAnalyzer(ChemicalAnalyzer):
         print("Make the solution slightly basic with NH₃/NH₄Cl buffer.")
         print("Pass H₂S gas through the solution and observe.")
         
-        if get_user_input("Did a precipitate form? (y/n): ", ['y', 'n']) == 'y':
+        if get_user_input("Did a precipitate form? (y/n): ", _YN) == 'y':
             print("\nObserve precipitate color:")
-            color = get_user_input("Color? (white/flesh-pink/black): ", ['white', 'flesh-pink', 'black'])
+            color = get_user_input("Color? (white/flesh-pink/black): ", _COLORS_IV)
             
             print("\nPerforming confirmatory tests...")
             
@@ -574,7 +545,7 @@ class CationAnalyzer(ChemicalAnalyzer):
                 print("b. Add NaOH solution dropwise")
                 print("   Observe: White precipitate forms initially")
                 print("c. Add excess NaOH")
-                if get_user_input("Does the precipitate dissolve? (y/n): ", ['y', 'n']) == 'y':
+                if get_user_input("Does the precipitate dissolve? (y/n): ", _YN) == 'y':
                     detected.append("Zn²⁺")
                     print("-> Zn²⁺ confirmed: Amphoteric behavior")
                     self.print_reaction_details("Zn²⁺")
@@ -584,7 +555,7 @@ class CationAnalyzer(ChemicalAnalyzer):
                 print("\n2. Testing for Mn²⁺:")
                 print("a. Dissolve some precipitate in dilute HNO₃")
                 print("b. Add solid NaBiO₃ and stir")
-                if get_user_input("Does the solution turn purple? (y/n): ", ['y', 'n']) == 'y':
+                if get_user_input("Does the solution turn purple? (y/n): ", _YN) == 'y':
                     detected.append("Mn²⁺")
                     print("-> Mn²⁺ confirmed: MnO₄⁻ formation")
                     self.print_reaction_details("Mn²⁺")
@@ -594,7 +565,7 @@ class CationAnalyzer(ChemicalAnalyzer):
                 print("\n3. Testing for Ni²⁺:")
                 print("a. Dissolve some precipitate in aqua regia")
                 print("b. Add dimethylglyoxime in ammoniacal solution")
-                if get_user_input("Does a bright red precipitate form? (y/n): ", ['y', 'n']) == 'y':
+                if get_user_input("Does a bright red precipitate form? (y/n): ", _YN) == 'y':
                     detected.append("Ni²⁺")
                     print("-> Ni²⁺ confirmed: Nickel-dimethylglyoxime complex")
                     self.print_reaction_details("Ni²⁺")
@@ -605,7 +576,7 @@ class CationAnalyzer(ChemicalAnalyzer):
                 print("a. Dissolve some precipitate in dilute HCl")
                 print("b. Add solid NH₄SCN")
                 print("c. Add amyl alcohol and shake")
-                if get_user_input("Does the organic layer turn blue? (y/n): ", ['y', 'n']) == 'y':
+                if get_user_input("Does the organic layer turn blue? (y/n): ", _YN) == 'y':
                     detected.append("Co²⁺")
                     print("-> Co²⁺ confirmed: [Co(SCN)₄]²⁻ complex")
                     self.print_reaction_details("Co²⁺")
@@ -613,7 +584,7 @@ class CationAnalyzer(ChemicalAnalyzer):
         else:
             print("No Group IV cations detected.")
         
-        self.detected_ions.extend(detected)
+        self._record_detected(detected)
         return detected
 
     def test_group_v(self) -> List[str]:
@@ -623,13 +594,13 @@ class CationAnalyzer(ChemicalAnalyzer):
         print("Add NH₄Cl and NH₄OH to the solution.")
         print("Then add (NH₄)₂CO₃ solution and warm slightly.")
         
-        if get_user_input("Did a white precipitate form? (y/n): ", ['y', 'n']) == 'y':
+        if get_user_input("Did a white precipitate form? (y/n): ", _YN) == 'y':
             print("\nPerform flame tests on original solution:")
             print("Clean platinum wire, dip in conc. HCl, then in test solution.")
             print("Introduce into flame and observe color.")
             
             flame_color = get_user_input("Flame color? (green/red/orange/none): ", 
-                                       ['green', 'red', 'orange', 'none'])
+                                       _FLAME_V)
             
             if flame_color == "green":
                 detected.append("Ba²⁺")
@@ -640,7 +611,7 @@ class CationAnalyzer(ChemicalAnalyzer):
                 print("\nConfirmatory test for Sr²⁺:")
                 print("a. Make solution slightly acidic with CH₃COOH")
                 print("b. Add saturated CaSO₄ solution")
-                if get_user_input("Does a white precipitate form slowly? (y/n): ", ['y', 'n']) == 'y':
+                if get_user_input("Does a white precipitate form slowly? (y/n): ", _YN) == 'y':
                     detected.append("Sr²⁺")
                     print("-> Sr²⁺ confirmed: SrSO₄ precipitation")
                     self.print_reaction_details("Sr²⁺")
@@ -648,7 +619,7 @@ class CationAnalyzer(ChemicalAnalyzer):
             if flame_color == "orange":
                 print("\nConfirmatory test for Ca²⁺:")
                 print("a. Add (NH₄)₂C₂O₄ solution")
-                if get_user_input("Does a white precipitate form? (y/n): ", ['y', 'n']) == 'y':
+                if get_user_input("Does a white precipitate form? (y/n): ", _YN) == 'y':
                     detected.append("Ca²⁺")
                     print("-> Ca²⁺ confirmed: CaC₂O₄ precipitation")
                     self.print_reaction_details("Ca²⁺")
@@ -656,7 +627,7 @@ class CationAnalyzer(ChemicalAnalyzer):
         else:
             print("No Group V cations detected.")
         
-        self.detected_ions.extend(detected)
+        self._record_detected(detected)
         return detected
 
     def test_group_vi(self) -> List[str]:
@@ -668,7 +639,7 @@ class CationAnalyzer(ChemicalAnalyzer):
         print("\n1. Testing for NH₄⁺:")
         print("a. Take original solution in test tube")
         print("b. Add NaOH solution and warm gently")
-        if get_user_input("Does ammonia gas evolve (test with moist red litmus)? (y/n): ", ['y', 'n']) == 'y':
+        if get_user_input("Does ammonia gas evolve (test with moist red litmus)? (y/n): ", _YN) == 'y':
             detected.append("NH₄⁺")
             print("-> NH₄⁺ confirmed: NH₃ gas detected")
             self.print_reaction_details("NH₄⁺")
@@ -677,7 +648,7 @@ class CationAnalyzer(ChemicalAnalyzer):
         print("\n2. Testing for Mg²⁺:")
         print("a. Take fresh solution, add NH₄Cl and NH₄OH")
         print("b. Add disodium hydrogen phosphate solution")
-        if get_user_input("Does a white crystalline precipitate form? (y/n): ", ['y', 'n']) == 'y':
+        if get_user_input("Does a white crystalline precipitate form? (y/n): ", _YN) == 'y':
             detected.append("Mg²⁺")
             print("-> Mg²⁺ confirmed: MgNH₄PO₄ precipitation")
             self.print_reaction_details("Mg²⁺")
@@ -685,10 +656,10 @@ class CationAnalyzer(ChemicalAnalyzer):
         # Sodium test
         print("\n3. Testing for Na⁺:")
         print("Perform flame test (clean wire, dip in solution):")
-        flame_color = get_user_input("Flame color? (yellow/none): ", ['yellow', 'none'])
+        flame_color = get_user_input("Flame color? (yellow/none): ", _FLAME_NA)
         if flame_color == "yellow":
             print("Confirm with cobalt glass:")
-            if get_user_input("Does yellow color disappear through cobalt glass? (y/n): ", ['y', 'n']) == 'y':
+            if get_user_input("Does yellow color disappear through cobalt glass? (y/n): ", _YN) == 'y':
                 detected.append("Na⁺")
                 print("-> Na⁺ confirmed: Persistent yellow flame")
                 self.print_reaction_details("Na⁺")
@@ -696,11 +667,11 @@ class CationAnalyzer(ChemicalAnalyzer):
         # Potassium test
         print("\n4. Testing for K⁺:")
         print("Perform flame test through cobalt glass:")
-        flame_color = get_user_input("Flame color through cobalt glass? (violet/none): ", ['violet', 'none'])
+        flame_color = get_user_input("Flame color through cobalt glass? (violet/none): ", _FLAME_K)
         if flame_color == "violet":
             print("Confirmatory test:")
             print("a. Add sodium cobaltinitrite solution")
-            if get_user_input("Does a yellow precipitate form? (y/n): ", ['y', 'n']) == 'y':
+            if get_user_input("Does a yellow precipitate form? (y/n): ", _YN) == 'y':
                 detected.append("K⁺")
                 print("-> K⁺ confirmed: K₂Na[Co(NO₂)₆] precipitation")
                 self.print_reaction_details("K⁺")
@@ -708,7 +679,7 @@ class CationAnalyzer(ChemicalAnalyzer):
         if not detected:
             print("No Group VI cations detected.")
         
-        self.detected_ions.extend(detected)
+        self._record_detected(detected)
         return detected
 
     def perform_full_analysis(self) -> None:
@@ -731,14 +702,15 @@ class CationAnalyzer(ChemicalAnalyzer):
             if input("Continue to next group? (y/n): ").lower() != 'y':
                 break
         
-        self.show_detailed_results()
-        self.save_results()
+        unique_ions = self.unique_ions
+        self._render_results(unique_ions)
+        self._write_results_file(unique_ions)
 
 class AnionAnalyzer(ChemicalAnalyzer):
     """Handles anion analysis procedures"""
     
     def __init__(self):
-        super().__init__(ANION_REACTIONS, 'anion')
+        super().__init__(ANION_REACTIONS, ANION_REACTIONS_BY_GROUP, 'anion')
     
     def test_group_i(self) -> List[str]:
         """Test for Group I anions (CO₃²⁻, S²⁻, NO₂⁻, CH₃COO⁻)"""
@@ -746,7 +718,7 @@ class AnionAnalyzer(ChemicalAnalyzer):
         display_header("GROUP I: Dilute H₂SO₄ Tests")
         print("Procedure: Take 2mL test solution in test tube, add 1mL dilute H₂SO₄")
         
-        if get_user_input("Is there effervescence/gas evolution? (y/n): ", ['y', 'n']) == 'y':
+        if get_user_input("Is there effervescence/gas evolution? (y/n): ", _YN) == 'y':
             print("\nObserve carefully:")
             print("1. Color and smell of gas")
             print("2. Effect on lime water")
@@ -755,7 +727,7 @@ class AnionAnalyzer(ChemicalAnalyzer):
             # Carbonate test
             print("\n1. Testing for CO₃²⁻:")
             print("a. Pass evolved gas through lime water (Ca(OH)₂)")
-            if get_user_input("Does lime water turn milky? (y/n): ", ['y', 'n']) == 'y':
+            if get_user_input("Does lime water turn milky? (y/n): ", _YN) == 'y':
                 detected.append("CO₃²⁻")
                 print("-> CO₃²⁻ confirmed: CO₂ gas detected")
                 self.print_reaction_details("CO₃²⁻")
@@ -764,7 +736,7 @@ class AnionAnalyzer(ChemicalAnalyzer):
             print("\n2. Testing for S²⁻:")
             print("a. Note smell (rotten eggs)")
             print("b. Bring moist lead acetate paper to mouth of test tube")
-            if get_user_input("Does paper turn black? (y/n): ", ['y', 'n']) == 'y':
+            if get_user_input("Does paper turn black? (y/n): ", _YN) == 'y':
                 detected.append("S²⁻")
                 print("-> S²⁻ confirmed: PbS formation")
                 self.print_reaction_details("S²⁻")
@@ -772,7 +744,7 @@ class AnionAnalyzer(ChemicalAnalyzer):
             # Nitrite test
             print("\n3. Testing for NO₂⁻:")
             print("a. Observe gas color (brown fumes)")
-            if get_user_input("Are brown fumes visible? (y/n): ", ['y', 'n']) == 'y':
+            if get_user_input("Are brown fumes visible? (y/n): ", _YN) == 'y':
                 detected.append("NO₂⁻")
                 print("-> NO₂⁻ confirmed: NO₂ gas detected")
                 self.print_reaction_details("NO₂⁻")
@@ -780,9 +752,9 @@ class AnionAnalyzer(ChemicalAnalyzer):
             # Acetate test
             print("\n4. Testing for CH₃COO⁻:")
             print("a. Note vinegar-like smell")
-            if get_user_input("Is there a distinct vinegar odor? (y/n): ", ['y', 'n']) == 'y':
+            if get_user_input("Is there a distinct vinegar odor? (y/n): ", _YN) == 'y':
                 print("b. Confirm with ferric chloride test")
-                if get_user_input("Add FeCl₃. Does solution turn red-brown? (y/n): ", ['y', 'n']) == 'y':
+                if get_user_input("Add FeCl₃. Does solution turn red-brown? (y/n): ", _YN) == 'y':
                     detected.append("CH₃COO⁻")
                     print("-> CH₃COO⁻ confirmed: Smell and color change")
                     self.print_reaction_details("CH₃COO⁻")
@@ -790,7 +762,7 @@ class AnionAnalyzer(ChemicalAnalyzer):
         else:
             print("No Group I anions detected.")
         
-        self.detected_ions.extend(detected)
+        self._record_detected(detected)
         return detected
 
     def test_group_ii(self) -> List[str]:
@@ -800,7 +772,7 @@ class AnionAnalyzer(ChemicalAnalyzer):
         print("CAUTION: Perform in fume hood. Use small quantities.")
         print("Procedure: Take 1mL test solution, add 1mL conc. H₂SO₄ carefully")
         
-        if get_user_input("Are colored fumes evolved? (y/n): ", ['y', 'n']) == 'y':
+        if get_user_input("Are colored fumes evolved? (y/n): ", _YN) == 'y':
             print("\nObserve carefully:")
             print("1. Color of fumes")
             print("2. Odor characteristics")
@@ -810,7 +782,7 @@ class AnionAnalyzer(ChemicalAnalyzer):
             print("\n1. Testing for Cl⁻:")
             print("a. Note white fumes (HCl)")
             print("b. Perform AgNO₃ test on original solution")
-            if get_user_input("White precipitate soluble in NH₄OH? (y/n): ", ['y', 'n']) == 'y':
+            if get_user_input("White precipitate soluble in NH₄OH? (y/n): ", _YN) == 'y':
                 detected.append("Cl⁻")
                 print("-> Cl⁻ confirmed: AgCl behavior")
                 self.print_reaction_details("Cl⁻")
@@ -819,7 +791,7 @@ class AnionAnalyzer(ChemicalAnalyzer):
             print("\n2. Testing for Br⁻:")
             print("a. Note yellow-brown fumes (Br₂)")
             print("b. Perform AgNO₃ test on original solution")
-            if get_user_input("Pale yellow precipitate partially soluble in NH₄OH? (y/n): ", ['y', 'n']) == 'y':
+            if get_user_input("Pale yellow precipitate partially soluble in NH₄OH? (y/n): ", _YN) == 'y':
                 detected.append("Br⁻")
                 print("-> Br⁻ confirmed: AgBr behavior")
                 self.print_reaction_details("Br⁻")
@@ -828,7 +800,7 @@ class AnionAnalyzer(ChemicalAnalyzer):
             print("\n3. Testing for I⁻:")
             print("a. Note violet fumes (I₂)")
             print("b. Perform AgNO₃ test on original solution")
-            if get_user_input("Yellow precipitate insoluble in NH₄OH? (y/n): ", ['y', 'n']) == 'y':
+            if get_user_input("Yellow precipitate insoluble in NH₄OH? (y/n): ", _YN) == 'y':
                 detected.append("I⁻")
                 print("-> I⁻ confirmed: AgI behavior")
                 self.print_reaction_details("I⁻")
@@ -839,7 +811,7 @@ class AnionAnalyzer(ChemicalAnalyzer):
             print("b. Perform brown ring test:")
             print("   - Add FeSO₄ solution to test tube")
             print("   - Carefully add conc. H₂SO₄ down the side")
-            if get_user_input("Brown ring at interface? (y/n): ", ['y', 'n']) == 'y':
+            if get_user_input("Brown ring at interface? (y/n): ", _YN) == 'y':
                 detected.append("NO₃⁻")
                 print("-> NO₃⁻ confirmed: Brown ring test")
                 self.print_reaction_details("NO₃⁻")
@@ -847,7 +819,7 @@ class AnionAnalyzer(ChemicalAnalyzer):
         else:
             print("No Group II anions detected.")
         
-        self.detected_ions.extend(detected)
+        self._record_detected(detected)
         return detected
 
     def test_group_iii(self) -> List[str]:
@@ -859,9 +831,9 @@ class AnionAnalyzer(ChemicalAnalyzer):
         print("\n1. Testing for SO₄²⁻:")
         print("a. Acidify test solution with dilute HCl")
         print("b. Add BaCl₂ solution")
-        if get_user_input("White precipitate forms? (y/n): ", ['y', 'n']) == 'y':
+        if get_user_input("White precipitate forms? (y/n): ", _YN) == 'y':
             print("c. Test precipitate solubility in conc. HCl")
-            if get_user_input("Precipitate insoluble? (y/n): ", ['y', 'n']) == 'y':
+            if get_user_input("Precipitate insoluble? (y/n): ", _YN) == 'y':
                 detected.append("SO₄²⁻")
                 print("-> SO₄²⁻ confirmed: BaSO₄ precipitation")
                 self.print_reaction_details("SO₄²⁻")
@@ -870,7 +842,7 @@ class AnionAnalyzer(ChemicalAnalyzer):
         print("\n2. Testing for PO₄³⁻:")
         print("a. Add conc. HNO₃ and ammonium molybdate")
         print("b. Warm gently (60°C water bath)")
-        if get_user_input("Yellow precipitate forms? (y/n): ", ['y', 'n']) == 'y':
+        if get_user_input("Yellow precipitate forms? (y/n): ", _YN) == 'y':
             detected.append("PO₄³⁻")
             print("-> PO₄³⁻ confirmed: Ammonium phosphomolybdate")
             self.print_reaction_details("PO₄³⁻")
@@ -879,7 +851,7 @@ class AnionAnalyzer(ChemicalAnalyzer):
         print("\n3. Testing for BO₃³⁻:")
         print("a. Mix sample with methanol and conc. H₂SO₄")
         print("b. Ignite carefully (flame test)")
-        if get_user_input("Green-edged flame observed? (y/n): ", ['y', 'n']) == 'y':
+        if get_user_input("Green-edged flame observed? (y/n): ", _YN) == 'y':
             detected.append("BO₃³⁻")
             print("-> BO₃³⁻ confirmed: Green flame test")
             self.print_reaction_details("BO₃³⁻")
@@ -887,7 +859,7 @@ class AnionAnalyzer(ChemicalAnalyzer):
         if not detected:
             print("No Group III anions detected.")
         
-        self.detected_ions.extend(detected)
+        self._record_detected(detected)
         return detected
 
     def perform_full_analysis(self) -> None:
@@ -907,8 +879,9 @@ class AnionAnalyzer(ChemicalAnalyzer):
             if input("Continue to next group? (y/n): ").lower() != 'y':
                 break
         
-        self.show_detailed_results()
-        self.save_results()
+        unique_ions = self.unique_ions
+        self._render_results(unique_ions)
+        self._write_results_file(unique_ions)
 
 # ======================
 # MENU SYSTEM
@@ -930,7 +903,7 @@ def main_menu() -> None:
         print("5. ℹ️  Program Information")
         print("6. 🚪 Exit Program")
         
-        choice = get_user_input("\nEnter your choice (1-6): ", [str(i) for i in range(1, 7)])
+        choice = get_user_input("\nEnter your choice (1-6): ", _CHOICES_1_6)
         
         if choice == '1':
             cation_analysis_menu(cation_analyzer)
@@ -958,7 +931,7 @@ def cation_analysis_menu(analyzer: CationAnalyzer) -> None:
         print("3. 📊 View Current Results")
         print("4. 🏠 Return to Main Menu")
         
-        choice = get_user_input("\nEnter your choice (1-4): ", ['1', '2', '3', '4'])
+        choice = get_user_input("\nEnter your choice (1-4): ", _CHOICES_1_4)
         
         if choice == '1':
             analyzer.perform_full_analysis()
@@ -992,7 +965,7 @@ def analyze_specific_cation_group(analyzer: CationAnalyzer) -> None:
         print("0. ↩ Back to Cation Menu")
         
         choice = get_user_input("\nSelect group to analyze (1-6) or 0 to cancel: ", 
-                              ['0', '1', '2', '3', '4', '5', '6'])
+                              _CHOICES_0_6)
         
         if choice == '0':
             break
@@ -1008,12 +981,12 @@ def analyze_specific_cation_group(analyzer: CationAnalyzer) -> None:
                 for ion in detected:
                     print(f"- {ion}")
                 
-                detail = get_user_input("\nView reaction details for these ions? (y/n): ", ['y', 'n'])
+                detail = get_user_input("\nView reaction details for these ions? (y/n): ", _YN)
                 if detail == 'y':
                     for ion in detected:
                         analyzer.print_reaction_details(ion)
                 
-                save = get_user_input("\nSave these results? (y/n): ", ['y', 'n'])
+                save = get_user_input("\nSave these results? (y/n): ", _YN)
                 if save == 'y':
                     analyzer.save_results()
             else:
@@ -1033,7 +1006,7 @@ def anion_analysis_menu(analyzer: AnionAnalyzer) -> None:
         print("3. 📊 View Current Results")
         print("4. 🏠 Return to Main Menu")
         
-        choice = get_user_input("\nEnter your choice (1-4): ", ['1', '2', '3', '4'])
+        choice = get_user_input("\nEnter your choice (1-4): ", _CHOICES_1_4)
         
         if choice == '1':
             analyzer.perform_full_analysis()
@@ -1064,7 +1037,7 @@ def analyze_specific_anion_group(analyzer: AnionAnalyzer) -> None:
         print("0. ↩ Back to Anion Menu")
         
         choice = get_user_input("\nSelect group to analyze (1-3) or 0 to cancel: ", 
-                              ['0', '1', '2', '3'])
+                              _CHOICES_0_3)
         
         if choice == '0':
             break
@@ -1080,12 +1053,12 @@ def analyze_specific_anion_group(analyzer: AnionAnalyzer) -> None:
                 for ion in detected:
                     print(f"- {ion}")
                 
-                detail = get_user_input("\nView reaction details for these ions? (y/n): ", ['y', 'n'])
+                detail = get_user_input("\nView reaction details for these ions? (y/n): ", _YN)
                 if detail == 'y':
                     for ion in detected:
                         analyzer.print_reaction_details(ion)
                 
-                save = get_user_input("\nSave these results? (y/n): ", ['y', 'n'])
+                save = get_user_input("\nSave these results? (y/n): ", _YN)
                 if save == 'y':
                     analyzer.save_results()
             else:
@@ -1105,7 +1078,7 @@ def reaction_database_menu() -> None:
         print("3. 🧪 View Group-Wise Reactions")
         print("4. 🏠 Return to Main Menu")
         
-        choice = get_user_input("\nEnter your choice (1-4): ", ['1', '2', '3', '4'])
+        choice = get_user_input("\nEnter your choice (1-4): ", _CHOICES_1_4)
         
         if choice == '1':
             search_ion_reactions()
@@ -1172,7 +1145,7 @@ def confirm_exit() -> bool:
     print("2. ❌ Exit without saving")
     print("3. ↩ Return to program")
     
-    choice = get_user_input("\nEnter your choice (1-3): ", ['1', '2', '3'])
+    choice = get_user_input("\nEnter your choice (1-3): ", _CHOICES_1_3)
     
     if choice == '1':
         print("\nAll session data has been saved.")
@@ -1188,18 +1161,18 @@ def browse_all_reactions() -> None:
     display_header("ALL CHEMICAL REACTIONS")
     
     print("\nCATIONS:")
-    for ion, data in CATION_REACTIONS.items():
+    for ion, test, reaction, group in zip(CATION_IONS, CATION_TESTS, CATION_EQUATIONS, CATION_GROUPS):
         print(f"\n{ion}:")
-        print(f"Test: {data['test']}")
-        print(f"Reaction: {data['reaction']}")
-        print(f"Group: {data['group']}")
+        print(f"Test: {test}")
+        print(f"Reaction: {reaction}")
+        print(f"Group: {group}")
     
     print("\nANIONS:")
-    for ion, data in ANION_REACTIONS.items():
+    for ion, test, reaction, group in zip(ANION_IONS, ANION_TESTS, ANION_EQUATIONS, ANION_GROUPS):
         print(f"\n{ion}:")
-        print(f"Test: {data['test']}")
-        print(f"Reaction: {data['reaction']}")
-        print(f"Group: {data['group']}")
+        print(f"Test: {test}")
+        print(f"Reaction: {reaction}")
+        print(f"Group: {group}")
 
 def search_ion_reactions() -> None:
     """Search for specific ion reactions"""
@@ -1211,44 +1184,27 @@ def search_ion_reactions() -> None:
         if ion.lower() == 'back':
             break
         
-        found = False
-        if ion in CATION_REACTIONS:
+        # Ions listed in several groups (Pb²⁺) show every row
+        cation_rows = CATION_ROWS_BY_ION.get(ion, ())
+        anion_rows = ANION_ROWS_BY_ION.get(ion, ())
+        for i in cation_rows:
             print(f"\nCATION FOUND: {ion}")
-            data = CATION_REACTIONS[ion]
-            print(f"Test: {data['test']}")
-            print(f"Reaction: {data['reaction']}")
-            print(f"Group: {data['group']}")
-            found = True
+            print(f"Test: {CATION_TESTS[i]}")
+            print(f"Reaction: {CATION_EQUATIONS[i]}")
+            print(f"Group: {CATION_GROUPS[i]}")
             
-        if ion in ANION_REACTIONS:
+        for i in anion_rows:
             print(f"\nANION FOUND: {ion}")
-            data = ANION_REACTIONS[ion]
-            print(f"Test: {data['test']}")
-            print(f"Reaction: {data['reaction']}")
-            print(f"Group: {data['group']}")
-            found = True
+            print(f"Test: {ANION_TESTS[i]}")
+            print(f"Reaction: {ANION_EQUATIONS[i]}")
+            print(f"Group: {ANION_GROUPS[i]}")
             
-        if not found:
+        if not cation_rows and not anion_rows:
             print(f"\nIon '{ion}' not found in databases.")
             print("Try using standard notation (e.g., Fe³⁺, SO₄²⁻)")
 
 def view_group_reactions() -> None:
     """Display reactions organized by analysis groups"""
-    cation_groups = {
-        "I": ["Pb²⁺", "Ag⁺", "Hg₂²⁺"],
-        "II": ["Cu²⁺", "Pb²⁺", "Bi³⁺", "As³⁺/⁵⁺"],
-        "III": ["Fe³⁺", "Al³⁺", "Cr³⁺"],
-        "IV": ["Zn²⁺", "Mn²⁺", "Ni²⁺", "Co²⁺"],
-        "V": ["Ba²⁺", "Sr²⁺", "Ca²⁺"],
-        "VI": ["NH₄⁺", "Mg²⁺", "Na⁺", "K⁺"]
-    }
-    
-    anion_groups = {
-        "I": ["CO₃²⁻", "S²⁻", "NO₂⁻", "CH₃COO⁻"],
-        "II": ["Cl⁻", "Br⁻", "I⁻", "NO₃⁻"],
-        "III": ["SO₄²⁻", "PO₄³⁻", "BO₃³⁻"]
-    }
-    
     while True:
         clear_screen()
         display_header("GROUP-WISE REACTIONS")
@@ -1258,15 +1214,14 @@ def view_group_reactions() -> None:
         print("2. Anion Groups (I-III)")
         print("3. Back to Database Menu")
         
-        choice = get_user_input("\nEnter choice (1-3): ", ['1', '2', '3'])
+        choice = get_user_input("\nEnter choice (1-3): ", _CHOICES_1_3)
         
         if choice == '1':
             print("\nCATION GROUPS:")
-            for group, ions in cation_groups.items():
+            for group, rows in CATION_ROWS_BY_GROUP.items():
                 print(f"\nGroup {group}:")
-                for ion in ions:
-                    if ion in CATION_REACTIONS:
-                        print(f"  {ion}: {CATION_REACTIONS[ion]['test']}")
+                for i in rows:
+                    print(f"  {CATION_IONS[i]}: {CATION_TESTS[i]}")
             
             ion = input("\nEnter ion to view details or 'back': ").strip()
             if ion.lower() != 'back' and ion in CATION_REACTIONS:
@@ -1275,11 +1230,10 @@ def view_group_reactions() -> None:
         
         elif choice == '2':
             print("\nANION GROUPS:")
-            for group, ions in anion_groups.items():
+            for group, rows in ANION_ROWS_BY_GROUP.items():
                 print(f"\nGroup {group}:")
-                for ion in ions:
-                    if ion in ANION_REACTIONS:
-                        print(f"  {ion}: {ANION_REACTIONS[ion]['test']}")
+                for i in rows:
+                    print(f"  {ANION_IONS[i]}: {ANION_TESTS[i]}")
             
             ion = input("\nEnter ion to view details or 'back': ").strip()
             if ion.lower() != 'back' and ion in ANION_REACTIONS:
@@ -1291,14 +1245,13 @@ def view_group_reactions() -> None:
 
 def print_reaction_details(ion: str, ion_type: str) -> None:
     """Print detailed reaction information for a specific ion"""
-    database = CATION_REACTIONS if ion_type == 'cation' else ANION_REACTIONS
-    if ion in database:
-        data = database[ion]
+    data = find_reaction(ion, ion_type)
+    if data is not None:
         print(f"\nDetailed information for {ion}:")
-        print(f"Test Method: {data['test']}")
-        print(f"Chemical Equation:\n{data['reaction']}")
-        print(f"Scientific Principle: {data['reason']}")
-        print(f"Group: {data['group']}")
+        print(f"Test Method: {data.test}")
+        print(f"Chemical Equation:\n{data.reaction}")
+        print(f"Scientific Principle: {data.reason}")
+        print(f"Group: {data.group}")
     else:
         print(f"\nNo data available for {ion}")
 
@@ -1306,6 +1259,8 @@ def print_reaction_details(ion: str, ion_type: str) -> None:
 # PROGRAM INITIALIZATION
 # ======================
 if __name__ == "__main__":
+    import logging
+
     try:
         setup_logging()
         logging.info("Program started")
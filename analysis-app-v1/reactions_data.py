@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+
+"""
+CHEMICAL REACTION DATA
+Reaction tables for the qualitative analysis program, kept as plain tuple
+literals so each table compiles to a single constant in the .pyc
+"""
+
+# Row layout: (ion, test, reaction, reason, group)
+CATIONS = (
+    # Group I (HCl Group)
+    ("Pb²⁺",
+     "Hot water + K₂CrO₄",
+     "Pb²⁺ + CrO₄²⁻ → PbCrO₄↓ (yellow)",
+     "Forms insoluble lead chromate (Ksp = 2.8×10⁻¹³)",
+     "I"),
+    ("Ag⁺",
+     "NH₄OH dissolution + HNO₃",
+     "AgCl + 2NH₃ → [Ag(NH₃)₂]⁺ (soluble complex)",
+     "Forms diamminesilver(I) complex (Kf = 1.1×10⁷)",
+     "I"),
+    ("Hg₂²⁺",
+     "Black residue with NH₄OH",
+     "Hg₂Cl₂ + 2NH₃ → Hg↓ + HgNH₂Cl↓ + NH₄⁺",
+     "Disproportionation reaction",
+     "I"),
+
+    # Group II (H₂S Acidic Group)
+    ("Cu²⁺",
+     "NH₄OH deep blue solution",
+     "Cu²⁺ + 4NH₃ → [Cu(NH₃)₄]²⁺",
+     "Forms tetraamminecopper(II) complex (λmax ≈ 600 nm)",
+     "II"),
+    ("Pb²⁺",
+     "K₂CrO₄ yellow precipitate",
+     "Pb²⁺ + CrO₄²⁻ → PbCrO₄↓",
+     "Confirmatory test after Group I separation",
+     "II"),
+    ("Bi³⁺",
+     "SnCl₂ reduction",
+     "2Bi³⁺ + 3Sn²⁺ → 2Bi↓ + 3Sn⁴⁺",
+     "Redox reaction (E° = 0.32V for Bi³⁺/Bi)",
+     "II"),
+    ("As³⁺/⁵⁺",
+     "(NH₄)₂Sx dissolution",
+     "As₂S₃ + 3S²⁻ → 2AsS₃³⁻",
+     "Forms soluble thioarsenite complex",
+     "II"),
+
+    # Group III (NH₄OH/NH₄Cl Group)
+    ("Fe³⁺",
+     "K₄[Fe(CN)₆]",
+     "4Fe³⁺ + 3[Fe(CN)₆]⁴⁻ → Fe₄[Fe(CN)₆]₃↓ (Prussian blue)",
+     "Mixed-valence iron cyanide complex",
+     "III"),
+    ("Al³⁺",
+     "Aluminon reagent",
+     "Al³⁺ + aluminon → red lake complex",
+     "Chelation with aurintricarboxylic acid",
+     "III"),
+    ("Cr³⁺",
+     "NaOH/H₂O₂ + Pb(OAc)₂",
+     "Cr³⁺ → CrO₄²⁻ → PbCrO₄↓ (yellow)",
+     "Oxidation to chromate followed by precipitation",
+     "III"),
+
+    # Group IV (H₂S Basic Group)
+    ("Zn²⁺",
+     "NaOH solubility",
+     "Zn²⁺ + 2OH⁻ → Zn(OH)₂↓ → [Zn(OH)₄]²⁻",
+     "Amphoteric behavior",
+     "IV"),
+    ("Mn²⁺",
+     "NaBiO₃ oxidation",
+     "2Mn²⁺ + 5NaBiO₃ + 14H⁺ → 2MnO₄⁻ + 5Bi³⁺ + 5Na⁺ + 7H₂O",
+     "Oxidation to purple permanganate",
+     "IV"),
+    ("Ni²⁺",
+     "Dimethylglyoxime",
+     "Ni²⁺ + 2dmgH → [Ni(dmg)₂]↓ (red)",
+     "Square planar chelate complex",
+     "IV"),
+    ("Co²⁺",
+     "NH₄SCN complex",
+     "Co²⁺ + 4SCN⁻ → [Co(SCN)₄]²⁻ (blue)",
+     "Tetrahedral thiocyanate complex",
+     "IV"),
+
+    # Group V ((NH₄)₂CO₃ Group)
+    ("Ba²⁺",
+     "Flame test (green)",
+     "Ba²⁺ → Ba* (excited state)",
+     "Emission at 524 nm (green)",
+     "V"),
+    ("Sr²⁺",
+     "Flame test (crimson)",
+     "Sr²⁺ → Sr* (excited state)",
+     "Emission at 650-680 nm (red)",
+     "V"),
+    ("Ca²⁺",
+     "Flame test (brick-red)",
+     "Ca²⁺ → Ca* (excited state)",
+     "Emission at 622 nm (orange-red)",
+     "V"),
+
+    # Group VI (Soluble Group)
+    ("NH₄⁺",
+     "NaOH + heat",
+     "NH₄⁺ + OH⁻ → NH₃↑ + H₂O",
+     "Ammonia gas detection",
+     "VI"),
+    ("Mg²⁺",
+     "Magneson reagent",
+     "Mg²⁺ + magneson → blue lake complex",
+     "Adsorption indicator reaction",
+     "VI"),
+    ("Na⁺",
+     "Flame test (yellow)",
+     "Na⁺ → Na* (excited state)",
+     "Emission at 589 nm (D-line)",
+     "VI"),
+    ("K⁺",
+     "Flame test (violet)",
+     "K⁺ → K* (excited state)",
+     "Emission at 766/770 nm",
+     "VI"),
+)
+
+ANIONS = (
+    # Group I (Dilute H₂SO₄ Group)
+    ("CO₃²⁻",
+     "Effervescence + lime water",
+     "CO₃²⁻ + 2H⁺ → CO₂↑ + H₂O\nCO₂ + Ca(OH)₂ → CaCO₃↓ (milky)",
+     "Carbonates release CO₂ gas that forms insoluble calcium carbonate (Ksp = 4.5×10⁻⁹)",
+     "I"),
+    ("S²⁻",
+     "Lead acetate paper",
+     "S²⁻ + Pb²⁺ → PbS↓ (black, Ksp = 9.0×10⁻²⁹)",
+     "Extremely low solubility allows detection at ppm levels",
+     "I"),
+    ("NO₂⁻",
+     "Brown fumes with acid",
+     "2NO₂⁻ + 2H⁺ → NO₂↑ (brown) + NO↑ + H₂O",
+     "Nitrous acid decomposition produces characteristic brown gas",
+     "I"),
+    ("CH₃COO⁻",
+     "Vinegar smell",
+     "CH₃COO⁻ + H⁺ → CH₃COOH↑ (pKa = 4.76)",
+     "Volatile acetic acid detected by odor",
+     "I"),
+
+    # Group II (Conc. H₂SO₄ Group)
+    ("Cl⁻",
+     "AgNO₃ precipitation",
+     "Ag⁺ + Cl⁻ → AgCl↓ (white, Ksp = 1.8×10⁻¹⁰)\nAgCl + 2NH₃ → [Ag(NH₃)₂]⁺ (soluble)",
+     "Distinctive solubility behavior in ammonia",
+     "II"),
+    ("Br⁻",
+     "AgNO₃ precipitation",
+     "Ag⁺ + Br⁻ → AgBr↓ (pale yellow, Ksp = 5.0×10⁻¹³)",
+     "Intermediate solubility product distinguishes from other halides",
+     "II"),
+    ("I⁻",
+     "AgNO₃ precipitation",
+     "Ag⁺ + I⁻ → AgI↓ (yellow, Ksp = 8.5×10⁻¹⁷)",
+     "Most insoluble silver halide",
+     "II"),
+    ("NO₃⁻",
+     "Brown ring test",
+     "NO₃⁻ + 3Fe²⁺ + 4H⁺ → NO↑ + 3Fe³⁺ + 2H₂O\nFe²⁺ + NO → [Fe(NO)]²⁺ (brown ring)",
+     "Nitric oxide complexation with Fe²⁺ (E° = +0.96V)",
+     "II"),
+
+    # Group III (Special Tests)
+    ("SO₄²⁻",
+     "BaCl₂ in acid",
+     "Ba²⁺ + SO₄²⁻ → BaSO₄↓ (white, Ksp = 1.1×10⁻¹⁰)",
+     "Kinetically inert precipitate resistant to acid dissolution",
+     "III"),
+    ("PO₄³⁻",
+     "Ammonium molybdate",
+     "PO₄³⁻ + 12MoO₄²⁻ + 3NH₄⁺ + 24H⁺ → (NH₄)₃PO₄·12MoO₃↓ (yellow)",
+     "Heteropoly acid formation under acidic conditions",
+     "III"),
+    ("BO₃³⁻",
+     "Flame test",
+     "BO₃³⁻ + H₂SO₄ + CH₃CH₂OH → B(OCH₂CH₃)₃ (green flame)",
+     "Volatile boron ester produces characteristic green color",
+     "III"),
+)
@@ -10,11 +10,20 @@ Updated for new database structure with enhanced logging
 # IMPORTS
 # ======================
 import os
+import signal
 import sys
 import json
 import logging
-from datetime import datetime
-from typing import Dict, List, Optional, TypedDict, Tuple
+from functools import lru_cache
+from time import strftime
+from types import MappingProxyType
+from typing import Callable, Collection, Dict, List, Mapping, Optional, TypedDict, Tuple
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json is the fallback
+    _json_loads = json.loads
 
 # ======================
 # TYPE DEFINITIONS
@@ -44,9 +53,54 @@ class Database(TypedDict):
 # CONSTANTS
 # ======================
 DATABASE_FILE = "database.json"
+LOG_FILE = "qualitative_analysis.log"
 MAX_LOG_FILES = 10
+MAX_LOG_BYTES = 512_000
 MENU_WIDTH = 50
 
+# Valid answers for the fixed prompts, shared instead of rebuilt per prompt
+_YN = frozenset('yn')
+_CHOICES_1_3 = frozenset('123')
+_CHOICES_1_4 = frozenset('1234')
+_CHOICES_1_5 = frozenset('12345')
+_MAIN_CHOICES = frozenset('123456')
+
+# Body of the PROGRAM INFORMATION screen, filled from the database metadata
+_PROGRAM_INFO_TEMPLATE = """
+QUALITATIVE CHEMICAL ANALYSIS SYSTEM
+Version: {version}
+Last Updated: {revision_date}
+
+Database System: {group_system}
+Reference: {reference}
+
+Developed for educational purposes to assist in:
+- Systematic qualitative chemical analysis
+- Identification of cations and anions
+- Understanding chemical reactions and principles
+
+Safety Notice:
+Always perform chemical tests under proper supervision
+and with appropriate safety equipment.
+
+"""
+
+_LAB_ASSISTANT_TEXT = """
+This feature provides:
+- 🧑‍🔬 Step-by-step procedure guidance
+- ⚠️  Safety precautions for each test
+- 🎥 Video demonstration links
+- 📝 Lab report templates
+
+Coming in future versions!
+"""
+
+_SAFETY_TEXT = """
+This program assists with chemical analysis but
+cannot replace proper lab safety procedures.
+Always wear appropriate PPE when performing tests.
+"""
+
 # ======================
 # GLOBAL STATE
 # ======================
@@ -56,25 +110,98 @@ chemical_db: Database = {
     "metadata": {}
 }
 
+# Flattened ion -> data lookups, rebuilt once by load_database()
+_CATION_IONS: Mapping[str, IonData] = MappingProxyType({})
+_ANION_IONS: Mapping[str, IonData] = MappingProxyType({})
+# Ion -> every (kind, data) entry across both databases, in database order
+_ALL_REACTIONS: Mapping[str, Tuple[Tuple[str, IonData], ...]] = MappingProxyType({})
+# Pre-rendered group-wise reagent listings shown by view_group_reactions()
+_CATION_GROUP_SUMMARY = ""
+_ANION_GROUP_SUMMARY = ""
+# Full reaction listing shown by browse_all_reactions()
+_BROWSE_TEXT = ""
+
 # ======================
 # UTILITY FUNCTIONS
 # ======================
 def setup_logging() -> None:
     """Configure logging system with rotation"""
-    logging.basicConfig(
-        filename='qualitative_analysis.log',
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        filemode='w'  # Start fresh each run
+    # logging.handlers pulls in socket and more; only pay for it when logging is set up
+    from logging.handlers import RotatingFileHandler
+    handler = RotatingFileHandler(
+        LOG_FILE,
+        maxBytes=MAX_LOG_BYTES,
+        backupCount=MAX_LOG_FILES,
+        encoding='utf-8'
     )
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    logging.basicConfig(level=logging.INFO, handlers=[handler])
     logging.info("Logging system initialized")
 
+def _intern_ion_keys(db: Database) -> None:
+    """Intern every ion name so all derived lookups share one key object"""
+    for key in ("cations", "anions"):
+        for group in db[key].values():
+            group["ions"] = {sys.intern(ion): data for ion, data in group["ions"].items()}
+
+def _flatten_ions(groups: Dict[str, GroupData]) -> Mapping[str, IonData]:
+    """Merge every group's ions into one read-only lookup"""
+    return MappingProxyType({
+        ion: data
+        for group in groups.values()
+        for ion, data in group["ions"].items()
+    })
+
+def _index_reactions(db: Database) -> Mapping[str, Tuple[Tuple[str, IonData], ...]]:
+    """Map each ion to all of its cation/anion entries for one-probe search"""
+    index: Dict[str, List[Tuple[str, IonData]]] = {}
+    for kind, key in (("CATION", "cations"), ("ANION", "anions")):
+        for group in db[key].values():
+            for ion, data in group["ions"].items():
+                index.setdefault(ion, []).append((kind, data))
+    return MappingProxyType({ion: tuple(hits) for ion, hits in index.items()})
+
+def _render_group_summary(label: str, groups: Dict[str, GroupData]) -> str:
+    """Render the group-wise reagent listing for one ion type"""
+    parts = [f"\n{label} GROUPS:\n"]
+    for group in groups.values():
+        parts.append(f"\n{group['title']}:\n")
+        for ion, data in group['ions'].items():
+            parts.append(f"  {ion}: {data['confirmatory_test']['reagent']}\n")
+    return "".join(parts)
+
+def _render_browse_text(db: Database) -> str:
+    """Render the every-reaction listing for the database browser"""
+    parts = []
+    for label, key in (("CATIONS", "cations"), ("ANIONS", "anions")):
+        parts.append(f"\n{label}:\n")
+        for group in db[key].values():
+            for ion, data in group['ions'].items():
+                test = data['confirmatory_test']
+                parts.append(
+                    f"\n{ion}:\n"
+                    f"Test: {test['reagent']}\n"
+                    f"Reaction: {test['equation']}\n"
+                )
+    return "".join(parts)
+
 def load_database() -> bool:
     """Load chemical database from JSON file"""
     try:
-        global chemical_db
-        with open(DATABASE_FILE, 'r', encoding='utf-8') as f:
-            chemical_db = json.load(f)
+        global chemical_db, _CATION_IONS, _ANION_IONS, _ALL_REACTIONS
+        global _CATION_GROUP_SUMMARY, _ANION_GROUP_SUMMARY, _BROWSE_TEXT
+        with open(DATABASE_FILE, 'rb') as f:
+            chemical_db = _json_loads(f.read())
+        _intern_ion_keys(chemical_db)
+        _CATION_IONS = _flatten_ions(chemical_db["cations"])
+        _ANION_IONS = _flatten_ions(chemical_db["anions"])
+        _ALL_REACTIONS = _index_reactions(chemical_db)
+        _CATION_GROUP_SUMMARY = _render_group_summary("CATION", chemical_db["cations"])
+        _ANION_GROUP_SUMMARY = _render_group_summary("ANION", chemical_db["anions"])
+        _BROWSE_TEXT = _render_browse_text(chemical_db)
+        _format_details.cache_clear()
+        _format_report_entry.cache_clear()
+        _program_info_text.cache_clear()
         logging.info("Database loaded successfully")
         return True
     except FileNotFoundError:
@@ -86,30 +213,145 @@ def load_database() -> bool:
         print(f"Error: Invalid database format - {str(e)}")
         return False
 
+_CLEAR = "\x1b[2J\x1b[H"
+
+def _enable_windows_vt() -> bool:
+    """Turn on ANSI escape processing for the Windows console"""
+    import ctypes
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+    mode = ctypes.c_ulong()
+    if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+        return False
+    # ENABLE_VIRTUAL_TERMINAL_PROCESSING; fails on consoles older than Windows 10
+    return bool(kernel32.SetConsoleMode(handle, mode.value | 0x4))
+
+def _ansi_clear() -> None:
+    """Clear the screen with an ANSI escape sequence"""
+    sys.stdout.write(_CLEAR)
+    sys.stdout.flush()
+
+def _win_clear() -> None:
+    """Clear the screen on consoles without ANSI support"""
+    os.system('cls')
+
+def _no_clear() -> None:
+    """Leave piped or captured output alone; there is no screen to clear"""
+
+def _pick_clear() -> Callable[[], None]:
+    """Choose how clear_screen works for this process's stdout"""
+    if not sys.stdout.isatty():
+        return _no_clear
+    if os.name != 'nt' or _enable_windows_vt():
+        return _ansi_clear
+    return _win_clear
+
+_clear = _pick_clear()
+
 def clear_screen() -> None:
     """Clear the terminal screen"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    _clear()
+
+_BORDER = "=" * MENU_WIDTH
+_HEADER_TEMPLATE = f"\n{_BORDER}\n{{}}\n{_BORDER}\n".format
 
 def display_header(title: str) -> None:
     """Display consistent menu headers"""
-    print("\n" + "=" * MENU_WIDTH)
-    print(title.center(MENU_WIDTH))
-    print("=" * MENU_WIDTH)
+    sys.stdout.write(_HEADER_TEMPLATE(title.center(MENU_WIDTH)))
+
+@lru_cache(maxsize=64)
+def _options_hint(options: frozenset) -> str:
+    """Render the retry hint for a set of valid answers"""
+    return f"Please enter one of: {', '.join(sorted(options))}"
 
-def get_user_input(prompt: str, valid_options: Optional[List[str]] = None) -> str:
+def get_user_input(prompt: str, valid_options: Optional[Collection[str]] = None) -> str:
     """Get validated user input with case-insensitive matching"""
     while True:
         try:
             response = input(prompt).lower().strip()
-            logging.debug(f"User input: {response}")
+            logging.debug("User input: %s", response)
             if not valid_options or response in valid_options:
                 return response
-            print(f"Please enter one of: {', '.join(valid_options)}")
-            logging.warning(f"Invalid input: {response}")
+            print(_options_hint(frozenset(valid_options)))
+            logging.warning("Invalid input: %s", response)
         except (EOFError, KeyboardInterrupt):
             if confirm_exit():
                 sys.exit(0)
 
+# Fixed-choice menus take a single keypress when both ends are a terminal
+_KEYPRESS_MENUS = sys.stdin.isatty() and sys.stdout.isatty()
+
+def _read_key() -> str:
+    """Read one keypress from the terminal without waiting for Enter"""
+    if os.name == 'nt':
+        import msvcrt
+        key = msvcrt.getwch()
+    else:
+        import termios
+        import tty
+        fd = sys.stdin.fileno()
+        saved = termios.tcgetattr(fd)
+        try:
+            tty.setcbreak(fd)
+            key = os.read(fd, 1).decode('latin-1')
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+    if key == '\x03':
+        raise KeyboardInterrupt
+    if key in ('\x04', '\x1a'):
+        raise EOFError
+    return key
+
+def get_menu_choice(prompt: str, valid_options: Collection[str]) -> str:
+    """Get a single-character menu choice, on one keypress when interactive"""
+    if not _KEYPRESS_MENUS:
+        return get_user_input(prompt, valid_options)
+    while True:
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        try:
+            key = _read_key()
+            while key not in valid_options:
+                key = _read_key()
+        except (EOFError, KeyboardInterrupt):
+            sys.stdout.write("\n")
+            if confirm_exit():
+                sys.exit(0)
+            continue
+        sys.stdout.write(key + "\n")
+        logging.debug("User input: %s", key)
+        return key
+
+@lru_cache(maxsize=256)
+def _format_details(ion_type: str, ion: str) -> Optional[str]:
+    """Render the reaction details block for an ion, or None if unknown"""
+    data = (_CATION_IONS if ion_type == "cation" else _ANION_IONS).get(ion)
+    if data is None:
+        return None
+    test = data["confirmatory_test"]
+    return (
+        f"\nReaction Details for {ion}:\n"
+        f"Test Method: {test['reagent']}\n"
+        f"Observation: {test['observation']}\n"
+        f"Chemical Equation:\n{test['equation']}\n"
+        f"Scientific Principle: {test['explanation']}"
+    )
+
+@lru_cache(maxsize=256)
+def _format_report_entry(ion_type: str, ion: str) -> str:
+    """Render an ion's entry for a saved results file, empty if unknown"""
+    data = (_CATION_IONS if ion_type == "cation" else _ANION_IONS).get(ion)
+    if data is None:
+        return ""
+    test = data["confirmatory_test"]
+    return (
+        f"{ion}:\n"
+        f"Test Method: {test['reagent']}\n"
+        f"Observation: {test['observation']}\n"
+        f"Reaction: {test['equation']}\n"
+        f"Principle: {test['explanation']}\n\n"
+    )
+
 # ======================
 # CORE ANALYSIS CLASSES
 # ======================
@@ -118,60 +360,103 @@ class ChemicalAnalyzer:
     
     def __init__(self, ion_type: str):
         self.ion_type = ion_type
-        self.detected_ions: List[str] = []
+        self._detected: Dict[str, None] = {}
+        self._sorted_cache: Optional[Tuple[str, ...]] = None
         self.groups: Dict[str, GroupData] = {}
-        self.all_reactions: Dict[str, IonData] = {}
+        self.all_reactions: Mapping[str, IonData] = {}
         logging.info(f"{ion_type.capitalize()} analyzer initialized")
         
         if ion_type == "cation":
             self.groups = chemical_db["cations"]
+            self.all_reactions = _CATION_IONS
         else:
             self.groups = chemical_db["anions"]
-            
-        # Flatten all ions into a single dict
-        for group in self.groups.values():
-            self.all_reactions.update(group["ions"])
+            self.all_reactions = _ANION_IONS
+        
+        # Cation groups separate by precipitation, anion groups by reaction
+        self._trigger_prompt = (
+            "\nDid precipitation occur? (y/n): " if ion_type == "cation"
+            else "\nDid reaction occur? (y/n): "
+        )
+    
+    @property
+    def detected_ions(self) -> List[str]:
+        """Detected ions in detection order, without duplicates"""
+        return list(self._detected)
+    
+    @property
+    def unique_ions(self) -> Tuple[str, ...]:
+        """Detected ions sorted for display; recomputed only after new detections"""
+        if self._sorted_cache is None:
+            self._sorted_cache = tuple(sorted(self._detected))
+        return self._sorted_cache
+    
+    def _record_detected(self, detected: List[str]) -> None:
+        """Add newly confirmed ions, invalidating the sorted view if anything changed"""
+        for ion in detected:
+            if ion not in self._detected:
+                self._detected[ion] = None
+                self._sorted_cache = None
     
     def print_reaction_details(self, ion: str) -> None:
         """Print detailed information about a specific ion"""
-        if ion in self.all_reactions:
-            data = self.all_reactions[ion]
-            test = data["confirmatory_test"]
-            print(f"\nReaction Details for {ion}:")
-            print(f"Test Method: {test['reagent']}")
-            print(f"Observation: {test['observation']}")
-            print(f"Chemical Equation:\n{test['equation']}")
-            print(f"Scientific Principle: {test['explanation']}")
+        details = _format_details(self.ion_type, ion)
+        if details is not None:
+            print(details)
             logging.info(f"Displayed details for {ion}")
         else:
             print(f"\nNo data available for {ion}")
             logging.warning(f"Requested unknown ion: {ion}")
 
+    def test_group(self, group_key: str) -> List[str]:
+        """Generic group testing function"""
+        detected = []
+        group = self.groups[group_key]
+        
+        display_header(group["title"])
+        print(group["description"])
+        print(f"\nSeparation Reagent: {group['separation_reagent']}")
+        
+        logging.info(f"Testing {group_key} - {group['title']}")
+        
+        # Get group-specific ions
+        ions = group["ions"].keys()
+        print(f"\nPossible ions in this group: {', '.join(ions)}")
+        
+        if get_user_input(self._trigger_prompt, _YN) == 'y':
+            print("\nPerforming confirmatory tests...")
+            for ion in ions:
+                test = group["ions"][ion]["confirmatory_test"]
+                print(f"\nTesting for {ion}:")
+                print(f"Reagent: {test['reagent']}")
+                print(f"Expected Observation: {test['observation']}")
+                
+                if get_user_input("Did you observe this result? (y/n): ", _YN) == 'y':
+                    detected.append(ion)
+                    logging.info(f"Detected {ion} in {group_key}")
+                    self.print_reaction_details(ion)
+        
+        self._record_detected(detected)
+        return detected
+
     def save_results(self) -> bool:
         """Save analysis results to file"""
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        filename = f"{self.ion_type}_analysis_{timestamp}.txt"
+        filename = strftime(f"{self.ion_type}_analysis_%Y-%m-%d_%H-%M-%S.txt")
+        
+        parts = [
+            f"Qualitative Analysis Results - {self.ion_type.upper()}\n",
+            _BORDER + "\n",
+        ]
+        if not self._detected:
+            parts.append("No ions detected.\n")
+        else:
+            unique_ions = self.unique_ions
+            parts.append(f"Detected {self.ion_type}s: {', '.join(unique_ions)}\n\n")
+            parts.extend(_format_report_entry(self.ion_type, ion) for ion in unique_ions)
         
         try:
             with open(filename, 'w', encoding='utf-8') as f:
-                f.write(f"Qualitative Analysis Results - {self.ion_type.upper()}\n")
-                f.write("=" * MENU_WIDTH + "\n")
-                
-                if not self.detected_ions:
-                    f.write("No ions detected.\n")
-                else:
-                    unique_ions = sorted(set(self.detected_ions))
-                    f.write(f"Detected {self.ion_type}s: {', '.join(unique_ions)}\n\n")
-                    
-                    for ion in unique_ions:
-                        if ion in self.all_reactions:
-                            data = self.all_reactions[ion]
-                            test = data["confirmatory_test"]
-                            f.write(f"{ion}:\n")
-                            f.write(f"Test Method: {test['reagent']}\n")
-                            f.write(f"Observation: {test['observation']}\n")
-                            f.write(f"Reaction: {test['equation']}\n")
-                            f.write(f"Principle: {test['explanation']}\n\n")
+                f.write("".join(parts))
             
             print(f"\nResults saved to {filename}")
             logging.info(f"Results saved to {filename}")
@@ -184,25 +469,18 @@ class ChemicalAnalyzer:
 
     def show_detailed_results(self) -> None:
         """Display detailed results of analysis"""
-        if not self.detected_ions:
+        if not self._detected:
             print(f"\nNo {self.ion_type}s detected.")
             logging.info("No ions detected in results")
             return
         
-        unique_ions = sorted(set(self.detected_ions))
-        print(f"\n📋 Detected {self.ion_type}s:")
-        for ion in unique_ions:
-            print(f"- {ion}")
+        unique_ions = self.unique_ions
+        sys.stdout.write(f"\n📋 Detected {self.ion_type}s:\n- " + "\n- ".join(unique_ions) + "\n")
         
         while True:
-            print("\nResults Options:")
-            print("1. 📝 View all reaction details")
-            print("2. 🔍 View specific ion details")
-            print("3. 📊 View analysis summary")
-            print("4. 💾 Save results to file")
-            print("5. 🏠 Return to previous menu")
+            sys.stdout.write(_RESULTS_MENU)
             
-            choice = get_user_input("Select option (1-5): ", ['1', '2', '3', '4', '5'])
+            choice = get_menu_choice("Select option (1-5): ", _CHOICES_1_5)
             
             if choice == '1':
                 print(f"\n=== DETAILED {self.ion_type.upper()} RESULTS ===")
@@ -212,7 +490,7 @@ class ChemicalAnalyzer:
             elif choice == '2':
                 ion = get_user_input(
                     f"Enter {self.ion_type} to view (e.g., {unique_ions[0]}): ",
-                    unique_ions + ['back']
+                    (*unique_ions, 'back')
                 )
                 if ion != 'back':
                     self.print_reaction_details(ion)
@@ -238,37 +516,6 @@ class CationAnalyzer(ChemicalAnalyzer):
         super().__init__("cation")
         self.group_order = ["Group I", "Group II", "Group III", "Group IV", "Group V"]
     
-    def test_group(self, group_key: str) -> List[str]:
-        """Generic group testing function"""
-        detected = []
-        group = self.groups[group_key]
-        
-        display_header(group["title"])
-        print(group["description"])
-        print(f"\nSeparation Reagent: {group['separation_reagent']}")
-        
-        logging.info(f"Testing {group_key} - {group['title']}")
-        
-        # Get group-specific ions
-        ions = group["ions"].keys()
-        print(f"\nPossible ions in this group: {', '.join(ions)}")
-        
-        if get_user_input("\nDid precipitation occur? (y/n): ", ['y', 'n']) == 'y':
-            print("\nPerforming confirmatory tests...")
-            for ion in ions:
-                test = group["ions"][ion]["confirmatory_test"]
-                print(f"\nTesting for {ion}:")
-                print(f"Reagent: {test['reagent']}")
-                print(f"Expected Observation: {test['observation']}")
-                
-                if get_user_input("Did you observe this result? (y/n): ", ['y', 'n']) == 'y':
-                    detected.append(ion)
-                    logging.info(f"Detected {ion} in {group_key}")
-                    self.print_reaction_details(ion)
-        
-        self.detected_ions.extend(detected)
-        return detected
-
     def perform_full_analysis(self) -> None:
         """Perform complete cation analysis (Groups I-V)"""
         display_header("COMPLETE CATION ANALYSIS")
@@ -279,7 +526,7 @@ class CationAnalyzer(ChemicalAnalyzer):
             print(f"\nStarting {group_name} Analysis...")
             self.test_group(group_key)
             print(f"\n{group_name} Analysis Complete.")
-            if get_user_input("Continue to next group? (y/n): ", ['y', 'n']) != 'y':
+            if get_user_input("Continue to next group? (y/n): ", _YN) != 'y':
                 break
         
         self.show_detailed_results()
@@ -292,37 +539,6 @@ class AnionAnalyzer(ChemicalAnalyzer):
         super().__init__("anion")
         self.group_order = ["Group I", "Group II", "Group III"]
     
-    def test_group(self, group_key: str) -> List[str]:
-        """Generic group testing function"""
-        detected = []
-        group = self.groups[group_key]
-        
-        display_header(group["title"])
-        print(group["description"])
-        print(f"\nSeparation Reagent: {group['separation_reagent']}")
-        
-        logging.info(f"Testing {group_key} - {group['title']}")
-        
-        # Get group-specific ions
-        ions = group["ions"].keys()
-        print(f"\nPossible ions in this group: {', '.join(ions)}")
-        
-        if get_user_input("\nDid reaction occur? (y/n): ", ['y', 'n']) == 'y':
-            print("\nPerforming confirmatory tests...")
-            for ion in ions:
-                test = group["ions"][ion]["confirmatory_test"]
-                print(f"\nTesting for {ion}:")
-                print(f"Reagent: {test['reagent']}")
-                print(f"Expected Observation: {test['observation']}")
-                
-                if get_user_input("Did you observe this result? (y/n): ", ['y', 'n']) == 'y':
-                    detected.append(ion)
-                    logging.info(f"Detected {ion} in {group_key}")
-                    self.print_reaction_details(ion)
-        
-        self.detected_ions.extend(detected)
-        return detected
-
     def perform_full_analysis(self) -> None:
         """Perform complete anion analysis (Groups I-III)"""
         display_header("COMPLETE ANION ANALYSIS")
@@ -333,7 +549,7 @@ class AnionAnalyzer(ChemicalAnalyzer):
             print(f"\nStarting {group_name} Analysis...")
             self.test_group(group_key)
             print(f"\n{group_name} Analysis Complete.")
-            if get_user_input("Continue to next group? (y/n): ", ['y', 'n']) != 'y':
+            if get_user_input("Continue to next group? (y/n): ", _YN) != 'y':
                 break
         
         self.show_detailed_results()
@@ -343,73 +559,152 @@ class AnionAnalyzer(ChemicalAnalyzer):
 # MENU SYSTEM IMPLEMENTATION
 # ======================
 
+# Each menu body is rendered once and written to stdout in a single call
+_RESULTS_MENU = "\n".join((
+    "\nResults Options:",
+    "1. 📝 View all reaction details",
+    "2. 🔍 View specific ion details",
+    "3. 📊 View analysis summary",
+    "4. 💾 Save results to file",
+    "5. 🏠 Return to previous menu",
+)) + "\n"
+
+_EXIT_MENU = "\n".join((
+    "\nOptions:",
+    "1. ✅ Exit and save current sessions",
+    "2. ❌ Exit without saving",
+    "3. ↩ Return to program",
+)) + "\n"
+
+# Exit choice -> farewell message; choices without one return to the program
+_EXIT_MESSAGES = {
+    '1': "\nAll session data has been saved.",
+    '2': "\nNo data will be saved.",
+}
+
+_CATION_MENU = "\n".join((
+    "\nSelect analysis option:",
+    "1. 🔍 Complete Cation Analysis (Groups I-V)",
+    "2. 🔬 Analyze Specific Cation Group",
+    "3. 📊 View Current Results",
+    "4. 🏠 Return to Main Menu",
+)) + "\n"
+
+_ANION_MENU = "\n".join((
+    "\nSelect analysis option:",
+    "1. 🔍 Complete Anion Analysis (Groups I-III)",
+    "2. 🔬 Analyze Specific Anion Group",
+    "3. 📊 View Current Results",
+    "4. 🏠 Return to Main Menu",
+)) + "\n"
+
+_DATABASE_MENU = "\n".join((
+    "\nSelect option:",
+    "1. 🔎 Search by Ion",
+    "2. 📖 Browse All Reactions",
+    "3. 🧪 View Group-Wise Reactions",
+    "4. 🏠 Return to Main Menu",
+)) + "\n"
+
+_GROUP_TYPE_MENU = "\n".join((
+    "\nSelect group type:",
+    "1. Cation Groups",
+    "2. Anion Groups",
+    "3. Back to Database Menu",
+)) + "\n"
+
+_MAIN_MENU = "\n".join((
+    "\nSelect an option:",
+    "1. ⚗️ Cation Analysis",
+    "2. 🧪 Anion Analysis",
+    "3. 📚 Chemical Reaction Database",
+    "4. 🤖 Virtual Lab Assistant",
+    "5. ℹ️ Program Information",
+    "6. ❌ Exit Program",
+)) + "\n"
+
+def _group_menu(group_map: Dict[str, Tuple[str, str]], back_label: str) -> str:
+    """Render a numbered group-selection menu"""
+    lines = [f"{num}. {name}" for num, (name, _) in group_map.items()]
+    lines.append(f"0. ↩ Back to {back_label}")
+    return "\n".join(lines) + "\n"
+
+# Menu number -> (display name, database group key)
+_CATION_GROUP_MAP: Dict[str, Tuple[str, str]] = {
+    '1': ("Group I (HCl Group)", "Group I"),
+    '2': ("Group II (H₂S Acidic)", "Group II"),
+    '3': ("Group III (NH₄OH)", "Group III"),
+    '4': ("Group IV (H₂S Basic)", "Group IV"),
+    '5': ("Group V (Carbonate)", "Group V")
+}
+_ANION_GROUP_MAP: Dict[str, Tuple[str, str]] = {
+    '1': ("Group I (Dilute H₂SO₄)", "Group I"),
+    '2': ("Group II (Conc. H₂SO₄)", "Group II"),
+    '3': ("Group III (Special Tests)", "Group III")
+}
+
+_CATION_GROUP_MENU = f"\nAvailable Cation Groups:\n{_group_menu(_CATION_GROUP_MAP, 'Cation Menu')}"
+_ANION_GROUP_MENU = f"\nAvailable Anion Groups:\n{_group_menu(_ANION_GROUP_MAP, 'Anion Menu')}"
+
+# Valid answers follow the maps, plus '0' to cancel
+_CATION_GROUP_CHOICES = frozenset(_CATION_GROUP_MAP) | {'0'}
+_ANION_GROUP_CHOICES = frozenset(_ANION_GROUP_MAP) | {'0'}
+
 def confirm_exit() -> bool:
     """Confirm program exit"""
     clear_screen()
     display_header("EXIT PROGRAM")
     
-    print("\nOptions:")
-    print("1. ✅ Exit and save current sessions")
-    print("2. ❌ Exit without saving")
-    print("3. ↩ Return to program")
+    sys.stdout.write(_EXIT_MENU)
     
-    choice = get_user_input("\nEnter your choice (1-3): ", ['1', '2', '3'])
-    
-    if choice == '1':
-        print("\nAll session data has been saved.")
-        return True
-    elif choice == '2':
-        print("\nNo data will be saved.")
-        return True
-    return False
+    farewell = _EXIT_MESSAGES.get(get_menu_choice("\nEnter your choice (1-3): ", _CHOICES_1_3))
+    if farewell is None:
+        return False
+    print(farewell)
+    return True
 
 
 def cation_analysis_menu(analyzer: CationAnalyzer) -> None:
     """Cation analysis menu"""
+    # Choice -> (action, pause afterwards); None returns to the main menu
+    actions = {
+        '1': (analyzer.perform_full_analysis, True),
+        '2': (lambda: analyze_specific_cation_group(analyzer), False),
+        '3': (analyzer.show_detailed_results, True),
+        '4': None,
+    }
+    
     while True:
         clear_screen()
         display_header("CATION ANALYSIS")
         
-        print("\nSelect analysis option:")
-        print("1. 🔍 Complete Cation Analysis (Groups I-V)")
-        print("2. 🔬 Analyze Specific Cation Group")
-        print("3. 📊 View Current Results")
-        print("4. 🏠 Return to Main Menu")
-        
-        choice = get_user_input("\nEnter your choice (1-4): ", ['1', '2', '3', '4'])
+        sys.stdout.write(_CATION_MENU)
         
-        if choice == '1':
-            analyzer.perform_full_analysis()
-            input("\nPress Enter to continue...")
-        elif choice == '2':
-            analyze_specific_cation_group(analyzer)
-        elif choice == '3':
-            analyzer.show_detailed_results()
-            input("\nPress Enter to continue...")
-        elif choice == '4':
+        action = actions[get_menu_choice("\nEnter your choice (1-4): ", _CHOICES_1_4)]
+        if action is None:
             break
+        run, pause = action
+        run()
+        if pause:
+            input("\nPress Enter to continue...")
 
-def analyze_specific_cation_group(analyzer: CationAnalyzer) -> None:
-    """Menu for selecting specific cation groups"""
-    group_map = {
-        '1': ("Group I (HCl Group)", "Group I"),
-        '2': ("Group II (H₂S Acidic)", "Group II"),
-        '3': ("Group III (NH₄OH)", "Group III"),
-        '4': ("Group IV (H₂S Basic)", "Group IV"),
-        '5': ("Group V (Carbonate)", "Group V")
-    }
+def _analyze_specific_group(
+    analyzer: ChemicalAnalyzer,
+    group_map: Dict[str, Tuple[str, str]],
+    menu: str,
+    choices: Collection[str],
+) -> None:
+    """Shared group-selection loop behind the cation and anion submenus"""
+    label = analyzer.ion_type.upper()
+    prompt = f"\nSelect group to analyze (1-{len(group_map)}) or 0 to cancel: "
     
     while True:
         clear_screen()
-        display_header("SELECT CATION GROUP")
+        display_header(f"SELECT {label} GROUP")
         
-        print("\nAvailable Cation Groups:")
-        for num, (name, _) in group_map.items():
-            print(f"{num}. {name}")
-        print("0. ↩ Back to Cation Menu")
+        sys.stdout.write(menu)
         
-        choice = get_user_input("\nSelect group to analyze (1-5) or 0 to cancel: ", 
-                              ['0', '1', '2', '3', '4', '5'])
+        choice = get_menu_choice(prompt, choices)
         
         if choice == '0':
             break
@@ -421,94 +716,52 @@ def analyze_specific_cation_group(analyzer: CationAnalyzer) -> None:
             
             detected = analyzer.test_group(group_key)
             if detected:
-                print("\nDetected ions:")
-                for ion in detected:
-                    print(f"- {ion}")
+                sys.stdout.write("\nDetected ions:\n- " + "\n- ".join(detected) + "\n")
                 
-                detail = get_user_input("\nView reaction details for these ions? (y/n): ", ['y', 'n'])
+                detail = get_user_input("\nView reaction details for these ions? (y/n): ", _YN)
                 if detail == 'y':
                     for ion in detected:
                         analyzer.print_reaction_details(ion)
                 
-                save = get_user_input("\nSave these results? (y/n): ", ['y', 'n'])
+                save = get_user_input("\nSave these results? (y/n): ", _YN)
                 if save == 'y':
                     analyzer.save_results()
             else:
-                print("\nNo cations detected in this group.")
+                print(f"\nNo {analyzer.ion_type}s detected in this group.")
             
             input("\nPress Enter to continue...")
 
+def analyze_specific_cation_group(analyzer: CationAnalyzer) -> None:
+    """Menu for selecting specific cation groups"""
+    _analyze_specific_group(analyzer, _CATION_GROUP_MAP, _CATION_GROUP_MENU, _CATION_GROUP_CHOICES)
+
 def anion_analysis_menu(analyzer: AnionAnalyzer) -> None:
     """Anion analysis menu"""
+    # Choice -> (action, pause afterwards); None returns to the main menu
+    actions = {
+        '1': (analyzer.perform_full_analysis, True),
+        '2': (lambda: analyze_specific_anion_group(analyzer), False),
+        '3': (analyzer.show_detailed_results, True),
+        '4': None,
+    }
+    
     while True:
         clear_screen()
         display_header("ANION ANALYSIS")
         
-        print("\nSelect analysis option:")
-        print("1. 🔍 Complete Anion Analysis (Groups I-III)")
-        print("2. 🔬 Analyze Specific Anion Group")
-        print("3. 📊 View Current Results")
-        print("4. 🏠 Return to Main Menu")
+        sys.stdout.write(_ANION_MENU)
         
-        choice = get_user_input("\nEnter your choice (1-4): ", ['1', '2', '3', '4'])
-        
-        if choice == '1':
-            analyzer.perform_full_analysis()
-            input("\nPress Enter to continue...")
-        elif choice == '2':
-            analyze_specific_anion_group(analyzer)
-        elif choice == '3':
-            analyzer.show_detailed_results()
-            input("\nPress Enter to continue...")
-        elif choice == '4':
+        action = actions[get_menu_choice("\nEnter your choice (1-4): ", _CHOICES_1_4)]
+        if action is None:
             break
+        run, pause = action
+        run()
+        if pause:
+            input("\nPress Enter to continue...")
 
 def analyze_specific_anion_group(analyzer: AnionAnalyzer) -> None:
     """Menu for selecting specific anion groups"""
-    group_map = {
-        '1': ("Group I (Dilute H₂SO₄)", "Group I"),
-        '2': ("Group II (Conc. H₂SO₄)", "Group II"),
-        '3': ("Group III (Special Tests)", "Group III")
-    }
-    
-    while True:
-        clear_screen()
-        display_header("SELECT ANION GROUP")
-        
-        print("\nAvailable Anion Groups:")
-        for num, (name, _) in group_map.items():
-            print(f"{num}. {name}")
-        print("0. ↩ Back to Anion Menu")
-        
-        choice = get_user_input("\nSelect group to analyze (1-3) or 0 to cancel: ", 
-                              ['0', '1', '2', '3'])
-        
-        if choice == '0':
-            break
-            
-        if choice in group_map:
-            group_name, group_key = group_map[choice]
-            clear_screen()
-            display_header(group_name.upper())
-            
-            detected = analyzer.test_group(group_key)
-            if detected:
-                print("\nDetected ions:")
-                for ion in detected:
-                    print(f"- {ion}")
-                
-                detail = get_user_input("\nView reaction details for these ions? (y/n): ", ['y', 'n'])
-                if detail == 'y':
-                    for ion in detected:
-                        analyzer.print_reaction_details(ion)
-                
-                save = get_user_input("\nSave these results? (y/n): ", ['y', 'n'])
-                if save == 'y':
-                    analyzer.save_results()
-            else:
-                print("\nNo anions detected in this group.")
-            
-            input("\nPress Enter to continue...")
+    _analyze_specific_group(analyzer, _ANION_GROUP_MAP, _ANION_GROUP_MENU, _ANION_GROUP_CHOICES)
 
 def reaction_database_menu() -> None:
     """Chemical reaction database browser"""
@@ -516,62 +769,34 @@ def reaction_database_menu() -> None:
         clear_screen()
         display_header("CHEMICAL REACTION DATABASE")
         
-        print("\nSelect option:")
-        print("1. 🔎 Search by Ion")
-        print("2. 📖 Browse All Reactions")
-        print("3. 🧪 View Group-Wise Reactions")
-        print("4. 🏠 Return to Main Menu")
-        
-        choice = get_user_input("\nEnter your choice (1-4): ", ['1', '2', '3', '4'])
+        sys.stdout.write(_DATABASE_MENU)
         
-        if choice == '1':
-            search_ion_reactions()
-            input("\nPress Enter to continue...")
-        elif choice == '2':
-            browse_all_reactions()
-            input("\nPress Enter to continue...")
-        elif choice == '3':
-            view_group_reactions()
-            input("\nPress Enter to continue...")
-        elif choice == '4':
+        action = _DATABASE_ACTIONS[get_menu_choice("\nEnter your choice (1-4): ", _CHOICES_1_4)]
+        if action is None:
             break
+        action()
+        input("\nPress Enter to continue...")
 
 def virtual_lab_assistant() -> None:
     """Virtual lab assistant feature"""
     clear_screen()
     display_header("VIRTUAL LAB ASSISTANT")
     
-    print("\nThis feature provides:")
-    print("- 🧑‍🔬 Step-by-step procedure guidance")
-    print("- ⚠️  Safety precautions for each test")
-    print("- 🎥 Video demonstration links")
-    print("- 📝 Lab report templates")
-    print("\nComing in future versions!")
+    sys.stdout.write(_LAB_ASSISTANT_TEXT)
     
     input("\nPress Enter to return to main menu...")
 
+@lru_cache(maxsize=1)
+def _program_info_text() -> str:
+    """Render the program information screen from the database metadata"""
+    return _PROGRAM_INFO_TEMPLATE.format_map(chemical_db["metadata"])
+
 def show_program_info() -> None:
     """Display program information"""
     clear_screen()
     display_header("PROGRAM INFORMATION")
     
-    print(f"""
-QUALITATIVE CHEMICAL ANALYSIS SYSTEM
-Version: {chemical_db['metadata']['version']}
-Last Updated: {chemical_db['metadata']['revision_date']}
-
-Database System: {chemical_db['metadata']['group_system']}
-Reference: {chemical_db['metadata']['reference']}
-
-Developed for educational purposes to assist in:
-- Systematic qualitative chemical analysis
-- Identification of cations and anions
-- Understanding chemical reactions and principles
-
-Safety Notice:
-Always perform chemical tests under proper supervision
-and with appropriate safety equipment.
-""")
+    sys.stdout.write(_program_info_text())
     
     input("\nPress Enter to return to main menu...")
 
@@ -580,19 +805,7 @@ def browse_all_reactions() -> None:
     clear_screen()
     display_header("ALL CHEMICAL REACTIONS")
     
-    print("\nCATIONS:")
-    for group in chemical_db['cations'].values():
-        for ion, data in group['ions'].items():
-            print(f"\n{ion}:")
-            print(f"Test: {data['confirmatory_test']['reagent']}")
-            print(f"Reaction: {data['confirmatory_test']['equation']}")
-    
-    print("\nANIONS:")
-    for group in chemical_db['anions'].values():
-        for ion, data in group['ions'].items():
-            print(f"\n{ion}:")
-            print(f"Test: {data['confirmatory_test']['reagent']}")
-            print(f"Reaction: {data['confirmatory_test']['equation']}")
+    sys.stdout.write(_BROWSE_TEXT)
 
 def search_ion_reactions() -> None:
     """Search for specific ion reactions"""
@@ -604,28 +817,19 @@ def search_ion_reactions() -> None:
         if ion.lower() == 'back':
             break
         
-        found = False
-        # Search cations
-        for group in chemical_db['cations'].values():
-            if ion in group['ions']:
-                data = group['ions'][ion]
-                print(f"\nCATION FOUND: {ion}")
-                print(f"Test: {data['confirmatory_test']['reagent']}")
-                print(f"Reaction: {data['confirmatory_test']['equation']}")
-                found = True
-                
-        # Search anions
-        for group in chemical_db['anions'].values():
-            if ion in group['ions']:
-                data = group['ions'][ion]
-                print(f"\nANION FOUND: {ion}")
-                print(f"Test: {data['confirmatory_test']['reagent']}")
-                print(f"Reaction: {data['confirmatory_test']['equation']}")
-                found = True
-                
-        if not found:
-            print(f"\nIon '{ion}' not found in databases.")
-            print("Try using standard notation (e.g., Fe³⁺, SO₄²⁻)")
+        hits = _ALL_REACTIONS.get(ion)
+        if hits:
+            sys.stdout.write("".join(
+                f"\n{kind} FOUND: {ion}\n"
+                f"Test: {data['confirmatory_test']['reagent']}\n"
+                f"Reaction: {data['confirmatory_test']['equation']}\n"
+                for kind, data in hits
+            ))
+        else:
+            sys.stdout.write(
+                f"\nIon '{ion}' not found in databases.\n"
+                "Try using standard notation (e.g., Fe³⁺, SO₄²⁻)\n"
+            )
 
 def view_group_reactions() -> None:
     """Display reactions organized by analysis groups"""
@@ -633,68 +837,63 @@ def view_group_reactions() -> None:
         clear_screen()
         display_header("GROUP-WISE REACTIONS")
         
-        print("\nSelect group type:")
-        print("1. Cation Groups")
-        print("2. Anion Groups")
-        print("3. Back to Database Menu")
-        
-        choice = get_user_input("\nEnter choice (1-3): ", ['1', '2', '3'])
+        sys.stdout.write(_GROUP_TYPE_MENU)
         
-        if choice == '1':
-            print("\nCATION GROUPS:")
-            for group_name, group in chemical_db['cations'].items():
-                print(f"\n{group['title']}:")
-                for ion in group['ions']:
-                    print(f"  {ion}: {group['ions'][ion]['confirmatory_test']['reagent']}")
+        choice = get_menu_choice("\nEnter choice (1-3): ", _CHOICES_1_3)
         
-        elif choice == '2':
-            print("\nANION GROUPS:")
-            for group_name, group in chemical_db['anions'].items():
-                print(f"\n{group['title']}:")
-                for ion in group['ions']:
-                    print(f"  {ion}: {group['ions'][ion]['confirmatory_test']['reagent']}")
-        
-        elif choice == '3':
+        if choice == '3':
             break
+        sys.stdout.write(_CATION_GROUP_SUMMARY if choice == '1' else _ANION_GROUP_SUMMARY)
         
         input("\nPress Enter to continue...")
 
+def _start_cation_analysis() -> None:
+    """Open the cation menu with a fresh analyzer"""
+    cation_analysis_menu(CationAnalyzer())
+
+def _start_anion_analysis() -> None:
+    """Open the anion menu with a fresh analyzer"""
+    anion_analysis_menu(AnionAnalyzer())
+
+# Choice -> handler; None returns to the main menu
+_DATABASE_ACTIONS = {
+    '1': search_ion_reactions,
+    '2': browse_all_reactions,
+    '3': view_group_reactions,
+    '4': None,
+}
+
+# Choice -> handler; a truthy return value ends the main loop
+_MAIN_ACTIONS = {
+    '1': _start_cation_analysis,
+    '2': _start_anion_analysis,
+    '3': reaction_database_menu,
+    '4': virtual_lab_assistant,
+    '5': show_program_info,
+    '6': confirm_exit,
+}
+
 def main_menu() -> None:
     """Main menu for the program"""
     while True:
         clear_screen()
         display_header("MAIN MENU")
         
-        print("\nSelect an option:")
-        print("1. ⚗️ Cation Analysis")
-        print("2. 🧪 Anion Analysis")
-        print("3. 📚 Chemical Reaction Database")
-        print("4. 🤖 Virtual Lab Assistant")
-        print("5. ℹ️ Program Information")
-        print("6. ❌ Exit Program")
-        
-        choice = get_user_input("\nEnter your choice (1-6): ", ['1', '2', '3', '4', '5', '6'])
-        
-        if choice == '1':
-            cation_analyzer = CationAnalyzer()
-            cation_analysis_menu(cation_analyzer)
-        elif choice == '2':
-            anion_analyzer = AnionAnalyzer()
-            anion_analysis_menu(anion_analyzer)
-        elif choice == '3':
-            reaction_database_menu()
-        elif choice == '4':
-            virtual_lab_assistant()
-        elif choice == '5':
-            show_program_info()
-        elif choice == '6':
-            if confirm_exit():
-                break
+        sys.stdout.write(_MAIN_MENU)
+        
+        choice = get_menu_choice("\nEnter your choice (1-6): ", _MAIN_CHOICES)
+        if _MAIN_ACTIONS[choice]():
+            break
 
 # ======================
 # PROGRAM INITIALIZATION
 # ======================
+def _handle_sigterm(signum: int, frame: object) -> None:
+    """Turn SIGTERM into SystemExit so the shutdown path below still runs"""
+    raise SystemExit(128 + signum)
+
 if __name__ == "__main__":
+    signal.signal(signal.SIGTERM, _handle_sigterm)
     try:
         setup_logging()
         logging.info("Program started")
@@ -704,18 +903,23 @@ if __name__ == "__main__":
             
         clear_screen()
         display_header("QUALITATIVE CHEMICAL ANALYSIS SYSTEM")
-        print(f"\nLoaded database version {chemical_db['metadata']['version']}")
-        print(f"Last updated: {chemical_db['metadata']['revision_date']}")
+        metadata = chemical_db['metadata']
+        sys.stdout.write(
+            f"\nLoaded database version {metadata['version']}\n"
+            f"Last updated: {metadata['revision_date']}\n"
+        )
         
         # Display safety reminder
         display_header("SAFETY FIRST!")
-        print("\nThis program assists with chemical analysis but")
-        print("cannot replace proper lab safety procedures.")
-        print("Always wear appropriate PPE when performing tests.")
+        sys.stdout.write(_SAFETY_TEXT)
         
         input("\nPress Enter to continue to main menu...")
         main_menu()
         
+    except (KeyboardInterrupt, EOFError):
+        # Interrupted outside a validated prompt (e.g. "Press Enter"); no traceback
+        logging.info("Program interrupted by user")
+        print()
     except Exception as e:
         logging.critical(f"Program crashed: {str(e)}", exc_info=True)
         print(f"\nA critical error occurred: {str(e)}")
@@ -1,3 +1,9 @@
+# ======================
+# IMPORTS
+# ======================
+import sys
+from functools import lru_cache
+
 # ======================
 # CHEMICAL REACTION DATA
 # ======================
@@ -69,15 +75,22 @@ ANION_REACTIONS = {
 # CORE FUNCTIONS
 # ======================
 
+@lru_cache(maxsize=None)
+def _format_reaction(ion):
+    """Build the reaction details block shown for an ion"""
+    if ion in ANION_REACTIONS:
+        data = ANION_REACTIONS[ion]
+        return (
+            f"\nReaction Details for {ion}:\n"
+            f"Test Method: {data['test']}\n"
+            f"Chemical Equation:\n{data['reaction']}\n"
+            f"Scientific Principle: {data['reason']}\n"
+        )
+    return f"\nNote: No reaction details available for {ion}\n"
+
 def print_reaction_explanation(ion):
     """Display detailed chemical explanation for detected ion"""
-    if ion in ANION_REACTIONS:
-        print(f"\nReaction Details for {ion}:")
-        print(f"Test Method: {ANION_REACTIONS[ion]['test']}")
-        print(f"Chemical Equation:\n{ANION_REACTIONS[ion]['reaction']}")
-        print(f"Scientific Principle: {ANION_REACTIONS[ion]['reason']}")
-    else:
-        print(f"\nNote: No reaction details available for {ion}")
+    sys.stdout.write(_format_reaction(ion))
 
 def get_user_input(prompt, options=None):
     """Get validated user input"""
@@ -91,6 +104,35 @@ def get_user_input(prompt, options=None):
 # GROUP TEST FUNCTIONS
 # ======================
 
+# Observation -> (follow-up confirmation prompt or None, anion, confirmation message)
+GROUP_I_TREE = {
+    "effervescence": ("Pass gas through lime water. White precipitate? (y/n): ",
+                      "CO₃²⁻", "Effervescence and white precipitate"),
+    "rotten egg": ("Expose lead acetate paper. Turns black? (y/n): ",
+                   "S²⁻", "Rotten egg smell and black precipitate"),
+    "brown": (None, "NO₂⁻", "Brown fumes"),
+    "vinegar": (None, "CH₃COO⁻", "Vinegar smell"),
+}
+
+GROUP_II_TREE = {
+    "white": ("Add AgNO₃. White precipitate soluble in NH₄OH? (y/n): ",
+              "Cl⁻", "White fumes and soluble precipitate"),
+    "yellow": ("Add AgNO₃. Pale yellow precipitate? (y/n): ",
+               "Br⁻", "Yellow fumes and precipitate"),
+    "violet": ("Add AgNO₃. Yellow precipitate insoluble in NH₄OH? (y/n): ",
+               "I⁻", "Violet fumes and insoluble precipitate"),
+    "brown": ("Perform brown ring test (FeSO₄ + H₂SO₄). Ring formed? (y/n): ",
+              "NO₃⁻", "Brown ring test positive"),
+}
+
+def run_decision_tree(tree, observation, detected):
+    """Confirm the anion indicated by an observation, appending it to detected"""
+    followup, ion, message = tree[observation]
+    if followup is None or get_user_input(followup, ['y', 'n']) == 'y':
+        detected.append(ion)
+        print(f"-> {ion} confirmed: {message}")
+        print_reaction_explanation(ion)
+
 def test_group_i():
     """Test for Group I anions (CO₃²⁻, S²⁻, NO₂⁻, CH₃COO⁻)"""
     detected = []
@@ -98,29 +140,8 @@ def test_group_i():
     
     if get_user_input("Add dilute H₂SO₄. Gas evolved? (y/n): ", ['y', 'n']) == 'y':
         gas_type = get_user_input("Describe the gas (effervescence/rotten egg/brown/vinegar): ",
-                                ['effervescence', 'rotten egg', 'brown', 'vinegar'])
-        
-        if gas_type == "effervescence":
-            if get_user_input("Pass gas through lime water. White precipitate? (y/n): ", ['y', 'n']) == 'y':
-                detected.append("CO₃²⁻")
-                print("-> CO₃²⁻ confirmed: Effervescence and white precipitate")
-                print_reaction_explanation("CO₃²⁻")
-        
-        elif gas_type == "rotten egg":
-            if get_user_input("Expose lead acetate paper. Turns black? (y/n): ", ['y', 'n']) == 'y':
-                detected.append("S²⁻")
-                print("-> S²⁻ confirmed: Rotten egg smell and black precipitate")
-                print_reaction_explanation("S²⁻")
-        
-        elif gas_type == "brown":
-            detected.append("NO₂⁻")
-            print("-> NO₂⁻ confirmed: Brown fumes")
-            print_reaction_explanation("NO₂⁻")
-        
-        elif gas_type == "vinegar":
-            detected.append("CH₃COO⁻")
-            print("-> CH₃COO⁻ confirmed: Vinegar smell")
-            print_reaction_explanation("CH₃COO⁻")
+                                GROUP_I_TREE)
+        run_decision_tree(GROUP_I_TREE, gas_type, detected)
     
     return detected
 
@@ -131,31 +152,8 @@ def test_group_ii():
     
     if get_user_input("Add conc. H₂SO₄. Colored fumes observed? (y/n): ", ['y', 'n']) == 'y':
         fume_color = get_user_input("Fume color (white/yellow/violet/brown): ",
-                                  ['white', 'yellow', 'violet', 'brown'])
-        
-        if fume_color == "white":
-            if get_user_input("Add AgNO₃. White precipitate soluble in NH₄OH? (y/n): ", ['y', 'n']) == 'y':
-                detected.append("Cl⁻")
-                print("-> Cl⁻ confirmed: White fumes and soluble precipitate")
-                print_reaction_explanation("Cl⁻")
-        
-        elif fume_color == "yellow":
-            if get_user_input("Add AgNO₃. Pale yellow precipitate? (y/n): ", ['y', 'n']) == 'y':
-                detected.append("Br⁻")
-                print("-> Br⁻ confirmed: Yellow fumes and precipitate")
-                print_reaction_explanation("Br⁻")
-        
-        elif fume_color == "violet":
-            if get_user_input("Add AgNO₃. Yellow precipitate insoluble in NH₄OH? (y/n): ", ['y', 'n']) == 'y':
-                detected.append("I⁻")
-                print("-> I⁻ confirmed: Violet fumes and insoluble precipitate")
-                print_reaction_explanation("I⁻")
-        
-        elif fume_color == "brown":
-            if get_user_input("Perform brown ring test (FeSO₄ + H₂SO₄). Ring formed? (y/n): ", ['y', 'n']) == 'y':
-                detected.append("NO₃⁻")
-                print("-> NO₃⁻ confirmed: Brown ring test positive")
-                print_reaction_explanation("NO₃⁻")
+                                  GROUP_II_TREE)
+        run_decision_tree(GROUP_II_TREE, fume_color, detected)
     
     return detected
 
@@ -207,11 +205,12 @@ def main():
         print("Detected anions:", ", ".join(unique_anions))
         
         # Print summary of all detected anions
-        print("\n=== SUMMARY OF DETECTED ANIONS ===")
-        for anion in unique_anions:
-            print(f"\n{anion}:")
-            print(f"Test Method: {ANION_REACTIONS[anion]['test']}")
-            print(f"Reaction: {ANION_REACTIONS[anion]['reaction']}")
+        sys.stdout.write("\n=== SUMMARY OF DETECTED ANIONS ===\n" + "".join(
+            f"\n{anion}:\n"
+            f"Test Method: {ANION_REACTIONS[anion]['test']}\n"
+            f"Reaction: {ANION_REACTIONS[anion]['reaction']}\n"
+            for anion in unique_anions
+        ))
     else:
         print("No anions detected.")
 
@@ -1,3 +1,9 @@
+# ======================
+# IMPORTS
+# ======================
+import sys
+from functools import lru_cache
+
 # ======================
 # CHEMICAL REACTION DATA
 # ======================
@@ -124,15 +130,22 @@ CATION_REACTIONS = {
 # CORE FUNCTIONS
 # ======================
 
+@lru_cache(maxsize=None)
+def _format_reaction(ion):
+    """Build the reaction details block shown for an ion"""
+    if ion in CATION_REACTIONS:
+        data = CATION_REACTIONS[ion]
+        return (
+            f"\nReaction Details for {ion}:\n"
+            f"Test Method: {data['test']}\n"
+            f"Chemical Equation: {data['reaction']}\n"
+            f"Scientific Principle: {data['reason']}\n"
+        )
+    return f"\nNote: No reaction details available for {ion}\n"
+
 def print_reaction_explanation(ion):
     """Display detailed chemical explanation for detected ion"""
-    if ion in CATION_REACTIONS:
-        print(f"\nReaction Details for {ion}:")
-        print(f"Test Method: {CATION_REACTIONS[ion]['test']}")
-        print(f"Chemical Equation: {CATION_REACTIONS[ion]['reaction']}")
-        print(f"Scientific Principle: {CATION_REACTIONS[ion]['reason']}")
-    else:
-        print(f"\nNote: No reaction details available for {ion}")
+    sys.stdout.write(_format_reaction(ion))
 
 def get_user_input(prompt, options=None):
     """Get validated user input"""
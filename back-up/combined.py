@@ -7,27 +7,30 @@
 # IMPORT SECTION
 # ======================
 import os
-from datetime import datetime
+from time import strftime
+from functools import lru_cache
 import sys
+import shutil
+from types import MappingProxyType
 # ======================
 # CHEMICAL REACTION DATA
 # ======================
 
 CATION_REACTIONS = {
     # Group I (HCl Group)
-    "Pb²⁺": {
+    ("I", "Pb²⁺"): {
         "test": "Hot water + K₂CrO₄",
         "reaction": "Pb²⁺ + CrO₄²⁻ → PbCrO₄↓ (yellow)",
         "reason": "Forms insoluble lead chromate (Ksp = 2.8×10⁻¹³)",
         "group": "I"
     },
-    "Ag⁺": {
+    ("I", "Ag⁺"): {
         "test": "NH₄OH dissolution + HNO₃",
         "reaction": "AgCl + 2NH₃ → [Ag(NH₃)₂]⁺ (soluble complex)",
         "reason": "Forms diamminesilver(I) complex (Kf = 1.1×10⁷)",
         "group": "I"
     },
-    "Hg₂²⁺": {
+    ("I", "Hg₂²⁺"): {
         "test": "Black residue with NH₄OH",
         "reaction": "Hg₂Cl₂ + 2NH₃ → Hg↓ + HgNH₂Cl↓ + NH₄⁺",
         "reason": "Disproportionation reaction",
@@ -35,25 +38,25 @@ CATION_REACTIONS = {
     },
 
     # Group II (H₂S Acidic Group)
-    "Cu²⁺": {
+    ("II", "Cu²⁺"): {
         "test": "NH₄OH deep blue solution",
         "reaction": "Cu²⁺ + 4NH₃ → [Cu(NH₃)₄]²⁺",
         "reason": "Forms tetraamminecopper(II) complex (λmax ≈ 600 nm)",
         "group": "II"
     },
-    "Pb²⁺": {
+    ("II", "Pb²⁺"): {
         "test": "K₂CrO₄ yellow precipitate",
         "reaction": "Pb²⁺ + CrO₄²⁻ → PbCrO₄↓",
         "reason": "Confirmatory test after Group I separation",
         "group": "II"
     },
-    "Bi³⁺": {
+    ("II", "Bi³⁺"): {
         "test": "SnCl₂ reduction",
         "reaction": "2Bi³⁺ + 3Sn²⁺ → 2Bi↓ + 3Sn⁴⁺",
         "reason": "Redox reaction (E° = 0.32V for Bi³⁺/Bi)",
         "group": "II"
     },
-    "As³⁺/⁵⁺": {
+    ("II", "As³⁺/⁵⁺"): {
         "test": "(NH₄)₂Sx dissolution",
         "reaction": "As₂S₃ + 3S²⁻ → 2AsS₃³⁻",
         "reason": "Forms soluble thioarsenite complex",
@@ -61,19 +64,19 @@ CATION_REACTIONS = {
     },
 
     # Group III (NH₄OH/NH₄Cl Group)
-    "Fe³⁺": {
+    ("III", "Fe³⁺"): {
         "test": "K₄[Fe(CN)₆]",
         "reaction": "4Fe³⁺ + 3[Fe(CN)₆]⁴⁻ → Fe₄[Fe(CN)₆]₃↓ (Prussian blue)",
         "reason": "Mixed-valence iron cyanide complex",
         "group": "III"
     },
-    "Al³⁺": {
+    ("III", "Al³⁺"): {
         "test": "Aluminon reagent",
         "reaction": "Al³⁺ + aluminon → red lake complex",
         "reason": "Chelation with aurintricarboxylic acid",
         "group": "III"
     },
-    "Cr³⁺": {
+    ("III", "Cr³⁺"): {
         "test": "NaOH/H₂O₂ + Pb(OAc)₂",
         "reaction": "Cr³⁺ → CrO₄²⁻ → PbCrO₄↓ (yellow)",
         "reason": "Oxidation to chromate followed by precipitation",
@@ -81,25 +84,25 @@ CATION_REACTIONS = {
     },
 
     # Group IV (H₂S Basic Group)
-    "Zn²⁺": {
+    ("IV", "Zn²⁺"): {
         "test": "NaOH solubility",
         "reaction": "Zn²⁺ + 2OH⁻ → Zn(OH)₂↓ → [Zn(OH)₄]²⁻",
         "reason": "Amphoteric behavior",
         "group": "IV"
     },
-    "Mn²⁺": {
+    ("IV", "Mn²⁺"): {
         "test": "NaBiO₃ oxidation",
         "reaction": "2Mn²⁺ + 5NaBiO₃ + 14H⁺ → 2MnO₄⁻ + 5Bi³⁺ + 5Na⁺ + 7H₂O",
         "reason": "Oxidation to purple permanganate",
         "group": "IV"
     },
-    "Ni²⁺": {
+    ("IV", "Ni²⁺"): {
         "test": "Dimethylglyoxime",
         "reaction": "Ni²⁺ + 2dmgH → [Ni(dmg)₂]↓ (red)",
         "reason": "Square planar chelate complex",
         "group": "IV"
     },
-    "Co²⁺": {
+    ("IV", "Co²⁺"): {
         "test": "NH₄SCN complex",
         "reaction": "Co²⁺ + 4SCN⁻ → [Co(SCN)₄]²⁻ (blue)",
         "reason": "Tetrahedral thiocyanate complex",
@@ -107,19 +110,19 @@ CATION_REACTIONS = {
     },
 
     # Group V ((NH₄)₂CO₃ Group)
-    "Ba²⁺": {
+    ("V", "Ba²⁺"): {
         "test": "Flame test (green)",
         "reaction": "Ba²⁺ → Ba* (excited state)",
         "reason": "Emission at 524 nm (green)",
         "group": "V"
     },
-    "Sr²⁺": {
+    ("V", "Sr²⁺"): {
         "test": "Flame test (crimson)",
         "reaction": "Sr²⁺ → Sr* (excited state)",
         "reason": "Emission at 650-680 nm (red)",
         "group": "V"
     },
-    "Ca²⁺": {
+    ("V", "Ca²⁺"): {
         "test": "Flame test (brick-red)",
         "reaction": "Ca²⁺ → Ca* (excited state)",
         "reason": "Emission at 622 nm (orange-red)",
@@ -127,25 +130,25 @@ CATION_REACTIONS = {
     },
 
     # Group VI (Soluble Group)
-    "NH₄⁺": {
+    ("VI", "NH₄⁺"): {
         "test": "NaOH + heat",
         "reaction": "NH₄⁺ + OH⁻ → NH₃↑ + H₂O",
         "reason": "Ammonia gas detection",
         "group": "VI"
     },
-    "Mg²⁺": {
+    ("VI", "Mg²⁺"): {
         "test": "Magneson reagent",
         "reaction": "Mg²⁺ + magneson → blue lake complex",
         "reason": "Adsorption indicator reaction",
         "group": "VI"
     },
-    "Na⁺": {
+    ("VI", "Na⁺"): {
         "test": "Flame test (yellow)",
         "reaction": "Na⁺ → Na* (excited state)",
         "reason": "Emission at 589 nm (D-line)",
         "group": "VI"
     },
-    "K⁺": {
+    ("VI", "K⁺"): {
         "test": "Flame test (violet)",
         "reaction": "K⁺ → K* (excited state)",
         "reason": "Emission at 766/770 nm",
@@ -227,367 +230,319 @@ ANION_REACTIONS = {
     }
 }
 
+# The tables are read-only at runtime; ion names are interned so lookups
+# with the same name compare by identity
+CATION_REACTIONS = MappingProxyType({
+    (group, sys.intern(ion)): MappingProxyType(data)
+    for (group, ion), data in CATION_REACTIONS.items()
+})
+ANION_REACTIONS = MappingProxyType({
+    sys.intern(ion): MappingProxyType(data)
+    for ion, data in ANION_REACTIONS.items()
+})
+
+# Detected ions are carried as (group, ion) pairs so results use the entry
+# of the group that confirmed them (Pb²⁺ is listed under Groups I and II)
+REACTIONS_BY_TYPE = {
+    'cation': CATION_REACTIONS,
+    'anion': MappingProxyType({(data['group'], ion): data for ion, data in ANION_REACTIONS.items()})
+}
+
 # ======================
 # CORE FUNCTIONS
 # ======================
 
-def print_reaction_explanation(ion, ion_type):
-    """Display detailed chemical explanation for detected ion"""
-    reactions = CATION_REACTIONS if ion_type == 'cation' else ANION_REACTIONS
-    if ion in reactions:
-        print(f"\nReaction Details for {ion}:")
-        print(f"Test Method: {reactions[ion]['test']}")
-        print(f"Chemical Equation:\n{reactions[ion]['reaction']}")
-        print(f"Scientific Principle: {reactions[ion]['reason']}")
-    else:
-        print(f"\nNote: No reaction details available for {ion}")
+YN = ('y', 'n')
 
-def get_user_input(prompt, options=None):
-    """Get validated user input"""
-    while True:
-        response = input(prompt).lower().strip()
-        if not options or response in options:
-            return response
-        print(f"Please enter one of: {', '.join(options)}")
+@lru_cache(maxsize=None)
+def _banner(title):
+    """Render the ruled title block that opens each screen"""
+    return f"\n{'=' * 50}\n{title.center(50)}\n{'=' * 50}"
 
-# ======================
-# CATION TEST FUNCTIONS
-# ======================
+@lru_cache(maxsize=None)
+def _invalid_input_message(valid_options):
+    """Build the retry message for an option tuple"""
+    return f"Invalid input. Please enter one of: {', '.join(valid_options)}"
 
 def get_user_input(prompt, valid_options):
     """Helper function to get validated user input"""
     while True:
-        user_input = input(prompt).lower()
+        user_input = input(prompt)
         if user_input in valid_options:
             return user_input
-        print(f"Invalid input. Please enter one of: {', '.join(valid_options)}")
+        # Only normalise answers that did not already match
+        user_input = user_input.strip().lower()
+        if user_input in valid_options:
+            return user_input
+        print(_invalid_input_message(valid_options))
+
+def _render_explanation(ion, info):
+    """Format the reaction details block for one ion"""
+    return (
+        f"\nReaction Details for {ion}:\n"
+        f"Test: {info['test']}\n"
+        f"Reaction: {info['reaction']}\n"
+        f"Reason: {info['reason']}\n"
+    )
+
+# Reaction details are fixed, so each entry's block is rendered once
+EXPLANATIONS = {
+    (ion_type, group, ion): _render_explanation(ion, info)
+    for ion_type, database in REACTIONS_BY_TYPE.items()
+    for (group, ion), info in database.items()
+}
+# Per-entry blocks written to saved result files
+RESULT_TEMPLATE = "{ion}:\nTest Method: {test}\nReaction: {reaction}\nPrinciple: {reason}\n\n"
+RESULT_BLOCKS = {
+    (ion_type, group, ion): RESULT_TEMPLATE.format_map({'ion': ion, **info})
+    for ion_type, database in REACTIONS_BY_TYPE.items()
+    for (group, ion), info in database.items()
+}
+# Lookups that only know the ion name show every entry listed for it
+ION_DETAILS = {
+    (ion_type, ion): "".join(text for (t, _, name), text in EXPLANATIONS.items()
+                             if t == ion_type and name == ion)
+    for ion_type, _, ion in EXPLANATIONS
+}
 
 def print_reaction_explanation(ion, ion_type):
     """Print the reaction details for a given ion"""
-    database = CATION_REACTIONS if ion_type == 'cation' else ANION_REACTIONS
-    if ion in database:
-        info = database[ion]
-        print(f"\nReaction Details for {ion}:")
-        print(f"Test: {info['test']}")
-        print(f"Reaction: {info['reaction']}")
-        print(f"Reason: {info['reason']}")
-    else:
-        print(f"No reaction information found for {ion}")
+    explanation = ION_DETAILS.get((ion_type, ion))
+    sys.stdout.write(explanation or f"No reaction information found for {ion}\n")
 
-def test_group_i_cations():
-    """Test for Group I cations (Pb²⁺, Ag⁺, Hg₂²⁺)"""
-    detected = []
-    print("\n=== GROUP I: Dilute HCl Test ===")
-    print("Add dilute HCl to the solution and observe.")
-    
-    if get_user_input("Did a white precipitate form? (y/n): ", ['y', 'n']) == 'y':
-        print("\nPerforming confirmatory tests on the precipitate...")
-        
-        # Test for Lead
-        print("\n1. Testing for Pb²⁺:")
-        print("a. Decant the solution and wash the precipitate with hot water")
-        print("b. Add a few drops of K₂CrO₄ solution to the hot water extract")
-        
-        if get_user_input("Does a yellow precipitate form? (y/n): ", ['y', 'n']) == 'y':
-            detected.append("Pb²⁺")
-            print("-> Pb²⁺ confirmed: Yellow PbCrO₄ precipitate")
-            print_reaction_explanation("Pb²⁺", 'cation')
-            
-            # Test remaining precipitate for Ag⁺ and Hg₂²⁺
-            print("\n2. Testing remaining precipitate for Ag⁺ and Hg₂²⁺:")
-            print("Add NH₄OH to the remaining precipitate")
-            
-            if get_user_input("Does the precipitate dissolve completely? (y/n): ", ['y', 'n']) == 'y':
-                print("a. Acidify the solution with HNO₃")
-                if get_user_input("Does a white precipitate reform? (y/n): ", ['y', 'n']) == 'y':
-                    detected.append("Ag⁺")
-                    print("-> Ag⁺ confirmed: Soluble in NH₄OH, reprecipitates with HNO₃")
-                    print_reaction_explanation("Ag⁺", 'cation')
-            else:
-                if get_user_input("Does the precipitate turn black/gray? (y/n): ", ['y', 'n']) == 'y':
-                    detected.append("Hg₂²⁺")
-                    print("-> Hg₂²⁺ confirmed: Black/gray residue with NH₄OH")
-                    print_reaction_explanation("Hg₂²⁺", 'cation')
-        
-        else:  # No lead present
-            print("\nTesting precipitate directly for Ag⁺ and Hg₂²⁺:")
-            print("Add NH₄OH to the precipitate")
-            
-            if get_user_input("Does the precipitate dissolve completely? (y/n): ", ['y', 'n']) == 'y':
-                print("a. Acidify the solution with HNO₃")
-                if get_user_input("Does a white precipitate reform? (y/n): ", ['y', 'n']) == 'y':
-                    detected.append("Ag⁺")
-                    print("-> Ag⁺ confirmed: Soluble in NH₄OH, reprecipitates with HNO₃")
-                    print_reaction_explanation("Ag⁺", 'cation')
-            else:
-                if get_user_input("Does the precipitate turn black/gray? (y/n): ", ['y', 'n']) == 'y':
-                    detected.append("Hg₂²⁺")
-                    print("-> Hg₂²⁺ confirmed: Black/gray residue with NH₄OH")
-                    print_reaction_explanation("Hg₂²⁺", 'cation')
-    
-    else:
-        print("No Group I cations detected.")
-    
-    return detected
+def print_confirmation(message, group, ion, ion_type):
+    """Print a confirmation line and the entry's reaction details in one write"""
+    sys.stdout.write(f"{message}\n{EXPLANATIONS[ion_type, group, ion]}")
 
-def test_group_ii_cations():
-    """Test for Group II cations (Cu²⁺, Pb²⁺, Bi³⁺, As³⁺/⁵⁺)"""
-    detected = []
-    print("\n=== GROUP II: H₂S in Acidic Medium (0.3M HCl) ===")
-    print("Pass H₂S gas through the acidic solution and observe.")
-    
-    if get_user_input("Did a precipitate form? (y/n): ", ['y', 'n']) == 'y':
-        print("\nObserve precipitate color:")
-        color = get_user_input("Color? (black/brown/yellow/white): ", ['black', 'brown', 'yellow', 'white'])
-        
-        print("\nPerforming confirmatory tests...")
-        
-        # Test for Arsenic (if yellow precipitate)
-        if color == 'yellow':
-            print("\n1. Testing for As³⁺/⁵⁺:")
-            print("a. Treat precipitate with (NH₄)₂Sx solution")
-            if get_user_input("Does the precipitate dissolve? (y/n): ", ['y', 'n']) == 'y':
-                print("b. Acidify with dilute HCl")
-                if get_user_input("Does a yellow precipitate reform? (y/n): ", ['y', 'n']) == 'y':
-                    detected.append("As³⁺/⁵⁺")
-                    print("-> As³⁺/⁵⁺ confirmed: Yellow As₂S₃")
-                    print_reaction_explanation("As³⁺/⁵⁺", 'cation')
-        
-        # Test for Copper (if black precipitate)
-        if color == 'black':
-            print("\n2. Testing for Cu²⁺:")
-            print("a. Dissolve some precipitate in HNO₃")
-            print("b. Add excess NH₄OH to the solution")
-            if get_user_input("Does the solution turn deep blue? (y/n): ", ['y', 'n']) == 'y':
-                detected.append("Cu²⁺")
-                print("-> Cu²⁺ confirmed: [Cu(NH₃)₄]²⁺ complex")
-                print_reaction_explanation("Cu²⁺", 'cation')
-        
-        # Test for Bismuth (if black/brown precipitate)
-        if color in ['black', 'brown']:
-            print("\n3. Testing for Bi³⁺:")
-            print("a. Dissolve some precipitate in HNO₃")
-            print("b. Add SnCl₂ solution dropwise")
-            if get_user_input("Does a black precipitate form? (y/n): ", ['y', 'n']) == 'y':
-                detected.append("Bi³⁺")
-                print("-> Bi³⁺ confirmed: Black Bi metal")
-                print_reaction_explanation("Bi³⁺", 'cation')
-        
-        # Test for Lead (if white precipitate and not already detected in Group I)
-        if color == 'white' and "Pb²⁺" not in detected:
-            print("\n4. Testing for Pb²⁺:")
-            print("a. Dissolve precipitate in hot dilute HNO₃")
-            print("b. Add K₂CrO₄ solution")
-            if get_user_input("Does a yellow precipitate form? (y/n): ", ['y', 'n']) == 'y':
-                detected.append("Pb²⁺")
-                print("-> Pb²⁺ confirmed: Yellow PbCrO₄")
-                print_reaction_explanation("Pb²⁺", 'cation')
-    
-    else:
-        print("No Group II cations detected.")
-    
-    return detected
+# ======================
+# CATION TEST FUNCTIONS
+# ======================
 
-def test_group_iii_cations():
-    """Test for Group III cations (Fe³⁺, Al³⁺, Cr³⁺)"""
-    detected = []
-    print("\n=== GROUP III: NH₄OH/NH₄Cl ===")
-    print("Add NH₄Cl and then NH₄OH to the solution and observe.")
-    
-    if get_user_input("Did a precipitate form? (y/n): ", ['y', 'n']) == 'y':
-        print("\nObserve precipitate color:")
-        color = get_user_input("Color? (red-brown/white/green): ", ['red-brown', 'white', 'green'])
-        
-        print("\nPerforming confirmatory tests...")
-        
-        # Test for Iron
-        if color == 'red-brown':
-            print("\n1. Testing for Fe³⁺:")
-            print("a. Dissolve some precipitate in dilute HCl")
-            print("b. Add K₄[Fe(CN)₆] solution")
-            if get_user_input("Does a dark blue precipitate form? (y/n): ", ['y', 'n']) == 'y':
-                detected.append("Fe³⁺")
-                print("-> Fe³⁺ confirmed: Prussian blue")
-                print_reaction_explanation("Fe³⁺", 'cation')
-        
-        # Test for Aluminum
-        if color == 'white':
-            print("\n2. Testing for Al³⁺:")
-            print("a. Dissolve some precipitate in dilute HCl")
-            print("b. Add aluminon reagent and make slightly basic with NH₄OH")
-            if get_user_input("Does a red lake form? (y/n): ", ['y', 'n']) == 'y':
-                detected.append("Al³⁺")
-                print("-> Al³⁺ confirmed: Red lake complex")
-                print_reaction_explanation("Al³⁺", 'cation')
-        
-        # Test for Chromium
-        if color == 'green':
-            print("\n3. Testing for Cr³⁺:")
-            print("a. Boil with NaOH and H₂O₂")
-            print("b. Acidify with CH₃COOH")
-            print("c. Add Pb(OAc)₂ solution")
-            if get_user_input("Does a yellow precipitate form? (y/n): ", ['y', 'n']) == 'y':
-                detected.append("Cr³⁺")
-                print("-> Cr³⁺ confirmed: Yellow PbCrO₄")
-                print_reaction_explanation("Cr³⁺", 'cation')
-    
-    else:
-        print("No Group III cations detected.")
-    
-    return detected
-def test_group_iv_cations():
-    """Test for Group IV cations (Zn²⁺, Mn²⁺, Ni²⁺, Co²⁺)"""
-    detected = []
-    print("\n=== GROUP IV: H₂S in Basic Medium (NH₃/NH₄Cl) ===")
-    print("Make the solution slightly basic with NH₃/NH₄Cl buffer.")
-    print("Pass H₂S gas through the solution and observe.")
-    
-    if get_user_input("Did a precipitate form? (y/n): ", ['y', 'n']) == 'y':
-        print("\nObserve precipitate color:")
-        color = get_user_input("Color? (white/flesh-pink/black): ", ['white', 'flesh-pink', 'black'])
-        
-        print("\nPerforming confirmatory tests...")
-        
-        # Test for Zinc
-        if color == 'white':
-            print("\n1. Testing for Zn²⁺:")
-            print("a. Dissolve precipitate in dilute HCl")
-            print("b. Add NaOH solution dropwise")
-            print("   Observe: White precipitate forms initially")
-            print("c. Add excess NaOH")
-            if get_user_input("Does the precipitate dissolve? (y/n): ", ['y', 'n']) == 'y':
-                detected.append("Zn²⁺")
-                print("-> Zn²⁺ confirmed: Amphoteric behavior")
-                print_reaction_explanation("Zn²⁺", 'cation')
-        
-        # Test for Manganese
-        if color == 'flesh-pink':
-            print("\n2. Testing for Mn²⁺:")
-            print("a. Dissolve some precipitate in dilute HNO₃")
-            print("b. Add solid NaBiO₃ and stir")
-            if get_user_input("Does the solution turn purple? (y/n): ", ['y', 'n']) == 'y':
-                detected.append("Mn²⁺")
-                print("-> Mn²⁺ confirmed: MnO₄⁻ formation")
-                print_reaction_explanation("Mn²⁺", 'cation')
-        
-        # Test for Nickel
-        if color == 'black':
-            print("\n3. Testing for Ni²⁺:")
-            print("a. Dissolve some precipitate in aqua regia")
-            print("b. Add dimethylglyoxime in ammoniacal solution")
-            if get_user_input("Does a bright red precipitate form? (y/n): ", ['y', 'n']) == 'y':
-                detected.append("Ni²⁺")
-                print("-> Ni²⁺ confirmed: Nickel-dimethylglyoxime complex")
-                print_reaction_explanation("Ni²⁺", 'cation')
-        
-        # Test for Cobalt
-        if color == 'black':
-            print("\n4. Testing for Co²⁺:")
-            print("a. Dissolve some precipitate in dilute HCl")
-            print("b. Add solid NH₄SCN")
-            print("c. Add amyl alcohol and shake")
-            if get_user_input("Does the organic layer turn blue? (y/n): ", ['y', 'n']) == 'y':
-                detected.append("Co²⁺")
-                print("-> Co²⁺ confirmed: [Co(SCN)₄]²⁻ complex")
-                print_reaction_explanation("Co²⁺", 'cation')
-    
-    else:
-        print("No Group IV cations detected.")
-    
-    return detected
+# Cation tests are described as data and walked by run_cation_flow().
+# A flow is a list of nodes:
+#   "text"                              -> printed as-is
+#   (ion, message)                      -> ion confirmed
+#   (text, prompt, options, branches)   -> print text (if any), ask prompt,
+#                                          then run branches[answer]
+GROUP_I_CATION_FLOW = [
+    ("\n=== GROUP I: Dilute HCl Test ===\n"
+     "Add dilute HCl to the solution and observe.",
+     "Did a white precipitate form? (y/n): ", YN, {
+        'y': [("\nPerforming confirmatory tests on the precipitate...\n"
+               "\n1. Testing for Pb²⁺:\n"
+               "a. Decant the solution and wash the precipitate with hot water\n"
+               "b. Add a few drops of K₂CrO₄ solution to the hot water extract",
+               "Does a yellow precipitate form? (y/n): ", YN, {
+                  'y': [("Pb²⁺", "-> Pb²⁺ confirmed: Yellow PbCrO₄ precipitate"),
+                        "\n2. Testing remaining precipitate for Ag⁺ and Hg₂²⁺:\n"
+                        "Add NH₄OH to the remaining precipitate"],
+                  'n': ["\nTesting precipitate directly for Ag⁺ and Hg₂²⁺:\n"
+                        "Add NH₄OH to the precipitate"]
+              }),
+              # Asked once whichever way the lead test went
+              (None, "Does the precipitate dissolve completely? (y/n): ", YN, {
+                  'y': [("a. Acidify the solution with HNO₃",
+                         "Does a white precipitate reform? (y/n): ", YN,
+                         {'y': [("Ag⁺", "-> Ag⁺ confirmed: Soluble in NH₄OH, reprecipitates with HNO₃")]})],
+                  'n': [(None, "Does the precipitate turn black/gray? (y/n): ", YN,
+                         {'y': [("Hg₂²⁺", "-> Hg₂²⁺ confirmed: Black/gray residue with NH₄OH")]})]
+              })],
+        'n': ["No Group I cations detected."]
+    })
+]
 
-def test_group_v_cations():
-    """Test for Group V cations (Ba²⁺, Sr²⁺, Ca²⁺)"""
-    detected = []
-    print("\n=== GROUP V: (NH₄)₂CO₃ in NH₃ ===")
-    print("Add NH₄Cl and NH₄OH to the solution.")
-    print("Then add (NH₄)₂CO₃ solution and warm slightly.")
-    
-    if get_user_input("Did a white precipitate form? (y/n): ", ['y', 'n']) == 'y':
-        print("\nPerform flame tests on original solution:")
-        print("Clean platinum wire, dip in conc. HCl, then in test solution.")
-        print("Introduce into flame and observe color.")
-        
-        flame_color = get_user_input("Flame color? (green/red/orange/none): ", 
-                                   ['green', 'red', 'orange', 'none'])
-        
-        if flame_color == "green":
-            detected.append("Ba²⁺")
-            print("-> Ba²⁺ confirmed: Green flame (524 nm)")
-            print_reaction_explanation("Ba²⁺", 'cation')
-        
-        if flame_color == "red":
-            print("\nConfirmatory test for Sr²⁺:")
-            print("a. Make solution slightly acidic with CH₃COOH")
-            print("b. Add saturated CaSO₄ solution")
-            if get_user_input("Does a white precipitate form slowly? (y/n): ", ['y', 'n']) == 'y':
-                detected.append("Sr²⁺")
-                print("-> Sr²⁺ confirmed: SrSO₄ precipitation")
-                print_reaction_explanation("Sr²⁺", 'cation')
-        
-        if flame_color == "orange":
-            print("\nConfirmatory test for Ca²⁺:")
-            print("a. Add (NH₄)₂C₂O₄ solution")
-            if get_user_input("Does a white precipitate form? (y/n): ", ['y', 'n']) == 'y':
-                detected.append("Ca²⁺")
-                print("-> Ca²⁺ confirmed: CaC₂O₄ precipitation")
-                print_reaction_explanation("Ca²⁺", 'cation')
-    
-    else:
-        print("No Group V cations detected.")
-    
-    return detected
+# Printed once a precipitate colour has picked the tests to run
+_CONFIRMING = "\nPerforming confirmatory tests..."
+
+_CU_TEST = ("\n2. Testing for Cu²⁺:\n"
+            "a. Dissolve some precipitate in HNO₃\n"
+            "b. Add excess NH₄OH to the solution",
+            "Does the solution turn deep blue? (y/n): ", YN,
+            {'y': [("Cu²⁺", "-> Cu²⁺ confirmed: [Cu(NH₃)₄]²⁺ complex")]})
+_BI_TEST = ("\n3. Testing for Bi³⁺:\n"
+            "a. Dissolve some precipitate in HNO₃\n"
+            "b. Add SnCl₂ solution dropwise",
+            "Does a black precipitate form? (y/n): ", YN,
+            {'y': [("Bi³⁺", "-> Bi³⁺ confirmed: Black Bi metal")]})
+
+GROUP_II_CATION_FLOW = [
+    ("\n=== GROUP II: H₂S in Acidic Medium (0.3M HCl) ===\n"
+     "Pass H₂S gas through the acidic solution and observe.",
+     "Did a precipitate form? (y/n): ", YN, {
+        'y': [("\nObserve precipitate color:",
+               "Color? (black/brown/yellow/white): ", ('black', 'brown', 'yellow', 'white'), {
+                  'yellow': [_CONFIRMING,
+                             ("\n1. Testing for As³⁺/⁵⁺:\n"
+                              "a. Treat precipitate with (NH₄)₂Sx solution",
+                              "Does the precipitate dissolve? (y/n): ", YN,
+                              {'y': [("b. Acidify with dilute HCl",
+                                      "Does a yellow precipitate reform? (y/n): ", YN,
+                                      {'y': [("As³⁺/⁵⁺", "-> As³⁺/⁵⁺ confirmed: Yellow As₂S₃")]})]})],
+                  'black': [_CONFIRMING, _CU_TEST, _BI_TEST],
+                  'brown': [_CONFIRMING, _BI_TEST],
+                  'white': [_CONFIRMING,
+                            ("\n4. Testing for Pb²⁺:\n"
+                             "a. Dissolve precipitate in hot dilute HNO₃\n"
+                             "b. Add K₂CrO₄ solution",
+                             "Does a yellow precipitate form? (y/n): ", YN,
+                             {'y': [("Pb²⁺", "-> Pb²⁺ confirmed: Yellow PbCrO₄")]})]
+              })],
+        'n': ["No Group II cations detected."]
+    })
+]
+
+GROUP_III_CATION_FLOW = [
+    ("\n=== GROUP III: NH₄OH/NH₄Cl ===\n"
+     "Add NH₄Cl and then NH₄OH to the solution and observe.",
+     "Did a precipitate form? (y/n): ", YN, {
+        'y': [("\nObserve precipitate color:",
+               "Color? (red-brown/white/green): ", ('red-brown', 'white', 'green'), {
+                  'red-brown': [_CONFIRMING,
+                                ("\n1. Testing for Fe³⁺:\n"
+                                 "a. Dissolve some precipitate in dilute HCl\n"
+                                 "b. Add K₄[Fe(CN)₆] solution",
+                                 "Does a dark blue precipitate form? (y/n): ", YN,
+                                 {'y': [("Fe³⁺", "-> Fe³⁺ confirmed: Prussian blue")]})],
+                  'white': [_CONFIRMING,
+                            ("\n2. Testing for Al³⁺:\n"
+                             "a. Dissolve some precipitate in dilute HCl\n"
+                             "b. Add aluminon reagent and make slightly basic with NH₄OH",
+                             "Does a red lake form? (y/n): ", YN,
+                             {'y': [("Al³⁺", "-> Al³⁺ confirmed: Red lake complex")]})],
+                  'green': [_CONFIRMING,
+                            ("\n3. Testing for Cr³⁺:\n"
+                             "a. Boil with NaOH and H₂O₂\n"
+                             "b. Acidify with CH₃COOH\n"
+                             "c. Add Pb(OAc)₂ solution",
+                             "Does a yellow precipitate form? (y/n): ", YN,
+                             {'y': [("Cr³⁺", "-> Cr³⁺ confirmed: Yellow PbCrO₄")]})]
+              })],
+        'n': ["No Group III cations detected."]
+    })
+]
 
-def test_group_vi_cations():
-    """Test for Group VI cations (NH₄⁺, Mg²⁺, Na⁺, K⁺)"""
+GROUP_IV_CATION_FLOW = [
+    ("\n=== GROUP IV: H₂S in Basic Medium (NH₃/NH₄Cl) ===\n"
+     "Make the solution slightly basic with NH₃/NH₄Cl buffer.\n"
+     "Pass H₂S gas through the solution and observe.",
+     "Did a precipitate form? (y/n): ", YN, {
+        'y': [("\nObserve precipitate color:",
+               "Color? (white/flesh-pink/black): ", ('white', 'flesh-pink', 'black'), {
+                  'white': [_CONFIRMING,
+                            ("\n1. Testing for Zn²⁺:\n"
+                             "a. Dissolve precipitate in dilute HCl\n"
+                             "b. Add NaOH solution dropwise\n"
+                             "   Observe: White precipitate forms initially\n"
+                             "c. Add excess NaOH",
+                             "Does the precipitate dissolve? (y/n): ", YN,
+                             {'y': [("Zn²⁺", "-> Zn²⁺ confirmed: Amphoteric behavior")]})],
+                  'flesh-pink': [_CONFIRMING,
+                                 ("\n2. Testing for Mn²⁺:\n"
+                                  "a. Dissolve some precipitate in dilute HNO₃\n"
+                                  "b. Add solid NaBiO₃ and stir",
+                                  "Does the solution turn purple? (y/n): ", YN,
+                                  {'y': [("Mn²⁺", "-> Mn²⁺ confirmed: MnO₄⁻ formation")]})],
+                  'black': [_CONFIRMING,
+                            ("\n3. Testing for Ni²⁺:\n"
+                             "a. Dissolve some precipitate in aqua regia\n"
+                             "b. Add dimethylglyoxime in ammoniacal solution",
+                             "Does a bright red precipitate form? (y/n): ", YN,
+                             {'y': [("Ni²⁺", "-> Ni²⁺ confirmed: Nickel-dimethylglyoxime complex")]}),
+                            ("\n4. Testing for Co²⁺:\n"
+                             "a. Dissolve some precipitate in dilute HCl\n"
+                             "b. Add solid NH₄SCN\n"
+                             "c. Add amyl alcohol and shake",
+                             "Does the organic layer turn blue? (y/n): ", YN,
+                             {'y': [("Co²⁺", "-> Co²⁺ confirmed: [Co(SCN)₄]²⁻ complex")]})]
+              })],
+        'n': ["No Group IV cations detected."]
+    })
+]
+
+GROUP_V_CATION_FLOW = [
+    ("\n=== GROUP V: (NH₄)₂CO₃ in NH₃ ===\n"
+     "Add NH₄Cl and NH₄OH to the solution.\n"
+     "Then add (NH₄)₂CO₃ solution and warm slightly.",
+     "Did a white precipitate form? (y/n): ", YN, {
+        'y': [("\nPerform flame tests on original solution:\n"
+               "Clean platinum wire, dip in conc. HCl, then in test solution.\n"
+               "Introduce into flame and observe color.",
+               "Flame color? (green/red/orange/none): ", ('green', 'red', 'orange', 'none'), {
+                  'green': [("Ba²⁺", "-> Ba²⁺ confirmed: Green flame (524 nm)")],
+                  'red': [("\nConfirmatory test for Sr²⁺:\n"
+                           "a. Make solution slightly acidic with CH₃COOH\n"
+                           "b. Add saturated CaSO₄ solution",
+                           "Does a white precipitate form slowly? (y/n): ", YN,
+                           {'y': [("Sr²⁺", "-> Sr²⁺ confirmed: SrSO₄ precipitation")]})],
+                  'orange': [("\nConfirmatory test for Ca²⁺:\n"
+                              "a. Add (NH₄)₂C₂O₄ solution",
+                              "Does a white precipitate form? (y/n): ", YN,
+                              {'y': [("Ca²⁺", "-> Ca²⁺ confirmed: CaC₂O₄ precipitation")]})]
+              })],
+        'n': ["No Group V cations detected."]
+    })
+]
+
+GROUP_VI_CATION_FLOW = [
+    "\n=== GROUP VI: Soluble Group ===",
+    ("\n1. Testing for NH₄⁺:\n"
+     "a. Take original solution in test tube\n"
+     "b. Add NaOH solution and warm gently",
+     "Does ammonia gas evolve (test with moist red litmus)? (y/n): ", YN,
+     {'y': [("NH₄⁺", "-> NH₄⁺ confirmed: NH₃ gas detected")]}),
+    ("\n2. Testing for Mg²⁺:\n"
+     "a. Take fresh solution, add NH₄Cl and NH₄OH\n"
+     "b. Add disodium hydrogen phosphate solution",
+     "Does a white crystalline precipitate form? (y/n): ", YN,
+     {'y': [("Mg²⁺", "-> Mg²⁺ confirmed: MgNH₄PO₄ precipitation")]}),
+    ("\n3. Testing for Na⁺:\n"
+     "Perform flame test (clean wire, dip in solution):",
+     "Flame color? (yellow/none): ", ('yellow', 'none'),
+     {'yellow': [("Confirm with cobalt glass:",
+                  "Does yellow color disappear through cobalt glass? (y/n): ", YN,
+                  {'y': [("Na⁺", "-> Na⁺ confirmed: Persistent yellow flame")]})]}),
+    ("\n4. Testing for K⁺:\n"
+     "Perform flame test through cobalt glass:",
+     "Flame color through cobalt glass? (violet/none): ", ('violet', 'none'),
+     {'violet': [("Confirmatory test:\n"
+                  "a. Add sodium cobaltinitrite solution",
+                  "Does a yellow precipitate form? (y/n): ", YN,
+                  {'y': [("K⁺", "-> K⁺ confirmed: K₂Na[Co(NO₂)₆] precipitation")]})]})
+]
+
+def _walk_flow(nodes, group, detected):
+    """Interpret a list of flow nodes, collecting confirmed ions"""
+    for node in nodes:
+        if isinstance(node, str):
+            print(node)
+        elif len(node) == 2:
+            ion, message = node
+            detected.append((group, ion))
+            print_confirmation(message, group, ion, 'cation')
+        else:
+            text, prompt, options, branches = node
+            if text:
+                print(text)
+            _walk_flow(branches.get(get_user_input(prompt, options), ()), group, detected)
+
+CATION_FLOWS = {
+    "I": (GROUP_I_CATION_FLOW, None),
+    "II": (GROUP_II_CATION_FLOW, None),
+    "III": (GROUP_III_CATION_FLOW, None),
+    "IV": (GROUP_IV_CATION_FLOW, None),
+    "V": (GROUP_V_CATION_FLOW, None),
+    "VI": (GROUP_VI_CATION_FLOW, "No Group VI cations detected.")
+}
+
+def run_cation_flow(group):
+    """Run one cation group flow and return the detected (group, ion) pairs"""
+    flow, none_message = CATION_FLOWS[group]
     detected = []
-    print("\n=== GROUP VI: Soluble Group ===")
-    
-    # Ammonium test
-    print("\n1. Testing for NH₄⁺:")
-    print("a. Take original solution in test tube")
-    print("b. Add NaOH solution and warm gently")
-    if get_user_input("Does ammonia gas evolve (test with moist red litmus)? (y/n): ", ['y', 'n']) == 'y':
-        detected.append("NH₄⁺")
-        print("-> NH₄⁺ confirmed: NH₃ gas detected")
-        print_reaction_explanation("NH₄⁺", 'cation')
-    
-    # Magnesium test
-    print("\n2. Testing for Mg²⁺:")
-    print("a. Take fresh solution, add NH₄Cl and NH₄OH")
-    print("b. Add disodium hydrogen phosphate solution")
-    if get_user_input("Does a white crystalline precipitate form? (y/n): ", ['y', 'n']) == 'y':
-        detected.append("Mg²⁺")
-        print("-> Mg²⁺ confirmed: MgNH₄PO₄ precipitation")
-        print_reaction_explanation("Mg²⁺", 'cation')
-    
-    # Sodium test
-    print("\n3. Testing for Na⁺:")
-    print("Perform flame test (clean wire, dip in solution):")
-    flame_color = get_user_input("Flame color? (yellow/none): ", ['yellow', 'none'])
-    if flame_color == "yellow":
-        print("Confirm with cobalt glass:")
-        if get_user_input("Does yellow color disappear through cobalt glass? (y/n): ", ['y', 'n']) == 'y':
-            detected.append("Na⁺")
-            print("-> Na⁺ confirmed: Persistent yellow flame")
-            print_reaction_explanation("Na⁺", 'cation')
-    
-    # Potassium test
-    print("\n4. Testing for K⁺:")
-    print("Perform flame test through cobalt glass:")
-    flame_color = get_user_input("Flame color through cobalt glass? (violet/none): ", ['violet', 'none'])
-    if flame_color == "violet":
-        print("Confirmatory test:")
-        print("a. Add sodium cobaltinitrite solution")
-        if get_user_input("Does a yellow precipitate form? (y/n): ", ['y', 'n']) == 'y':
-            detected.append("K⁺")
-            print("-> K⁺ confirmed: K₂Na[Co(NO₂)₆] precipitation")
-            print_reaction_explanation("K⁺", 'cation')
-    
-    if not detected:
-        print("No Group VI cations detected.")
-    
+    _walk_flow(flow, group, detected)
+    if none_message and not detected:
+        print(none_message)
     return detected
+
 # ======================
 # ANION TEST FUNCTIONS
 # ======================
@@ -595,49 +550,45 @@ def test_group_vi_cations():
 def test_group_i_anions():
     """Test for Group I anions (CO₃²⁻, S²⁻, NO₂⁻, CH₃COO⁻)"""
     detected = []
-    print("\n=== GROUP I: Dilute H₂SO₄ Tests ===")
-    print("Procedure: Take 2mL test solution in test tube, add 1mL dilute H₂SO₄")
-    
-    if get_user_input("Is there effervescence/gas evolution? (y/n): ", ['y', 'n']) == 'y':
-        print("\nObserve carefully:")
-        print("1. Color and smell of gas")
-        print("2. Effect on lime water")
-        print("3. Effect on lead acetate paper")
+    print("\n=== GROUP I: Dilute H₂SO₄ Tests ===\n"
+          "Procedure: Take 2mL test solution in test tube, add 1mL dilute H₂SO₄")
+    
+    if get_user_input("Is there effervescence/gas evolution? (y/n): ", YN) == 'y':
+        print("\nObserve carefully:\n"
+              "1. Color and smell of gas\n"
+              "2. Effect on lime water\n"
+              "3. Effect on lead acetate paper")
         
         # Carbonate test
-        print("\n1. Testing for CO₃²⁻:")
-        print("a. Pass evolved gas through lime water (Ca(OH)₂)")
-        if get_user_input("Does lime water turn milky? (y/n): ", ['y', 'n']) == 'y':
-            detected.append("CO₃²⁻")
-            print("-> CO₃²⁻ confirmed: CO₂ gas detected")
-            print_reaction_explanation("CO₃²⁻", 'anion')
+        print("\n1. Testing for CO₃²⁻:\n"
+              "a. Pass evolved gas through lime water (Ca(OH)₂)")
+        if get_user_input("Does lime water turn milky? (y/n): ", YN) == 'y':
+            detected.append(("I", "CO₃²⁻"))
+            print_confirmation("-> CO₃²⁻ confirmed: CO₂ gas detected", "I", "CO₃²⁻", 'anion')
         
         # Sulfide test
-        print("\n2. Testing for S²⁻:")
-        print("a. Note smell (rotten eggs)")
-        print("b. Bring moist lead acetate paper to mouth of test tube")
-        if get_user_input("Does paper turn black? (y/n): ", ['y', 'n']) == 'y':
-            detected.append("S²⁻")
-            print("-> S²⁻ confirmed: PbS formation")
-            print_reaction_explanation("S²⁻", 'anion')
+        print("\n2. Testing for S²⁻:\n"
+              "a. Note smell (rotten eggs)\n"
+              "b. Bring moist lead acetate paper to mouth of test tube")
+        if get_user_input("Does paper turn black? (y/n): ", YN) == 'y':
+            detected.append(("I", "S²⁻"))
+            print_confirmation("-> S²⁻ confirmed: PbS formation", "I", "S²⁻", 'anion')
         
         # Nitrite test
-        print("\n3. Testing for NO₂⁻:")
-        print("a. Observe gas color (brown fumes)")
-        if get_user_input("Are brown fumes visible? (y/n): ", ['y', 'n']) == 'y':
-            detected.append("NO₂⁻")
-            print("-> NO₂⁻ confirmed: NO₂ gas detected")
-            print_reaction_explanation("NO₂⁻", 'anion')
+        print("\n3. Testing for NO₂⁻:\n"
+              "a. Observe gas color (brown fumes)")
+        if get_user_input("Are brown fumes visible? (y/n): ", YN) == 'y':
+            detected.append(("I", "NO₂⁻"))
+            print_confirmation("-> NO₂⁻ confirmed: NO₂ gas detected", "I", "NO₂⁻", 'anion')
         
         # Acetate test
-        print("\n4. Testing for CH₃COO⁻:")
-        print("a. Note vinegar-like smell")
-        if get_user_input("Is there a distinct vinegar odor? (y/n): ", ['y', 'n']) == 'y':
+        print("\n4. Testing for CH₃COO⁻:\n"
+              "a. Note vinegar-like smell")
+        if get_user_input("Is there a distinct vinegar odor? (y/n): ", YN) == 'y':
             print("b. Confirm with ferric chloride test")
-            if get_user_input("Add FeCl₃. Does solution turn red-brown? (y/n): ", ['y', 'n']) == 'y':
-                detected.append("CH₃COO⁻")
-                print("-> CH₃COO⁻ confirmed: Smell and color change")
-                print_reaction_explanation("CH₃COO⁻", 'anion')
+            if get_user_input("Add FeCl₃. Does solution turn red-brown? (y/n): ", YN) == 'y':
+                detected.append(("I", "CH₃COO⁻"))
+                print_confirmation("-> CH₃COO⁻ confirmed: Smell and color change", "I", "CH₃COO⁻", 'anion')
     
     else:
         print("No Group I anions detected.")
@@ -647,53 +598,49 @@ def test_group_i_anions():
 def test_group_ii_anions():
     """Test for Group II anions (Cl⁻, Br⁻, I⁻, NO₃⁻)"""
     detected = []
-    print("\n=== GROUP II: Conc. H₂SO₄ Tests ===")
-    print("CAUTION: Perform in fume hood. Use small quantities.")
-    print("Procedure: Take 1mL test solution, add 1mL conc. H₂SO₄ carefully")
-    
-    if get_user_input("Are colored fumes evolved? (y/n): ", ['y', 'n']) == 'y':
-        print("\nObserve carefully:")
-        print("1. Color of fumes")
-        print("2. Odor characteristics")
-        print("3. Precipitate behavior with AgNO₃")
+    print("\n=== GROUP II: Conc. H₂SO₄ Tests ===\n"
+          "CAUTION: Perform in fume hood. Use small quantities.\n"
+          "Procedure: Take 1mL test solution, add 1mL conc. H₂SO₄ carefully")
+    
+    if get_user_input("Are colored fumes evolved? (y/n): ", YN) == 'y':
+        print("\nObserve carefully:\n"
+              "1. Color of fumes\n"
+              "2. Odor characteristics\n"
+              "3. Precipitate behavior with AgNO₃")
         
         # Chloride test
-        print("\n1. Testing for Cl⁻:")
-        print("a. Note white fumes (HCl)")
-        print("b. Perform AgNO₃ test on original solution")
-        if get_user_input("White precipitate soluble in NH₄OH? (y/n): ", ['y', 'n']) == 'y':
-            detected.append("Cl⁻")
-            print("-> Cl⁻ confirmed: AgCl behavior")
-            print_reaction_explanation("Cl⁻", 'anion')
+        print("\n1. Testing for Cl⁻:\n"
+              "a. Note white fumes (HCl)\n"
+              "b. Perform AgNO₃ test on original solution")
+        if get_user_input("White precipitate soluble in NH₄OH? (y/n): ", YN) == 'y':
+            detected.append(("II", "Cl⁻"))
+            print_confirmation("-> Cl⁻ confirmed: AgCl behavior", "II", "Cl⁻", 'anion')
         
         # Bromide test
-        print("\n2. Testing for Br⁻:")
-        print("a. Note yellow-brown fumes (Br₂)")
-        print("b. Perform AgNO₃ test on original solution")
-        if get_user_input("Pale yellow precipitate partially soluble in NH₄OH? (y/n): ", ['y', 'n']) == 'y':
-            detected.append("Br⁻")
-            print("-> Br⁻ confirmed: AgBr behavior")
-            print_reaction_explanation("Br⁻", 'anion')
+        print("\n2. Testing for Br⁻:\n"
+              "a. Note yellow-brown fumes (Br₂)\n"
+              "b. Perform AgNO₃ test on original solution")
+        if get_user_input("Pale yellow precipitate partially soluble in NH₄OH? (y/n): ", YN) == 'y':
+            detected.append(("II", "Br⁻"))
+            print_confirmation("-> Br⁻ confirmed: AgBr behavior", "II", "Br⁻", 'anion')
         
         # Iodide test
-        print("\n3. Testing for I⁻:")
-        print("a. Note violet fumes (I₂)")
-        print("b. Perform AgNO₃ test on original solution")
-        if get_user_input("Yellow precipitate insoluble in NH₄OH? (y/n): ", ['y', 'n']) == 'y':
-            detected.append("I⁻")
-            print("-> I⁻ confirmed: AgI behavior")
-            print_reaction_explanation("I⁻", 'anion')
+        print("\n3. Testing for I⁻:\n"
+              "a. Note violet fumes (I₂)\n"
+              "b. Perform AgNO₃ test on original solution")
+        if get_user_input("Yellow precipitate insoluble in NH₄OH? (y/n): ", YN) == 'y':
+            detected.append(("II", "I⁻"))
+            print_confirmation("-> I⁻ confirmed: AgI behavior", "II", "I⁻", 'anion')
         
         # Nitrate test
-        print("\n4. Testing for NO₃⁻:")
-        print("a. Note brown fumes (NO₂)")
-        print("b. Perform brown ring test:")
-        print("   - Add FeSO₄ solution to test tube")
-        print("   - Carefully add conc. H₂SO₄ down the side")
-        if get_user_input("Brown ring at interface? (y/n): ", ['y', 'n']) == 'y':
-            detected.append("NO₃⁻")
-            print("-> NO₃⁻ confirmed: Brown ring test")
-            print_reaction_explanation("NO₃⁻", 'anion')
+        print("\n4. Testing for NO₃⁻:\n"
+              "a. Note brown fumes (NO₂)\n"
+              "b. Perform brown ring test:\n"
+              "   - Add FeSO₄ solution to test tube\n"
+              "   - Carefully add conc. H₂SO₄ down the side")
+        if get_user_input("Brown ring at interface? (y/n): ", YN) == 'y':
+            detected.append(("II", "NO₃⁻"))
+            print_confirmation("-> NO₃⁻ confirmed: Brown ring test", "II", "NO₃⁻", 'anion')
     
     else:
         print("No Group II anions detected.")
@@ -706,33 +653,30 @@ def test_group_iii_anions():
     print("\n=== GROUP III: Specific Tests ===")
     
     # Sulfate test
-    print("\n1. Testing for SO₄²⁻:")
-    print("a. Acidify test solution with dilute HCl")
-    print("b. Add BaCl₂ solution")
-    if get_user_input("White precipitate forms? (y/n): ", ['y', 'n']) == 'y':
+    print("\n1. Testing for SO₄²⁻:\n"
+          "a. Acidify test solution with dilute HCl\n"
+          "b. Add BaCl₂ solution")
+    if get_user_input("White precipitate forms? (y/n): ", YN) == 'y':
         print("c. Test precipitate solubility in conc. HCl")
-        if get_user_input("Precipitate insoluble? (y/n): ", ['y', 'n']) == 'y':
-            detected.append("SO₄²⁻")
-            print("-> SO₄²⁻ confirmed: BaSO₄ precipitation")
-            print_reaction_explanation("SO₄²⁻", 'anion')
+        if get_user_input("Precipitate insoluble? (y/n): ", YN) == 'y':
+            detected.append(("III", "SO₄²⁻"))
+            print_confirmation("-> SO₄²⁻ confirmed: BaSO₄ precipitation", "III", "SO₄²⁻", 'anion')
     
     # Phosphate test
-    print("\n2. Testing for PO₄³⁻:")
-    print("a. Add conc. HNO₃ and ammonium molybdate")
-    print("b. Warm gently (60°C water bath)")
-    if get_user_input("Yellow precipitate forms? (y/n): ", ['y', 'n']) == 'y':
-        detected.append("PO₄³⁻")
-        print("-> PO₄³⁻ confirmed: Ammonium phosphomolybdate")
-        print_reaction_explanation("PO₄³⁻", 'anion')
+    print("\n2. Testing for PO₄³⁻:\n"
+          "a. Add conc. HNO₃ and ammonium molybdate\n"
+          "b. Warm gently (60°C water bath)")
+    if get_user_input("Yellow precipitate forms? (y/n): ", YN) == 'y':
+        detected.append(("III", "PO₄³⁻"))
+        print_confirmation("-> PO₄³⁻ confirmed: Ammonium phosphomolybdate", "III", "PO₄³⁻", 'anion')
     
     # Borate test
-    print("\n3. Testing for BO₃³⁻:")
-    print("a. Mix sample with methanol and conc. H₂SO₄")
-    print("b. Ignite carefully (flame test)")
-    if get_user_input("Green-edged flame observed? (y/n): ", ['y', 'n']) == 'y':
-        detected.append("BO₃³⁻")
-        print("-> BO₃³⁻ confirmed: Green flame test")
-        print_reaction_explanation("BO₃³⁻", 'anion')
+    print("\n3. Testing for BO₃³⁻:\n"
+          "a. Mix sample with methanol and conc. H₂SO₄\n"
+          "b. Ignite carefully (flame test)")
+    if get_user_input("Green-edged flame observed? (y/n): ", YN) == 'y':
+        detected.append(("III", "BO₃³⁻"))
+        print_confirmation("-> BO₃³⁻ confirmed: Green flame test", "III", "BO₃³⁻", 'anion')
     
     if not detected:
         print("No Group III anions detected.")
@@ -742,115 +686,94 @@ def test_group_iii_anions():
 # ENHANCED MENU SYSTEM
 # ======================
 
+# Menu screens never change, so each is rendered once
+MAIN_MENU_SCREEN = _banner("QUALITATIVE CHEMICAL ANALYSIS SYSTEM") + (
+    "\n\nMain Menu:\n"
+    "1. 🧪 Cation Analysis (Groups I-VI)\n"
+    "2. 🧪 Anion Analysis (Groups I-III)\n"
+    "3. 📚 Chemical Reaction Database\n"
+    "4. ⚗️  Virtual Lab Assistant\n"
+    "5. ℹ️  Program Information\n"
+    "6. 🚪 Exit Program"
+)
+CATION_MENU_SCREEN = _banner("CATION ANALYSIS") + (
+    "\n\nSelect analysis option:\n"
+    "1. 🔍 Complete Cation Analysis (Groups I-VI)\n"
+    "2. 🔬 Analyze Specific Cation Group\n"
+    "3. 📊 View Previous Results\n"
+    "4. 🏠 Return to Main Menu"
+)
+ANION_MENU_SCREEN = _banner("ANION ANALYSIS") + (
+    "\n\nSelect analysis option:\n"
+    "1. 🔍 Complete Anion Analysis (Groups I-III)\n"
+    "2. 🔬 Analyze Specific Anion Group\n"
+    "3. 📊 View Previous Results\n"
+    "4. 🏠 Return to Main Menu"
+)
+DATABASE_MENU_SCREEN = _banner("CHEMICAL REACTION DATABASE") + (
+    "\n\nSelect option:\n"
+    "1. 🔎 Search by Ion\n"
+    "2. 📖 Browse All Reactions\n"
+    "3. 🧪 View Group-Wise Reactions\n"
+    "4. 🏠 Return to Main Menu"
+)
+LAB_ASSISTANT_SCREEN = _banner("VIRTUAL LAB ASSISTANT") + (
+    "\n\nThis feature provides:\n"
+    "- 🧑‍🔬 Step-by-step procedure guidance\n"
+    "- ⚠️  Safety precautions for each test\n"
+    "- 🎥 Video demonstration links\n"
+    "- 📝 Lab report templates"
+)
+
 def display_menu():
     """Main menu interface with enhanced features"""
     while True:
-        print("\n" + "="*50)
-        print("QUALITATIVE CHEMICAL ANALYSIS SYSTEM".center(50))
-        print("="*50)
-        print("\nMain Menu:")
-        print("1. 🧪 Cation Analysis (Groups I-VI)")
-        print("2. 🧪 Anion Analysis (Groups I-III)")
-        print("3. 📚 Chemical Reaction Database")
-        print("4. ⚗️  Virtual Lab Assistant")
-        print("5. ℹ️  Program Information")
-        print("6. 🚪 Exit Program")
+        print(MAIN_MENU_SCREEN)
         
-        choice = get_user_input("\nEnter your choice (1-6): ", ['1', '2', '3', '4', '5', '6'])
+        choice = get_user_input("\nEnter your choice (1-6): ", ('1', '2', '3', '4', '5', '6'))
         
-        if choice == '1':
-            cation_analysis_menu()
-        elif choice == '2':
-            anion_analysis_menu()
-        elif choice == '3':
-            reaction_database_menu()
-        elif choice == '4':
-            virtual_lab_assistant()
-        elif choice == '5':
-            show_program_info()
-        elif choice == '6':
+        if choice == '6':
             if confirm_exit():
                 return
+        else:
+            MAIN_MENU_ACTIONS[choice]()
 
 def cation_analysis_menu():
     """Cation analysis menu with enhanced features"""
     while True:
-        print("\n" + "="*50)
-        print("CATION ANALYSIS".center(50))
-        print("="*50)
-        print("\nSelect analysis option:")
-        print("1. 🔍 Complete Cation Analysis (Groups I-VI)")
-        print("2. 🔬 Analyze Specific Cation Group")
-        print("3. 📊 View Previous Results")
-        print("4. 🏠 Return to Main Menu")
+        print(CATION_MENU_SCREEN)
         
-        choice = get_user_input("\nEnter your choice (1-4): ", ['1', '2', '3', '4'])
+        choice = get_user_input("\nEnter your choice (1-4): ", ('1', '2', '3', '4'))
         
-        if choice == '1':
-            perform_full_cation_analysis()
-        elif choice == '2':
-            analyze_specific_cation_group()
-        elif choice == '3':
-            view_previous_results('cation')
-        elif choice == '4':
+        if choice == '4':
             break
+        CATION_MENU_ACTIONS[choice]()
 
 def anion_analysis_menu():
     """Anion analysis menu with enhanced features"""
     while True:
-        print("\n" + "="*50)
-        print("ANION ANALYSIS".center(50))
-        print("="*50)
-        print("\nSelect analysis option:")
-        print("1. 🔍 Complete Anion Analysis (Groups I-III)")
-        print("2. 🔬 Analyze Specific Anion Group")
-        print("3. 📊 View Previous Results")
-        print("4. 🏠 Return to Main Menu")
+        print(ANION_MENU_SCREEN)
         
-        choice = get_user_input("\nEnter your choice (1-4): ", ['1', '2', '3', '4'])
+        choice = get_user_input("\nEnter your choice (1-4): ", ('1', '2', '3', '4'))
         
-        if choice == '1':
-            perform_full_anion_analysis()
-        elif choice == '2':
-            analyze_specific_anion_group()
-        elif choice == '3':
-            view_previous_results('anion')
-        elif choice == '4':
+        if choice == '4':
             break
+        ANION_MENU_ACTIONS[choice]()
 
 def reaction_database_menu():
     """Enhanced chemical reaction database browser"""
     while True:
-        print("\n" + "="*50)
-        print("CHEMICAL REACTION DATABASE".center(50))
-        print("="*50)
-        print("\nSelect option:")
-        print("1. 🔎 Search by Ion")
-        print("2. 📖 Browse All Reactions")
-        print("3. 🧪 View Group-Wise Reactions")
-        print("4. 🏠 Return to Main Menu")
+        print(DATABASE_MENU_SCREEN)
         
-        choice = get_user_input("\nEnter your choice (1-4): ", ['1', '2', '3', '4'])
+        choice = get_user_input("\nEnter your choice (1-4): ", ('1', '2', '3', '4'))
         
-        if choice == '1':
-            search_ion_reactions()
-        elif choice == '2':
-            browse_all_reactions()
-        elif choice == '3':
-            view_group_reactions()
-        elif choice == '4':
+        if choice == '4':
             break
+        DATABASE_MENU_ACTIONS[choice]()
 
 def virtual_lab_assistant():
     """Interactive virtual lab assistant"""
-    print("\n" + "="*50)
-    print("VIRTUAL LAB ASSISTANT".center(50))
-    print("="*50)
-    print("\nThis feature provides:")
-    print("- 🧑‍🔬 Step-by-step procedure guidance")
-    print("- ⚠️  Safety precautions for each test")
-    print("- 🎥 Video demonstration links")
-    print("- 📝 Lab report templates")
+    print(LAB_ASSISTANT_SCREEN)
     
     input("\nPress Enter to return to main menu...")
 
@@ -859,33 +782,28 @@ def virtual_lab_assistant():
 # ======================
 
 def save_results_to_file(filename, ions, ion_type):
-    """Save analysis results to a text file"""
+    """Save analysis results (a list of (group, ion) pairs) to a text file"""
     try:
         with open(filename, 'w', encoding='utf-8') as f:
-            f.write(f"Qualitative Analysis Results - {ion_type.upper()}\n")
-            f.write("="*50 + "\n")
-            f.write(f"Detected {ion_type}s: {', '.join(ions)}\n\n")
-            
-            # Use the correct reaction database
-            reactions = CATION_REACTIONS if ion_type == 'cation' else ANION_REACTIONS
-            
-            for ion in ions:
-                if ion in reactions:
-                    f.write(f"{ion}:\n")
-                    f.write(f"Test Method: {reactions[ion]['test']}\n")
-                    f.write(f"Reaction: {reactions[ion]['reaction']}\n")
-                    f.write(f"Principle: {reactions[ion]['reason']}\n\n")
+            f.write(
+                f"Qualitative Analysis Results - {ion_type.upper()}\n"
+                f"{'=' * 50}\n"
+                f"Detected {ion_type}s: {', '.join(ion for _, ion in ions)}\n\n"
+                + "".join(RESULT_BLOCKS.get((ion_type, group, ion), "") for group, ion in ions)
+            )
         return True
     except Exception as e:
         print(f"Error saving results to file: {e}")
         return False
 
+SESSION_TIMESTAMP_FORMAT = "%Y-%m-%d_%H-%M-%S"
+
 def save_analysis_session(detected, ion_type):
     """Save the current analysis session"""
     try:
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        timestamp = strftime(SESSION_TIMESTAMP_FORMAT)
         filename = f"{ion_type}_analysis_{timestamp}.txt"
-        if save_results_to_file(filename, list(set(detected)), ion_type):
+        if save_results_to_file(filename, detected, ion_type):
             print(f"\nSession automatically saved to {filename}")
             return True
         else:
@@ -895,67 +813,55 @@ def save_analysis_session(detected, ion_type):
         print(f"Error saving analysis session: {e}")
         return False
     
+def _render_browse_entry(ion, data):
+    """Render one ion's entry for the full reaction listing"""
+    return f"\n{ion}:\nTest: {data['test']}\nReaction: {data['reaction']}\nGroup: {data['group']}\n"
+
+# The tables never change, so the full listing is rendered once
+BROWSE_ALL_TEXT = "".join((
+    _banner("ALL CHEMICAL REACTIONS"),
+    "\n\nCATIONS:\n",
+    *(_render_browse_entry(ion, data) for (_, ion), data in CATION_REACTIONS.items()),
+    "\nANIONS:\n",
+    *(_render_browse_entry(ion, data) for ion, data in ANION_REACTIONS.items())
+))
+
 def browse_all_reactions():
     """Display all available chemical reactions"""
-    print("\n" + "="*50)
-    print("ALL CHEMICAL REACTIONS".center(50))
-    print("="*50)
-    
-    print("\nCATIONS:")
-    for ion, data in CATION_REACTIONS.items():
-        print(f"\n{ion}:")
-        print(f"Test: {data['test']}")
-        print(f"Reaction: {data['reaction']}")
-        print(f"Group: {data['group']}")
-    
-    print("\nANIONS:")
-    for ion, data in ANION_REACTIONS.items():
-        print(f"\n{ion}:")
-        print(f"Test: {data['test']}")
-        print(f"Reaction: {data['reaction']}")
-        print(f"Group: {data['group']}")
-    
+    sys.stdout.write(BROWSE_ALL_TEXT)
     input("\nPress Enter to return to menu...")
 
+def _render_search_hit(kind, ion, data):
+    """Render the search result for one ion"""
+    return (f"\n{kind} FOUND: {ion}\nTest: {data['test']}\n"
+            f"Reaction: {data['reaction']}\nGroup: {data['group']}\n")
+
+# Cation and anion names never overlap, so one index answers every search.
+# A cation listed under two groups (Pb²⁺) shows both entries.
+SEARCH_RESULTS = {
+    **{ion: "".join(_render_search_hit("CATION", name, data)
+                    for (_, name), data in CATION_REACTIONS.items() if name == ion)
+       for _, ion in CATION_REACTIONS},
+    **{ion: _render_search_hit("ANION", ion, data) for ion, data in ANION_REACTIONS.items()}
+}
+
 def search_ion_reactions():
     """Search for specific ion reactions"""
-    print("\n" + "="*50)
-    print("SEARCH ION REACTIONS".center(50))
-    print("="*50)
+    print(_banner("SEARCH ION REACTIONS"))
     
     while True:
         ion = input("\nEnter ion to search (e.g., 'Fe³⁺', 'SO₄²⁻') or 'back': ").strip()
         if ion.lower() == 'back':
             break
         
-        found = False
-        if ion in CATION_REACTIONS:
-            print(f"\nCATION FOUND: {ion}")
-            data = CATION_REACTIONS[ion]
-            print(f"Test: {data['test']}")
-            print(f"Reaction: {data['reaction']}")
-            print(f"Group: {data['group']}")
-            found = True
-            
-        if ion in ANION_REACTIONS:
-            print(f"\nANION FOUND: {ion}")
-            data = ANION_REACTIONS[ion]
-            print(f"Test: {data['test']}")
-            print(f"Reaction: {data['reaction']}")
-            print(f"Group: {data['group']}")
-            found = True
-            
-        if not found:
-            print(f"\nIon '{ion}' not found in databases.")
-            print("Try using standard notation (e.g., Fe³⁺, SO₄²⁻)")
+        result = SEARCH_RESULTS.get(ion)
+        if result is None:
+            print(f"\nIon '{ion}' not found in databases.\n"
+                  "Try using standard notation (e.g., Fe³⁺, SO₄²⁻)")
+        else:
+            sys.stdout.write(result)
 
-def show_program_info():
-    """Display program information"""
-    print("\n" + "="*50)
-    print("PROGRAM INFORMATION".center(50))
-    print("="*50)
-    
-    print("""
+PROGRAM_INFO_TEXT = _banner("PROGRAM INFORMATION") + "\n" + """
 QUALITATIVE CHEMICAL ANALYSIS SYSTEM
 Version: 2.1
 Last Updated: 2023-11-15
@@ -975,182 +881,171 @@ Features:
 Safety Notice:
 Always perform chemical tests under proper supervision
 and with appropriate safety equipment.
-""")
+"""
+
+def show_program_info():
+    """Display program information"""
+    print(PROGRAM_INFO_TEXT)
     
     input("\nPress Enter to return to main menu...")
 
+def _render_group_listing(heading, rows):
+    """Render the group-wise listing for (group, ion, data) rows"""
+    parts = [f"\n{heading}:\n"]
+    current = None
+    for group, ion, data in rows:
+        if group != current:
+            parts.append(f"\nGroup {group}:\n")
+            current = group
+        parts.append(f"  {ion}: {data['test']}\n")
+    return "".join(parts)
+
+# The tables are already in group order, so each listing is rendered once
+GROUP_LISTINGS = {
+    '1': _render_group_listing(
+        "CATION GROUPS", ((group, ion, data) for (group, ion), data in CATION_REACTIONS.items())),
+    '2': _render_group_listing(
+        "ANION GROUPS", ((data['group'], ion, data) for ion, data in ANION_REACTIONS.items()))
+}
+GROUP_TYPE_MENU = (
+    "\nSelect group type:\n"
+    "1. Cation Groups (I-VI)\n"
+    "2. Anion Groups (I-III)\n"
+    "3. Back to previous menu"
+)
+
 def view_group_reactions():
     """Display reactions organized by analysis groups"""
-    print("\n" + "="*50)
-    print("GROUP-WISE REACTIONS".center(50))
-    print("="*50)
-    
-    # Define group information
-    cation_groups = {
-        "I": ["Pb²⁺", "Ag⁺", "Hg₂²⁺"],
-        "II": ["Cu²⁺", "Pb²⁺", "Bi³⁺", "As³⁺/⁵⁺"],
-        "III": ["Fe³⁺", "Al³⁺", "Cr³⁺"],
-        "IV": ["Zn²⁺", "Mn²⁺", "Ni²⁺", "Co²⁺"],
-        "V": ["Ba²⁺", "Sr²⁺", "Ca²⁺"],
-        "VI": ["NH₄⁺", "Mg²⁺", "Na⁺", "K⁺"]
-    }
-    
-    anion_groups = {
-        "I": ["CO₃²⁻", "S²⁻", "NO₂⁻", "CH₃COO⁻"],
-        "II": ["Cl⁻", "Br⁻", "I⁻", "NO₃⁻"],
-        "III": ["SO₄²⁻", "PO₄³⁻", "BO₃³⁻"]
-    }
+    print(_banner("GROUP-WISE REACTIONS"))
     
     while True:
-        print("\nSelect group type:")
-        print("1. Cation Groups (I-VI)")
-        print("2. Anion Groups (I-III)")
-        print("3. Back to previous menu")
-        
-        choice = get_user_input("Enter choice (1-3): ", ['1', '2', '3'])
+        print(GROUP_TYPE_MENU)
         
-        if choice == '1':
-            print("\nCATION GROUPS:")
-            for group, ions in cation_groups.items():
-                print(f"\nGroup {group}:")
-                for ion in ions:
-                    if ion in CATION_REACTIONS:
-                        print(f"  {ion}: {CATION_REACTIONS[ion]['test']}")
-        
-        elif choice == '2':
-            print("\nANION GROUPS:")
-            for group, ions in anion_groups.items():
-                print(f"\nGroup {group}:")
-                for ion in ions:
-                    if ion in ANION_REACTIONS:
-                        print(f"  {ion}: {ANION_REACTIONS[ion]['test']}")
+        choice = get_user_input("Enter choice (1-3): ", ('1', '2', '3'))
         
-        elif choice == '3':
+        if choice == '3':
             break
+        sys.stdout.write(GROUP_LISTINGS[choice])
         
         # Add option to view details
-        if choice in ['1', '2']:
-            ion = input("\nEnter ion to view details (or 'back'): ").strip()
-            if ion.lower() != 'back':
-                if ion in CATION_REACTIONS:
-                    print_reaction_explanation(ion, 'cation')
-                elif ion in ANION_REACTIONS:
-                    print_reaction_explanation(ion, 'anion')
-                else:
-                    print("Ion not found in any group.")
+        ion = input("\nEnter ion to view details (or 'back'): ").strip()
+        if ion.lower() != 'back':
+            if ('cation', ion) in ION_DETAILS:
+                print_reaction_explanation(ion, 'cation')
+            elif ('anion', ion) in ION_DETAILS:
+                print_reaction_explanation(ion, 'anion')
+            else:
+                print("Ion not found in any group.")
 # ... [keep all your existing utility functions below] ...
 
+CATION_ANALYSIS_GROUPS = (
+    ("Group I (HCl Group)", "I"),
+    ("Group II (H₂S Acidic Group)", "II"),
+    ("Group III (NH₄OH Group)", "III"),
+    ("Group IV (H₂S Basic Group)", "IV"),
+    ("Group V (Carbonate Group)", "V"),
+    ("Group VI (Soluble Group)", "VI")
+)
+
 def perform_full_cation_analysis():
     """Enhanced complete cation analysis flow"""
-    print("\n" + "="*50)
-    print("COMPLETE CATION ANALYSIS".center(50))
-    print("="*50)
+    print(_banner("COMPLETE CATION ANALYSIS"))
     
-    detected = []
-    groups = [
-        ("Group I (HCl Group)", test_group_i_cations),  # Changed to _cations
-        ("Group II (H₂S Acidic Group)", test_group_ii_cations),  # Changed to _cations
-        ("Group III (NH₄OH Group)", test_group_iii_cations),  # Changed to _cations
-        ("Group IV (H₂S Basic Group)", test_group_iv_cations),  # Changed to _cations
-        ("Group V (Carbonate Group)", test_group_v_cations),  # Changed to _cations
-        ("Group VI (Soluble Group)", test_group_vi_cations)  # Changed to _cations
-    ]
-    
-    for name, test_func in groups:
+    # ion -> (group, ion); an ion confirmed in two groups keeps the first
+    detected = {}
+    for name, group in CATION_ANALYSIS_GROUPS:
         print(f"\nStarting {name} Analysis...")
-        detected.extend(test_func())
+        for key in run_cation_flow(group):
+            detected.setdefault(key[1], key)
         print(f"\n{name} Analysis Complete.")
-        if input("Continue to next group? (y/n): ").lower() != 'y':
+        # There is nothing left to continue to after the last group
+        if name != CATION_ANALYSIS_GROUPS[-1][0] and input("Continue to next group? (y/n): ").lower() != 'y':
             break
     
-    show_detailed_results(detected, 'cation')
-    save_analysis_session(detected, 'cation')
+    show_detailed_results(list(detected.values()), 'cation')
+    save_analysis_session(list(detected.values()), 'cation')
+
+CATION_GROUP_CHOICES = {
+    '1': ("Group I (HCl Group: Pb²⁺, Ag⁺, Hg₂²⁺)", "I"),
+    '2': ("Group II (H₂S Acidic: Cu²⁺, Pb²⁺, Bi³⁺, As³⁺/⁵⁺)", "II"),
+    '3': ("Group III (NH₄OH: Fe³⁺, Al³⁺, Cr³⁺)", "III"),
+    '4': ("Group IV (H₂S Basic: Zn²⁺, Mn²⁺, Ni²⁺, Co²⁺)", "IV"),
+    '5': ("Group V (Carbonate: Ba²⁺, Sr²⁺, Ca²⁺)", "V"),
+    '6': ("Group VI (Soluble: NH₄⁺, Na⁺, K⁺, Mg²⁺)", "VI")
+}
+CATION_GROUP_MENU = "\nAvailable Cation Groups:\n" + "\n".join(
+    f"{num}. {name}" for num, (name, _) in CATION_GROUP_CHOICES.items())
 
 def analyze_specific_cation_group():
     """Enhanced specific cation group analysis"""
-    group_map = {
-        '1': ("Group I (HCl Group: Pb²⁺, Ag⁺, Hg₂²⁺)", test_group_i_cations),  # Changed to _cations
-        '2': ("Group II (H₂S Acidic: Cu²⁺, Pb²⁺, Bi³⁺, As³⁺/⁵⁺)", test_group_ii_cations),  # Changed to _cations
-        '3': ("Group III (NH₄OH: Fe³⁺, Al³⁺, Cr³⁺)", test_group_iii_cations),  # Changed to _cations
-        '4': ("Group IV (H₂S Basic: Zn²⁺, Mn²⁺, Ni²⁺, Co²⁺)", test_group_iv_cations),  # Changed to _cations
-        '5': ("Group V (Carbonate: Ba²⁺, Sr²⁺, Ca²⁺)", test_group_v_cations),  # Changed to _cations
-        '6': ("Group VI (Soluble: NH₄⁺, Na⁺, K⁺, Mg²⁺)", test_group_vi_cations)  # Changed to _cations
-    }
-    
-    print("\nAvailable Cation Groups:")
-    for num, (name, _) in group_map.items():
-        print(f"{num}. {name}")
+    print(CATION_GROUP_MENU)
     
     choice = get_user_input("\nSelect group to analyze (1-6) or '0' to cancel: ", 
-                          ['0', '1', '2', '3', '4', '5', '6'])
+                          ('0', '1', '2', '3', '4', '5', '6'))
     
     if choice != '0':
-        group_name, test_func = group_map[choice]
+        group_name, group = CATION_GROUP_CHOICES[choice]
         print(f"\nStarting {group_name} Analysis...")
-        detected = test_func()
+        detected = run_cation_flow(group)
         show_detailed_results(detected, 'cation')
         save_analysis_session(detected, 'cation')
 
+ANION_ANALYSIS_GROUPS = (
+    ("Group I (Dilute H₂SO₄ Group)", test_group_i_anions),
+    ("Group II (Conc. H₂SO₄ Group)", test_group_ii_anions),
+    ("Group III (Special Tests Group)", test_group_iii_anions)
+)
+
 def perform_full_anion_analysis():
     """Complete anion analysis flow"""
-    print("\n" + "="*50)
-    print("COMPLETE ANION ANALYSIS".center(50))
-    print("="*50)
-    
-    detected = []
-    groups = [
-        ("Group I (Dilute H₂SO₄ Group)", test_group_i_anions),
-        ("Group II (Conc. H₂SO₄ Group)", test_group_ii_anions),
-        ("Group III (Special Tests Group)", test_group_iii_anions)
-    ]
+    print(_banner("COMPLETE ANION ANALYSIS"))
     
-    for name, test_func in groups:
+    detected = {}
+    for name, test_func in ANION_ANALYSIS_GROUPS:
         print(f"\nStarting {name} Analysis...")
-        detected.extend(test_func())
+        detected.update(dict.fromkeys(test_func()))
         print(f"\n{name} Analysis Complete.")
-        if input("Continue to next group? (y/n): ").lower() != 'y':
+        # There is nothing left to continue to after the last group
+        if name != ANION_ANALYSIS_GROUPS[-1][0] and input("Continue to next group? (y/n): ").lower() != 'y':
             break
     
-    show_detailed_results(detected, 'anion')
-    save_analysis_session(detected, 'anion')
+    show_detailed_results(list(detected), 'anion')
+    save_analysis_session(list(detected), 'anion')
+
+ANION_GROUP_CHOICES = {
+    '1': ("Group I (Dilute H₂SO₄: CO₃²⁻, S²⁻, NO₂⁻, CH₃COO⁻)", test_group_i_anions),
+    '2': ("Group II (Conc. H₂SO₄: Cl⁻, Br⁻, I⁻, NO₃⁻)", test_group_ii_anions),
+    '3': ("Group III (Special Tests: SO₄²⁻, PO₄³⁻, BO₃³⁻)", test_group_iii_anions)
+}
+ANION_GROUP_MENU = "\nAvailable Anion Groups:\n" + "\n".join(
+    f"{num}. {name}" for num, (name, _) in ANION_GROUP_CHOICES.items())
 
 def analyze_specific_anion_group():
     """Enhanced specific anion group analysis"""
-    group_map = {
-        '1': ("Group I (Dilute H₂SO₄: CO₃²⁻, S²⁻, NO₂⁻, CH₃COO⁻)", test_group_i_anions),
-        '2': ("Group II (Conc. H₂SO₄: Cl⁻, Br⁻, I⁻, NO₃⁻)", test_group_ii_anions),
-        '3': ("Group III (Special Tests: SO₄²⁻, PO₄³⁻, BO₃³⁻)", test_group_iii_anions)
-    }
-    
-    print("\nAvailable Anion Groups:")
-    for num, (name, _) in group_map.items():
-        print(f"{num}. {name}")
+    print(ANION_GROUP_MENU)
     
     while True:
         choice = get_user_input("\nSelect group to analyze (1-3) or '0' to cancel: ", 
-                             ['0', '1', '2', '3'])
+                             ('0', '1', '2', '3'))
         
         if choice == '0':
             break
             
-        if choice in group_map:
-            group_name, test_func = group_map[choice]
+        if choice in ANION_GROUP_CHOICES:
+            group_name, test_func = ANION_GROUP_CHOICES[choice]
             print(f"\nStarting {group_name} Analysis...")
             detected = test_func()
             
             if detected:
-                print("\nDetected ions in this group:")
-                for ion in detected:
-                    print(f"- {ion}")
+                print("\nDetected ions in this group:\n" + "\n".join(f"- {ion}" for _, ion in detected))
                 
                 # Show details option
-                detail = get_user_input("\nView reaction details for these ions? (y/n): ", ['y', 'n'])
+                detail = get_user_input("\nView reaction details for these ions? (y/n): ", YN)
                 if detail == 'y':
-                    for ion in detected:
-                        print_reaction_explanation(ion, 'anion')
+                    sys.stdout.write("".join(EXPLANATIONS['anion', group, ion] for group, ion in detected))
                 
                 # Save option
-                save = get_user_input("Save these results? (y/n): ", ['y', 'n'])
+                save = get_user_input("Save these results? (y/n): ", YN)
                 if save == 'y':
                     save_analysis_session(detected, 'anion')
             else:
@@ -1158,122 +1053,154 @@ def analyze_specific_anion_group():
             
             break
 
+RESULTS_MENU = (
+    "\nResults Options:\n"
+    "1. 📝 View all reaction details\n"
+    "2. 🔍 View specific ion details\n"
+    "3. 📊 View analysis summary\n"
+    "4. 💾 Save results to file\n"
+    "5. 🏠 Return to previous menu"
+)
+
 def show_detailed_results(detected, ion_type):
-    """Enhanced results display with visualization"""
+    """Enhanced results display for a list of (group, ion) pairs"""
     if not detected:
         print(f"\nNo {ion_type}s detected.")
         return
     
-    unique_ions = sorted(set(detected))
-    print(f"\n📋 Detected {ion_type}s:")
-    for ion in unique_ions:
-        print(f"- {ion}")
+    # The producers already drop repeats, keeping the order of confirmation
+    ion_choices = (*(ion for _, ion in detected), 'back')
+    print(f"\n📋 Detected {ion_type}s:\n" + "\n".join(f"- {ion}" for _, ion in detected))
     
     while True:
-        print("\nResults Options:")
-        print("1. 📝 View all reaction details")
-        print("2. 🔍 View specific ion details")
-        print("3. 📊 View analysis summary")
-        print("4. 💾 Save results to file")
-        print("5. 🏠 Return to previous menu")
+        print(RESULTS_MENU)
         
-        choice = get_user_input("Select option (1-5): ", ['1', '2', '3', '4', '5'])
+        choice = get_user_input("Select option (1-5): ", ('1', '2', '3', '4', '5'))
         
         if choice == '1':
             print(f"\n=== DETAILED {ion_type.upper()} RESULTS ===")
-            for ion in unique_ions:
-                print_reaction_explanation(ion, ion_type)
+            sys.stdout.write("".join(EXPLANATIONS[ion_type, group, ion] for group, ion in detected))
         
         elif choice == '2':
-            ion = get_user_input(f"Enter {ion_type} to view (e.g., {unique_ions[0]}): ", 
-                               unique_ions + ['back'])
+            ion = get_user_input(f"Enter {ion_type} to view (e.g., {detected[0][1]}): ", 
+                               ion_choices)
             if ion != 'back':
-                print_reaction_explanation(ion, ion_type)
+                sys.stdout.write("".join(EXPLANATIONS[ion_type, group, name]
+                                         for group, name in detected if name == ion))
         
         elif choice == '3':
-            print("\n" + "="*50)
-            print(f"ANALYSIS SUMMARY: {len(unique_ions)} {ion_type.upper()}S DETECTED".center(50))
-            print("="*50)
-            for ion in unique_ions:
-                data = CATION_REACTIONS if ion_type == 'cation' else ANION_REACTIONS
-                print(f"\n🔬 {ion}: {data[ion]['test']}")
+            print(_banner(f"ANALYSIS SUMMARY: {len(detected)} {ion_type.upper()}S DETECTED"))
+            data = REACTIONS_BY_TYPE[ion_type]
+            sys.stdout.write("".join(f"\n🔬 {ion}: {data[group, ion]['test']}\n" for group, ion in detected))
         
         elif choice == '4':
             filename = input("Enter filename to save (e.g., results.txt): ").strip()
             if filename:
-                save_results_to_file(filename, unique_ions, ion_type)
+                save_results_to_file(filename, detected, ion_type)
                 print(f"✅ Results saved to {filename}")
         
         elif choice == '5':
             break
 
-def save_analysis_session(detected, ion_type):
-    """Save the current analysis session"""
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    filename = f"{ion_type}_analysis_{timestamp}.txt"
-    save_results_to_file(filename, list(set(detected)), ion_type)
-    print(f"\nSession automatically saved to {filename}")
-
 def view_previous_results(ion_type):
     """View previously saved analysis results"""
-    files = [f for f in os.listdir() if f.startswith(ion_type) and f.endswith('.txt')]
+    # Sorted once, newest first, so the numbers shown match the file opened
+    with os.scandir() as entries:
+        files = sorted((e.name for e in entries
+                        if e.is_file() and e.name.startswith(ion_type) and e.name.endswith('.txt')),
+                       reverse=True)
     
     if not files:
         print("\nNo previous results found.")
         return
     
     print("\nPrevious Analysis Sessions:")
-    for i, f in enumerate(sorted(files, reverse=True), 1):
-        print(f"{i}. {f}")
+    print("\n".join(f"{i}. {f}" for i, f in enumerate(files, 1)))
     
     choice = input("\nEnter file number to view (or 0 to cancel): ")
     if choice.isdigit() and 0 < int(choice) <= len(files):
-        with open(files[int(choice)-1]) as f:
-            print("\n" + f.read())
+        sys.stdout.write("\n")
+        with open(files[int(choice)-1], encoding='utf-8') as f:
+            shutil.copyfileobj(f, sys.stdout)
+        sys.stdout.write("\n")
+
+EXIT_MENU = _banner("EXIT PROGRAM") + (
+    "\n\nOptions:\n"
+    "1. ✅ Exit and save current session\n"
+    "2. ❌ Exit without saving\n"
+    "3. 🔙 Return to program"
+)
 
 def confirm_exit():
     """Enhanced exit confirmation"""
-    print("\n" + "="*50)
-    print("EXIT PROGRAM".center(50))
-    print("="*50)
-    print("\nOptions:")
-    print("1. ✅ Exit and save current session")
-    print("2. ❌ Exit without saving")
-    print("3. � Return to program")
+    print(EXIT_MENU)
     
-    choice = get_user_input("\nEnter your choice (1-3): ", ['1', '2', '3'])
+    choice = get_user_input("\nEnter your choice (1-3): ", ('1', '2', '3'))
     
     if choice == '1':
-        print("\nThank you for using the Qualitative Chemical Analysis System!")
-        print("All session data has been saved.")
+        print("\nThank you for using the Qualitative Chemical Analysis System!\n"
+              "All session data has been saved.")
         return True
     elif choice == '2':
         print("\nThank you for using the program. Goodbye!")
         return True
     return False
 
+# ======================
+# MENU ACTIONS
+# ======================
+
+# Menu choice -> handler; the "back"/"exit" choices are handled in the menus
+MAIN_MENU_ACTIONS = {
+    '1': cation_analysis_menu,
+    '2': anion_analysis_menu,
+    '3': reaction_database_menu,
+    '4': virtual_lab_assistant,
+    '5': show_program_info
+}
+
+CATION_MENU_ACTIONS = {
+    '1': perform_full_cation_analysis,
+    '2': analyze_specific_cation_group,
+    '3': lambda: view_previous_results('cation')
+}
+
+ANION_MENU_ACTIONS = {
+    '1': perform_full_anion_analysis,
+    '2': analyze_specific_anion_group,
+    '3': lambda: view_previous_results('anion')
+}
+
+DATABASE_MENU_ACTIONS = {
+    '1': search_ion_reactions,
+    '2': browse_all_reactions,
+    '3': view_group_reactions
+}
+
 # ======================
 # PROGRAM INITIALIZATION
 # ======================
 
+STARTUP_BANNER = _banner("QUALITATIVE CHEMICAL ANALYSIS SYSTEM") + "\n\nInitializing system components...\n"
+SAFETY_REMINDER = (
+    f"\n{'!' * 50}\n"
+    f"{'SAFETY FIRST!'.center(50)}\n"
+    f"{'!' * 50}\n"
+    "\nThis program assists with chemical analysis but\n"
+    "cannot replace proper lab safety procedures.\n"
+    "Always wear appropriate PPE when performing tests.\n"
+)
+
 if __name__ == "__main__":
-    print("\n" + "="*50)
-    print("QUALITATIVE CHEMICAL ANALYSIS SYSTEM".center(50))
-    print("="*50)
-    print("\nInitializing system components...")
+    sys.stdout.write(STARTUP_BANNER)
     
     # Check for required data files
-    if not os.path.exists('reactions.db'):
+    if not os.path.isfile('reactions.db'):
         print("⚠️  Warning: Reaction database not found!")
     
     # Display safety reminder
-    print("\n" + "!"*50)
-    print("SAFETY FIRST!".center(50))
-    print("!"*50)
-    print("\nThis program assists with chemical analysis but")
-    print("cannot replace proper lab safety procedures.")
-    print("Always wear appropriate PPE when performing tests.")
+    sys.stdout.write(SAFETY_REMINDER)
     
     # Start main menu
     input("\nPress Enter to continue to main menu...")
-    display_menu()
\ No newline at end of file
+    display_menu()